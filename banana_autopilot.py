@@ -5,6 +5,7 @@
 import os
 import sys
 import argparse
+import shutil
 import time
 from pathlib import Path
 from dotenv import load_dotenv
@@ -16,6 +17,7 @@ load_dotenv()
 # 모듈 임포트
 from src.script_generation.gpt_script import ScriptGenerator
 from src.tts.tts_generator import TTSGenerator
+from src.utils.text_splitter import split_sentences
 from src.video_generation.banana_video_creator import BananaVideoCreator
 
 
@@ -105,16 +107,17 @@ def main():
         
         script_generator = ScriptGenerator()
         
-        # 길이에 맞는 스크립트 생성 (한국어 평균 3.5자/초)
-        target_chars = int(target_duration * 3.5)
-        
+        # 목표 길이에 맞는 스크립트 생성 (글자 수 범위는 보정된 발화 속도로 계산, 범위 밖이면 자르거나 재생성)
         script_data = script_generator.generate_script(
             topic=args.topic,
-            target_length=target_chars
+            data={'topic': args.topic},
+            target_duration=target_duration
         )
+        if not script_data:
+            raise RuntimeError("스크립트 생성 실패")
         
         script_text = script_data['script']
-        logger.info(f"✅ 스크립트 생성 완료 ({len(script_text)}자)")
+        logger.info(f"✅ 스크립트 생성 완료 ({len(script_text)}자, 길이 상태: {script_data.get('length_status', 'ok')})")
         logger.info(f"📝 스크립트 미리보기: {script_text[:100]}...")
         
         # 2단계: TTS 음성 생성
@@ -126,10 +129,19 @@ def main():
         tts_generator = TTSGenerator()
         
         timestamp = int(time.time())
-        audio_path = f"data/audio/banana_narration_{timestamp}.mp3"
+        audio_path = f"data/audio/banana_narration_{timestamp}.{tts_generator.audio_format}"
         Path(audio_path).parent.mkdir(parents=True, exist_ok=True)
         
-        tts_generator.generate_audio(script_text, audio_path)
+        # 긴 나레이션은 문장 단위로 동시 합성 후 이어 붙임
+        segment_dir = f"data/audio/banana_segments_{timestamp}"
+        segments = tts_generator.generate_with_timing(
+            [{'text': sentence} for sentence in split_sentences(script_text)],
+            output_dir=segment_dir,
+            output_path=audio_path
+        )
+        shutil.rmtree(segment_dir, ignore_errors=True)
+        if not segments or not Path(audio_path).exists():
+            raise RuntimeError("TTS 생성 실패")
         
         audio_size = os.path.getsize(audio_path) / 1024  # KB
         logger.info(f"✅ TTS 생성 완료: {audio_path} ({audio_size:.1f} KB)")
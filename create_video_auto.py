@@ -15,6 +15,17 @@ load_dotenv()
 
 # 모듈 임포트
 from src.tts.tts_generator import TTSGenerator
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+# 장면 키워드 매핑 (등록 순서가 우선순위)
+SCENE_KEYWORDS = {
+    '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow',
+    '코스피': 'Korean stock market KOSPI index chart trending up',
+    '주식': 'stock market trading floor with digital screens',
+    '투자': 'investment portfolio dashboard with graphs',
+}
+SCENE_MATCHER = KeywordMatcher(SCENE_KEYWORDS)
 
 
 def generate_complete_video(topic: str, duration: int = 20):
@@ -76,18 +87,10 @@ def generate_complete_video(topic: str, duration: int = 20):
         scenes = []
         for i, sentence in enumerate(sentences):
             # 키워드 매칭
-            keywords = {
-                '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow',
-                '코스피': 'Korean stock market KOSPI index chart trending up',
-                '주식': 'stock market trading floor with digital screens',
-                '투자': 'investment portfolio dashboard with graphs',
-            }
-            
             prompt = "professional financial news background"
-            for keyword, desc in keywords.items():
-                if keyword in sentence:
-                    prompt = desc
-                    break
+            keyword = SCENE_MATCHER.first_match(sentence)
+            if keyword:
+                prompt = SCENE_KEYWORDS[keyword]
             
             scene = {
                 'index': i,
@@ -15,6 +15,23 @@ load_dotenv()
 
 # 모듈 임포트
 from src.tts.tts_generator import TTSGenerator
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+# 장면 설명 키워드 매핑 (등록 순서가 우선순위)
+KEYWORDS_MAP = {
+    '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow, professional financial news background',
+    '주식': 'stock market trading floor with digital screens, modern business atmosphere',
+    '경제': 'modern financial district skyline, professional business setting',
+    '투자': 'investment portfolio dashboard with graphs and charts',
+    '급등': 'dramatic rising green chart with upward arrow, bullish market',
+    '급락': 'falling red chart with downward trend, bearish market',
+    '환율': 'currency exchange rates display board, forex market',
+    '금리': 'interest rate graph trending upward, financial indicators',
+    '시장': 'bustling stock exchange trading floor, busy trading day',
+    '기업': 'modern corporate office building exterior, business skyline',
+}
+KEYWORDS_MATCHER = KeywordMatcher(KEYWORDS_MAP)
 
 
 def generate_scenes_with_genspark(topic: str, script_text: str, num_scenes: int = 4):
@@ -28,28 +45,13 @@ def generate_scenes_with_genspark(topic: str, script_text: str, num_scenes: int
     # 스크립트를 장면별로 분할
     sentences = [s.strip() for s in script_text.split('.') if s.strip()]
     
-    # 장면 설명 키워드 매핑
-    keywords_map = {
-        '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow, professional financial news background',
-        '주식': 'stock market trading floor with digital screens, modern business atmosphere',
-        '경제': 'modern financial district skyline, professional business setting',
-        '투자': 'investment portfolio dashboard with graphs and charts',
-        '급등': 'dramatic rising green chart with upward arrow, bullish market',
-        '급락': 'falling red chart with downward trend, bearish market',
-        '환율': 'currency exchange rates display board, forex market',
-        '금리': 'interest rate graph trending upward, financial indicators',
-        '시장': 'bustling stock exchange trading floor, busy trading day',
-        '기업': 'modern corporate office building exterior, business skyline',
-    }
-    
     for i, sentence in enumerate(sentences[:num_scenes]):
         # 키워드 매칭
         prompt = f"Professional economic news video scene for: {sentence}. Modern, clean, business aesthetic."
         
-        for keyword, description in keywords_map.items():
-            if keyword in sentence:
-                prompt = description
-                break
+        keyword = KEYWORDS_MATCHER.first_match(sentence)
+        if keyword:
+            prompt = KEYWORDS_MAP[keyword]
         
         scenes.append({
             'index': i,
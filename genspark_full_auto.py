@@ -14,11 +14,9 @@ sys.path.insert(0, '/home/user/webapp')
 
 
 def download_file(url: str, output_path: str):
-    """URL에서 파일 다운로드"""
-    import requests
-    response = requests.get(url)
-    with open(output_path, 'wb') as f:
-        f.write(response.content)
+    """URL에서 파일 다운로드 (공유 세션으로 디스크에 스트리밍 저장)"""
+    from src.utils.http_client import get_http_client
+    get_http_client().download(url, output_path)
     logger.info(f"✅ 다운로드 완료: {output_path}")
 
 
@@ -15,7 +15,8 @@ import json
 from src.data_collection.news_scraper import NewsScraper
 from src.data_collection.stock_api import StockDataCollector
 from src.script_generation.gpt_script import ScriptGenerator
-from src.tts.tts_generator import TTSGenerator
+from src.tts.audio_utils import get_audio_duration
+from src.tts.tts_generator import MIXED_PROVIDER, TTSGenerator
 from src.video_generation.video_creator import VideoCreator
 from src.youtube_upload.uploader import YouTubeUploader
 
@@ -35,8 +36,8 @@ class EconomicShortsAutomation:
         self._setup_logging()
         
         # 모듈 초기화
-        self.news_scraper = NewsScraper()
-        self.stock_collector = StockDataCollector()
+        self.news_scraper = NewsScraper(config_path)
+        self.stock_collector = StockDataCollector(config_path)
         self.script_generator = ScriptGenerator(config_path)
         self.tts_generator = TTSGenerator(config_path)
         self.video_creator = VideoCreator(config_path)
@@ -69,6 +70,11 @@ class EconomicShortsAutomation:
         # 뉴스 수집
         news = self.news_scraper.fetch_all_news()
         filtered_news = self.news_scraper.filter_economic_news(news)
+        # 트렌드는 중복 제거 전에 반영 (여러 매체가 다룬 이슈일수록 강한 신호)
+        trending = self.news_scraper.update_trending(filtered_news)
+        filtered_news = self.news_scraper.remove_duplicates(filtered_news)
+        filtered_news = self.news_scraper.rank_by_trend(filtered_news)
+        filtered_news = self.news_scraper.fetch_article_bodies(filtered_news)
         
         # 주식/시장 데이터 수집
         market_summary = self.stock_collector.get_market_summary()
@@ -89,17 +95,13 @@ class EconomicShortsAutomation:
         
         return {
             'news': filtered_news,
+            'trending': trending,
             'market_summary': market_summary,
             'stories': stories
         }
     
-    def generate_content(self, data: dict) -> list:
-        """콘텐츠 생성 단계"""
-        logger.info("=" * 60)
-        logger.info("2단계: 스크립트 생성 시작")
-        logger.info("=" * 60)
-        
-        # 스크립트 생성을 위한 주제 선정
+    def select_topics(self, data: dict) -> list:
+        """스크립트 생성을 위한 주제 선정 (시장 이슈 → 주요 뉴스 순)"""
         topics_data = []
         
         # 1. 시장 이슈 기반
@@ -109,16 +111,27 @@ class EconomicShortsAutomation:
                 'data': story
             })
         
-        # 2. 주요 뉴스 기반
-        for news in data['news'][:2]:  # 상위 2개
+        # 2. 주요 뉴스 기반 (제작 완료 후 중복 인덱스에 기록)
+        data['selected_news'] = data['news'][:2]  # 상위 2개
+        for news in data['selected_news']:
             topics_data.append({
                 'topic': news['title'],
                 'data': {
                     'source': news['source'],
-                    'content': news['summary']
+                    'content': news.get('body') or news['summary']
                 }
             })
         
+        return topics_data
+    
+    def generate_content(self, data: dict) -> list:
+        """콘텐츠 생성 단계"""
+        logger.info("=" * 60)
+        logger.info("2단계: 스크립트 생성 시작")
+        logger.info("=" * 60)
+        
+        topics_data = self.select_topics(data)
+        
         # 스크립트 생성
         scripts = self.script_generator.generate_multiple_scripts(topics_data, count=3)
         
@@ -148,48 +161,22 @@ class EconomicShortsAutomation:
             
             try:
                 # 1. TTS 생성
-                audio_path = f"data/audio/{timestamp}_{i:02d}.mp3"
+                audio_path = f"data/audio/{timestamp}_{i:02d}.{self.tts_generator.audio_format}"
                 logger.info("  → TTS 생성 중...")
                 
-                if not self.tts_generator.generate_audio(script['script'], audio_path):
+                tts_provider = self.tts_generator.synthesize_audio(script['script'], audio_path)
+                if not tts_provider:
                     logger.error(f"  ✗ TTS 생성 실패")
                     continue
                 
                 logger.info(f"  ✓ TTS 완료: {audio_path}")
+                self._record_speech(script['script'], audio_path, tts_provider)
                 
-                # 2. 비디오 생성
-                video_path = f"data/videos/{timestamp}_{i:02d}_shorts.mp4"
-                logger.info("  → 비디오 생성 중...")
-                
-                if not self.video_creator.create_shorts_video(
-                    audio_path=audio_path,
-                    script_text=script['script'],
-                    output_path=video_path,
-                    title_text=script.get('hook', '')
-                ):
-                    logger.error(f"  ✗ 비디오 생성 실패")
+                video = self._render_video(script, audio_path, f"{timestamp}_{i:02d}")
+                if not video:
                     continue
                 
-                logger.info(f"  ✓ 비디오 완료: {video_path}")
-                
-                # 3. 썸네일 생성
-                thumbnail_path = f"data/videos/{timestamp}_{i:02d}_thumbnail.jpg"
-                logger.info("  → 썸네일 생성 중...")
-                
-                self.video_creator.create_thumbnail(
-                    script.get('thumbnail_text', script['title'][:15]),
-                    thumbnail_path
-                )
-                
-                logger.info(f"  ✓ 썸네일 완료: {thumbnail_path}")
-                
-                produced_videos.append({
-                    'script': script,
-                    'video_path': video_path,
-                    'audio_path': audio_path,
-                    'thumbnail_path': thumbnail_path
-                })
-                
+                produced_videos.append(video)
                 logger.info(f"✅ 비디오 {i} 제작 완료!\n")
                 
             except Exception as e:
@@ -199,6 +186,99 @@ class EconomicShortsAutomation:
         logger.info(f"총 {len(produced_videos)}개 비디오 제작 완료")
         return produced_videos
     
+    def _render_video(self, script: dict, audio_path: str, name: str):
+        """TTS가 끝난 스크립트로 비디오와 썸네일 제작 (실패 시 None)"""
+        # 2. 비디오 생성
+        video_path = f"data/videos/{name}_shorts.mp4"
+        logger.info("  → 비디오 생성 중...")
+        
+        if not self.video_creator.create_shorts_video(
+            audio_path=audio_path,
+            script_text=script['script'],
+            output_path=video_path,
+            title_text=script.get('hook', '')
+        ):
+            logger.error(f"  ✗ 비디오 생성 실패")
+            return None
+        
+        logger.info(f"  ✓ 비디오 완료: {video_path}")
+        
+        # 3. 썸네일 생성
+        thumbnail_path = f"data/videos/{name}_thumbnail.jpg"
+        logger.info("  → 썸네일 생성 중...")
+        
+        self.video_creator.create_thumbnail(
+            script.get('thumbnail_text', script['title'][:15]),
+            thumbnail_path
+        )
+        
+        logger.info(f"  ✓ 썸네일 완료: {thumbnail_path}")
+        
+        return {
+            'script': script,
+            'video_path': video_path,
+            'audio_path': audio_path,
+            'thumbnail_path': thumbnail_path
+        }
+    
+    def produce_streaming_video(self, topic_data: dict):
+        """
+        스크립트 스트리밍 생성과 TTS를 겹쳐서 비디오 1개 제작 (속보용)
+        
+        LLM이 문장을 내보내는 즉시 TTS를 시작하므로, 스크립트 생성 완료를
+        기다린 뒤 TTS를 시작하는 produce_videos보다 지연이 짧습니다.
+        """
+        logger.info("=" * 60)
+        logger.info("스트리밍 제작: 스크립트 생성 + TTS 동시 진행")
+        logger.info("=" * 60)
+        
+        name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_01"
+        audio_path = f"data/audio/{name}.{self.tts_generator.audio_format}"
+        
+        session = self.tts_generator.start_stream(audio_path, self.config['tts'].get('stream_provider'))
+        script = self.script_generator.stream_script(
+            topic_data['topic'],
+            topic_data['data'],
+            on_sentence=session.feed
+        )
+        
+        if not script:
+            session.cancel()
+            logger.error("스트리밍 스크립트 생성 실패")
+            return None
+        
+        script['source_data'] = topic_data
+        
+        if not session.finish():
+            logger.error(f"  ✗ TTS 생성 실패")
+            return None
+        
+        logger.info(f"  ✓ TTS 완료: {audio_path}")
+        self._record_speech(script['script'], audio_path, session.provider_used)
+        return self._render_video(script, audio_path, name)
+    
+    def _record_speech(self, text: str, audio_path: str, provider: str):
+        """
+        합성된 오디오 길이로 스크립트 생성기의 발화 속도 모델 보정
+        
+        실제로 합성한 제공자 기준으로 기록하며, 여러 제공자가 섞인 오디오는 건너뜁니다.
+        """
+        if not provider or provider == MIXED_PROVIDER:
+            return
+        try:
+            self.script_generator.record_speech(text, get_audio_duration(audio_path), provider=provider)
+        except Exception as e:
+            logger.warning(f"발화 속도 기록 실패: {e}")
+    
+    def _mark_news_covered(self, data: dict, videos: list):
+        """제작된 비디오의 원본 주제와 일치하는 선정 뉴스만 중복 인덱스에 기록"""
+        produced_topics = {
+            video['script'].get('source_data', {}).get('topic') for video in videos
+        }
+        self.news_scraper.mark_covered(
+            [news for news in data.get('selected_news', []) if news['title'] in produced_topics]
+        )
+    
     def upload_videos(self, videos: list) -> list:
         """유튜브 업로드 단계"""
         logger.info("=" * 60)
@@ -258,6 +338,9 @@ class EconomicShortsAutomation:
                 logger.error("제작된 비디오가 없습니다")
                 return
             
+            # 실제로 비디오가 제작된 뉴스만 다음 실행에서 다시 다루지 않도록 기록
+            self._mark_news_covered(data, videos)
+            
             # 4. 유튜브 업로드
             uploaded = self.upload_videos(videos)
             
@@ -278,6 +361,30 @@ class EconomicShortsAutomation:
             logger.error(f"자동화 실행 중 오류 발생: {e}")
             raise
     
+    def run_breaking(self):
+        """속보 모드 - 최우선 주제 1개를 스트리밍 파이프라인으로 빠르게 제작"""
+        logger.info("\n⚡ 경제 Shorts 자동화 시작 (속보 모드)\n")
+        
+        data = self.collect_data()
+        topics_data = self.select_topics(data)
+        
+        if not topics_data:
+            logger.error("제작할 주제가 없습니다")
+            return
+        
+        topic_data = topics_data[0]
+        video = self.produce_streaming_video(topic_data)
+        
+        if not video:
+            logger.error("제작된 비디오가 없습니다")
+            return
+        
+        # 뉴스 기반 주제였다면 다시 다루지 않도록 기록
+        self._mark_news_covered(data, [video])
+        
+        uploaded = self.upload_videos([video])
+        logger.info(f"✅ 속보 비디오 제작 완료 (업로드 {len(uploaded)}개)")
+    
     def run_scheduler(self, mode='hourly', interval=2):
         """스케줄러 모드"""
         logger.info(f"\n⏰ 스케줄러 시작 (모드: {mode}, 간격: {interval})")
@@ -306,8 +413,8 @@ class EconomicShortsAutomation:
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='경제 유튜브 Shorts 자동화 시스템')
-    parser.add_argument('--mode', choices=['single', 'auto'], default='single',
-                       help='실행 모드 (single: 1회 실행, auto: 자동 스케줄)')
+    parser.add_argument('--mode', choices=['single', 'auto', 'breaking'], default='single',
+                       help='실행 모드 (single: 1회 실행, auto: 자동 스케줄, breaking: 속보 1개 빠른 제작)')
     parser.add_argument('--interval', type=int, default=2,
                        help='자동 실행 간격 (시간, 기본값: 2)')
     parser.add_argument('--config', default='config/config.yaml',
@@ -349,6 +456,8 @@ def main():
     # 실행
     if args.mode == 'single':
         automation.run_single()
+    elif args.mode == 'breaking':
+        automation.run_breaking()
     else:
         automation.run_scheduler(mode='hourly', interval=args.interval)
 
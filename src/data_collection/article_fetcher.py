@@ -0,0 +1,154 @@
+"""
+기사 본문 수집 모듈 - 연결을 재사용하는 제한된 워커 풀로 기사 페이지를 받아 본문 추출
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from src.utils.http_client import HttpClient, get_http_client
+from src.utils.rate_limiter import HostRateLimiter
+
+
+# 주요 언론사 CMS의 본문 컨테이너 (앞에 있을수록 우선)
+BODY_SELECTORS = [
+    '[itemprop="articleBody"]',
+    '#article-view-content-div',  # 연합인포맥스 등 ndsoft 계열
+    '#articletxt',  # 한국경제
+    '.news_cnt_detail_wrap',  # 매일경제
+    '.article_view',  # 서울경제
+    '#articleBody',
+    '.article-body',
+    '.story-news',  # 연합뉴스
+    'article',
+]
+
+# 본문과 무관한 요소
+NOISE_TAGS = ['script', 'style', 'noscript', 'iframe', 'header', 'footer', 'nav', 'aside', 'form', 'figure']
+
+
+def extract_article_text(html: str, min_chars: int = 200) -> str:
+    """
+    기사 HTML에서 본문 텍스트 추출
+    
+    알려진 본문 컨테이너를 먼저 찾고, 없으면 <p> 텍스트가 가장 많은 요소를 본문으로 봅니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+    
+    for selector in BODY_SELECTORS:
+        node = soup.select_one(selector)
+        if node:
+            text = node.get_text(' ', strip=True)
+            if len(text) >= min_chars:
+                return text
+    
+    # 대체: 문단 텍스트 길이 합이 가장 큰 부모 요소
+    scores: Dict[int, int] = {}
+    parents = {}
+    for paragraph in soup.find_all('p'):
+        parent = paragraph.parent
+        if parent is None:
+            continue
+        scores[id(parent)] = scores.get(id(parent), 0) + len(paragraph.get_text(strip=True))
+        parents[id(parent)] = parent
+    
+    if not scores:
+        return ''
+    
+    best = parents[max(scores, key=scores.get)]
+    return ' '.join(p.get_text(' ', strip=True) for p in best.find_all('p'))
+
+
+class ArticleFetcher:
+    """기사 본문을 동시에 수집하는 페처 (호스트별 간격 제한, 전체 제한 시간)"""
+    
+    def __init__(
+        self,
+        max_workers: int = 4,
+        timeout: float = 10,
+        total_timeout: float = 60,
+        host_interval: float = 0.5,
+        max_chars: int = 4000,
+        headers: Optional[Dict] = None,
+        http_client: Optional[HttpClient] = None
+    ):
+        """
+        Args:
+            max_workers: 동시 다운로드 워커 수
+            timeout: 기사당 타임아웃 (초)
+            total_timeout: 전체 수집 제한 시간 (초)
+            host_interval: 같은 호스트 요청 간 최소 간격 (초)
+            max_chars: 저장할 본문 최대 길이
+            headers: 요청 헤더
+            http_client: 사용할 HTTP 클라이언트 (기본: 공유 클라이언트)
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+        self.max_chars = max_chars
+        self.headers = headers or {}
+        self.rate_limiter = HostRateLimiter(host_interval)
+        
+        # 공유 세션으로 keep-alive 연결 재사용
+        self.http = http_client or get_http_client()
+    
+    def fetch_article(self, url: str) -> Optional[str]:
+        """기사 한 건의 본문 추출 (실패 시 None)"""
+        try:
+            self.rate_limiter.wait(url)
+            response = self.http.get(url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            
+            # 인코딩 헤더가 없는 국내 사이트(EUC-KR 등) 대비
+            if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+                response.encoding = response.apparent_encoding
+            
+            text = extract_article_text(response.text)
+            return text[:self.max_chars] if text else None
+        
+        except Exception as e:
+            logger.warning(f"기사 본문 수집 실패 ({url}): {e}")
+            return None
+    
+    def fetch_bodies(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        뉴스 리스트의 기사 본문을 동시에 수집해 'body' 필드에 추가
+        
+        본문을 받지 못한 뉴스는 'body' 없이 그대로 반환됩니다.
+        
+        Returns:
+            입력과 같은 순서의 뉴스 리스트
+        """
+        targets = [news for news in news_list if news.get('link') and not news.get('body')]
+        if not targets:
+            return news_list
+        
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(targets))),
+            thread_name_prefix='article'
+        )
+        
+        try:
+            futures = {executor.submit(self.fetch_article, news['link']): news for news in targets}
+            done, not_done = wait(futures, timeout=self.total_timeout)
+            
+            fetched = 0
+            for future in done:
+                body = future.result()
+                if body:
+                    futures[future]['body'] = body
+                    fetched += 1
+            
+            if not_done:
+                logger.warning(f"기사 본문 {len(not_done)}건 제한 시간 초과로 제외")
+            
+            elapsed = time.monotonic() - start
+            logger.info(f"기사 본문 {fetched}/{len(targets)}건 수집 완료 ({elapsed:.1f}초)")
+            return news_list
+        
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,242 @@
+"""
+뉴스 중복 제거 인덱스 - 정규화 URL + SimHash 근사 중복 탐지 (실행 간 유지)
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from loguru import logger
+
+
+# URL에서 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'from', 'cmpid'}
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL을 하나의 키로 정규화
+    
+    스킴/www 차이, 프래그먼트, 추적 파라미터(utm_* 등), 쿼리 순서, 끝 슬래시를 무시합니다.
+    """
+    if not url:
+        return ''
+    
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+    
+    return urlunsplit(('', host, path, urlencode(query), ''))
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """
+    문자 3-gram 기반 SimHash
+    
+    한국어 기사 제목은 조사/어미 변화가 많아 단어 대신 문자 n-gram을 사용합니다.
+    """
+    normalized = NON_WORD_PATTERN.sub('', HTML_TAG_PATTERN.sub(' ', text).lower())
+    if not normalized:
+        return 0
+    
+    shingles = [normalized[i:i + 3] for i in range(max(1, len(normalized) - 2))]
+    weights = [0] * bits
+    
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.md5(shingle.encode('utf-8')).digest()[:bits // 8], 'big')
+        for bit in range(bits):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+class NewsDedupIndex:
+    """
+    이미 다룬 뉴스를 기억하는 영속 인덱스
+    
+    정규화 URL이 같으면 동일 기사, 제목+요약 SimHash의 해밍 거리가 max_distance
+    이하이면 근사 중복으로 판단합니다. 지문을 (max_distance + 1)개 대역으로 나눠
+    버킷에 넣어 두므로 전체 항목과 비교하지 않고 후보만 확인합니다
+    (거리가 max_distance 이하면 적어도 한 대역은 반드시 일치).
+    """
+    
+    BITS = 64
+    
+    def __init__(
+        self,
+        index_path: str = 'data/cache/news_dedup.json',
+        ttl_hours: float = 72,
+        max_distance: int = 3
+    ):
+        """
+        Args:
+            index_path: 인덱스 파일 경로
+            ttl_hours: 항목 보관 기간 (시간) - 지나면 다시 다룰 수 있음
+            max_distance: 근사 중복으로 볼 최대 해밍 거리
+        """
+        self.index_path = Path(index_path)
+        self.ttl = ttl_hours * 3600
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = self.BITS // self.bands
+        
+        self._entries: Dict[str, Dict] = {}
+        self._buckets: Dict[Tuple[int, int], Set[str]] = {}
+        
+        self._load()
+    
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        """지문을 대역별 버킷 키로 분할"""
+        mask = (1 << self.band_bits) - 1
+        return [(i, fingerprint >> (i * self.band_bits) & mask) for i in range(self.bands)]
+    
+    def _add(self, key: str, entry: Dict, entries: Dict = None, buckets: Dict = None):
+        """인덱스에 항목 추가 (entries/buckets를 주면 해당 임시 인덱스에 추가)"""
+        entries = self._entries if entries is None else entries
+        buckets = self._buckets if buckets is None else buckets
+        
+        entries[key] = entry
+        for band in self._band_keys(entry['simhash']):
+            buckets.setdefault(band, set()).add(key)
+    
+    def _load(self):
+        """디스크에서 인덱스 로드 (만료 항목 제외)"""
+        if not self.index_path.exists():
+            return
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"뉴스 중복 인덱스 로드 실패, 새로 시작: {e}")
+            return
+        
+        cutoff = time.time() - self.ttl
+        for key, entry in entries.items():
+            if entry['seen_at'] >= cutoff:
+                self._add(key, entry)
+    
+    def save(self):
+        """만료 항목을 정리하고 디스크에 저장"""
+        cutoff = time.time() - self.ttl
+        entries = {key: e for key, e in self._entries.items() if e['seen_at'] >= cutoff}
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+    
+    @staticmethod
+    def _fingerprint(news: Dict) -> int:
+        """제목 + 요약 지문"""
+        return simhash(news.get('title', '') + ' ' + news.get('summary', ''))
+    
+    def _lookup(self, url_key: str, fingerprint: int, entries: Dict, buckets: Dict) -> Optional[Dict]:
+        """주어진 인덱스에서 URL 일치 또는 근사 중복 항목 찾기"""
+        cutoff = time.time() - self.ttl
+        
+        entry = entries.get(url_key)
+        if url_key and entry and entry['seen_at'] >= cutoff:
+            return entry
+        
+        if not fingerprint:
+            return None
+        
+        candidates = set()
+        for band in self._band_keys(fingerprint):
+            candidates |= buckets.get(band, set())
+        
+        for key in candidates:
+            entry = entries[key]
+            if entry['seen_at'] >= cutoff and \
+                    hamming_distance(entry['simhash'], fingerprint) <= self.max_distance:
+                return entry
+        
+        return None
+    
+    def find_duplicate(self, news: Dict) -> Optional[Dict]:
+        """
+        인덱스에서 같은 기사 또는 근사 중복 기사 찾기
+        
+        Returns:
+            일치한 인덱스 항목 (없으면 None)
+        """
+        return self._lookup(
+            normalize_url(news.get('link', '')),
+            self._fingerprint(news),
+            self._entries,
+            self._buckets
+        )
+    
+    def filter_new(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        이미 다룬 뉴스와 목록 안의 중복을 제거 (인덱스는 변경하지 않음)
+        
+        Returns:
+            처음 등장한 뉴스만 남긴 리스트 (입력 순서 유지)
+        """
+        # 목록 안의 중복 판정용 임시 인덱스
+        batch_entries: Dict[str, Dict] = {}
+        batch_buckets: Dict[Tuple[int, int], Set[str]] = {}
+        
+        fresh = []
+        for news in news_list:
+            key, entry = self._make_entry(news)
+            url_key = normalize_url(news.get('link', ''))
+            
+            duplicate = (
+                self._lookup(url_key, entry['simhash'], self._entries, self._buckets)
+                or self._lookup(url_key, entry['simhash'], batch_entries, batch_buckets)
+            )
+            if duplicate:
+                logger.debug(f"중복 뉴스 제외: {news.get('title', '')} (기존: {duplicate['title']})")
+                continue
+            
+            fresh.append(news)
+            self._add(key, entry, batch_entries, batch_buckets)
+        
+        logger.info(f"{len(news_list)}개 중 {len(news_list) - len(fresh)}개 중복 뉴스 제외")
+        return fresh
+    
+    def _make_entry(self, news: Dict) -> Tuple[str, Dict]:
+        """뉴스를 인덱스 (키, 항목)으로 변환"""
+        fingerprint = self._fingerprint(news)
+        key = normalize_url(news.get('link', '')) or f"simhash:{fingerprint:016x}"
+        return key, {
+            'title': news.get('title', ''),
+            'simhash': fingerprint,
+            'seen_at': time.time()
+        }
+    
+    def mark_seen(self, news_list: List[Dict]):
+        """뉴스를 다룬 것으로 기록하고 저장"""
+        for news in news_list:
+            self._add(*self._make_entry(news))
+        
+        try:
+            self.save()
+        except Exception as e:
+            logger.warning(f"뉴스 중복 인덱스 저장 실패: {e}")
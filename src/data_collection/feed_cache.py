@@ -0,0 +1,86 @@
+"""
+RSS 피드 조건부 요청(ETag / Last-Modified) 캐시 모듈
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+
+
+class FeedCache:
+    """피드 URL별 검증자(ETag, Last-Modified)와 마지막 항목을 디스크에 보관하는 캐시"""
+    
+    def __init__(self, cache_path: str = 'data/cache/feeds.json'):
+        self.cache_path = Path(cache_path)
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, Dict] = self._load()
+    
+    def _load(self) -> Dict[str, Dict]:
+        """디스크에서 캐시 로드 (손상된 파일은 무시)"""
+        if not self.cache_path.exists():
+            return {}
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"피드 캐시 로드 실패, 새로 시작: {e}")
+            return {}
+    
+    def _save(self):
+        """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 캐시가 깨지지 않도록)"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._feeds, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """조건부 GET 요청 헤더 생성"""
+        with self._lock:
+            cached = self._feeds.get(url)
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+        return headers
+    
+    def get_entries(self, url: str) -> Optional[List[Dict]]:
+        """캐시된 피드 항목 조회 (없으면 None)"""
+        with self._lock:
+            cached = self._feeds.get(url)
+        return list(cached['entries']) if cached else None
+    
+    def update(self, url: str, entries: List[Dict], etag: Optional[str], modified: Optional[str]):
+        """
+        새로 받은 피드 항목과 검증자 저장
+        
+        Args:
+            url: 피드 URL
+            entries: 파싱된 피드 항목
+            etag: 응답의 ETag 헤더
+            modified: 응답의 Last-Modified 헤더
+        """
+        with self._lock:
+            if not etag and not modified:
+                # 검증자가 없으면 조건부 요청이 불가능하므로 저장하지 않음
+                self._feeds.pop(url, None)
+            else:
+                self._feeds[url] = {
+                    'etag': etag,
+                    'modified': modified,
+                    'entries': entries,
+                    'updated_at': datetime.now().isoformat()
+                }
+            
+            try:
+                self._save()
+            except Exception as e:
+                logger.warning(f"피드 캐시 저장 실패: {e}")
@@ -0,0 +1,240 @@
+"""
+벡터화 기술적 지표 엔진 - (종목 × 시간) 종가 행렬을 한 번에 계산
+"""
+from typing import Dict, List, Optional
+import numpy as np
+
+
+# 추세 라벨 (analyze_trend와 동일한 분류)
+TREND_STRONG_UP = '강한 상승세'
+TREND_UP = '상승세'
+TREND_STRONG_DOWN = '강한 하락세'
+TREND_DOWN = '하락세'
+
+
+def forward_fill(closes: np.ndarray) -> np.ndarray:
+    """
+    행(종목)별로 NaN을 직전 유효값으로 채움
+    
+    시장마다 휴장일이 달라 생기는 결측 봉을 메우기 위한 것으로,
+    첫 유효값 이전의 NaN은 그대로 둡니다.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    valid = ~np.isnan(closes)
+    index = np.where(valid, np.arange(closes.shape[1]), 0)
+    np.maximum.accumulate(index, axis=1, out=index)
+    filled = closes[np.arange(closes.shape[0])[:, None], index]
+    # 첫 유효값 이전 구간 복원
+    filled[np.cumsum(valid, axis=1) == 0] = np.nan
+    return filled
+
+
+def count_valid(closes: np.ndarray) -> np.ndarray:
+    """종목별 유효 봉 개수"""
+    return (~np.isnan(closes)).sum(axis=1)
+
+
+def last_valid(closes: np.ndarray) -> np.ndarray:
+    """종목별 마지막 유효 종가"""
+    return forward_fill(closes)[:, -1]
+
+
+def first_valid(closes: np.ndarray) -> np.ndarray:
+    """종목별 첫 유효 종가"""
+    closes = np.asarray(closes, dtype=np.float64)
+    valid = ~np.isnan(closes)
+    first = valid.argmax(axis=1)
+    result = closes[np.arange(closes.shape[0]), first]
+    result[~valid.any(axis=1)] = np.nan
+    return result
+
+
+def compact(closes: np.ndarray) -> np.ndarray:
+    """
+    종목별 유효 봉을 오른쪽으로 정렬 (결측 봉 제거, 앞쪽은 NaN 패딩)
+    
+    이동평균처럼 "최근 N개 봉"이 필요한 지표를 거래일 기준으로 계산하기 위해 사용합니다.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    valid = ~np.isnan(closes)
+    # 유효 봉을 뒤로 보내는 안정 정렬
+    order = np.argsort(valid, axis=1, kind='stable')
+    return np.take_along_axis(closes, order, axis=1)
+
+
+def moving_average(closes: np.ndarray, window) -> np.ndarray:
+    """
+    종목별 최근 window개 봉의 단순 이동평균 (마지막 시점)
+    
+    Args:
+        closes: (종목, 시간) 종가 행렬
+        window: 윈도우 크기 (int 또는 종목별 배열)
+    
+    Returns:
+        (종목,) 배열 - 유효 봉이 window보다 적으면 NaN
+    """
+    packed = compact(closes)
+    n_symbols, n_times = packed.shape
+    window = np.broadcast_to(np.asarray(window, dtype=np.int64), (n_symbols,))
+    
+    # 누적합으로 임의 윈도우 합을 O(1)에 계산
+    csum = np.concatenate([np.zeros((n_symbols, 1)), np.nancumsum(packed, axis=1)], axis=1)
+    start = np.clip(n_times - window, 0, n_times)
+    sums = csum[:, -1] - csum[np.arange(n_symbols), start]
+    
+    result = sums / np.maximum(window, 1)
+    result[(count_valid(closes) < window) | (window < 1)] = np.nan
+    return result
+
+
+def rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    종목별 RSI (Wilder 평활, 마지막 시점)
+    
+    Returns:
+        (종목,) 배열 - 유효 봉이 period + 1보다 적으면 NaN
+    """
+    packed = compact(closes)
+    delta = np.diff(packed, axis=1)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    gains[np.isnan(delta)] = np.nan
+    losses[np.isnan(delta)] = np.nan
+    
+    n_symbols = packed.shape[0]
+    avg_gain = np.full(n_symbols, np.nan)
+    avg_loss = np.full(n_symbols, np.nan)
+    seen = np.zeros(n_symbols, dtype=np.int64)
+    alpha = 1.0 / period
+    
+    # 시간축만 순회하고 종목축은 벡터 연산 (시간 길이는 보통 수십~수백 봉)
+    for t in range(delta.shape[1]):
+        g, l = gains[:, t], losses[:, t]
+        ok = ~np.isnan(g)
+        seen += ok
+        seed = ok & (seen <= period)
+        avg_gain = np.where(seed, np.nan_to_num(avg_gain) + g / period, avg_gain)
+        avg_loss = np.where(seed, np.nan_to_num(avg_loss) + l / period, avg_loss)
+        smooth = ok & (seen > period)
+        avg_gain = np.where(smooth, avg_gain + alpha * (g - avg_gain), avg_gain)
+        avg_loss = np.where(smooth, avg_loss + alpha * (l - avg_loss), avg_loss)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        result = 100 - 100 / (1 + rs)
+    result[(avg_loss == 0) & (avg_gain > 0)] = 100.0
+    result[(avg_loss == 0) & (avg_gain == 0)] = 50.0
+    result[seen < period] = np.nan
+    return result
+
+
+def volatility(closes: np.ndarray, annualize: int = 252) -> np.ndarray:
+    """종목별 일간 수익률 표준편차 (연율화, %)"""
+    packed = compact(closes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.diff(packed, axis=1) / packed[:, :-1]
+    valid = (~np.isnan(returns)).sum(axis=1)
+    result = np.full(packed.shape[0], np.nan)
+    ok = valid >= 2
+    if ok.any():
+        result[ok] = np.nanstd(returns[ok], axis=1, ddof=1) * np.sqrt(annualize) * 100
+    return result
+
+
+def max_drawdown(closes: np.ndarray) -> np.ndarray:
+    """종목별 최대 낙폭 (%, 음수)"""
+    filled = forward_fill(closes)
+    peaks = np.fmax.accumulate(filled, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdowns = (filled - peaks) / peaks * 100
+    result = np.nanmin(np.where(np.isnan(drawdowns), np.inf, drawdowns), axis=1)
+    result[np.isinf(result)] = np.nan
+    return result
+
+
+def trend_labels(last: np.ndarray, ma_short: np.ndarray, ma_long: np.ndarray) -> np.ndarray:
+    """
+    종가와 단기/장기 이동평균으로 추세 라벨 분류
+    
+    단기 이동평균이 없으면(봉 개수가 단기 윈도우 미만) 종가와 장기 이동평균만으로
+    상승세/하락세를 나눕니다 (NaN 비교는 거짓).
+    
+    Returns:
+        (종목,) 문자열 배열 (종가나 장기 이동평균이 없으면 None)
+    """
+    labels = np.select(
+        [
+            (last > ma_short) & (ma_short > ma_long),
+            last > ma_long,
+            (last < ma_short) & (ma_short < ma_long),
+        ],
+        [TREND_STRONG_UP, TREND_UP, TREND_STRONG_DOWN],
+        default=TREND_DOWN
+    ).astype(object)
+    labels[np.isnan(last) | np.isnan(ma_long)] = None
+    return labels
+
+
+def compute_indicators(
+    closes: np.ndarray,
+    short_window: int = 5,
+    long_window: int = 20,
+    rsi_period: int = 14
+) -> Dict[str, np.ndarray]:
+    """
+    전체 종목의 지표를 한 번에 계산
+    
+    장기 이동평균 윈도우는 analyze_trend와 같이 min(long_window, 유효 봉 개수)를 사용합니다.
+    
+    Args:
+        closes: (종목, 시간) 종가 행렬 (결측은 NaN)
+        short_window: 단기 이동평균 윈도우
+        long_window: 장기 이동평균 윈도우
+        rsi_period: RSI 기간
+    
+    Returns:
+        지표 이름 → (종목,) 배열 딕셔너리
+    """
+    closes = np.atleast_2d(np.asarray(closes, dtype=np.float64))
+    
+    first = first_valid(closes)
+    last = last_valid(closes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total_change = (last - first) / first * 100
+    
+    ma_short = moving_average(closes, short_window)
+    ma_long = moving_average(closes, np.minimum(long_window, count_valid(closes)))
+    
+    return {
+        'last': last,
+        'total_change_percent': total_change,
+        'ma_short': ma_short,
+        'ma_long': ma_long,
+        'rsi': rsi(closes, rsi_period),
+        'volatility': volatility(closes),
+        'max_drawdown': max_drawdown(closes),
+        'trend': trend_labels(last, ma_short, ma_long),
+        'bars': count_valid(closes),
+    }
+
+
+def to_records(symbols: List[str], indicators: Dict[str, np.ndarray]) -> List[Dict]:
+    """지표 배열을 종목별 딕셔너리 리스트로 변환"""
+    def _value(array: np.ndarray, i: int) -> Optional[float]:
+        value = array[i]
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return None
+        return value
+    
+    records = []
+    for i, symbol in enumerate(symbols):
+        record = {'symbol': symbol}
+        for name, array in indicators.items():
+            value = _value(array, i)
+            if isinstance(value, (np.floating, float)):
+                value = round(float(value), 2)
+            elif isinstance(value, np.integer):
+                value = int(value)
+            record[name] = value
+        records.append(record)
+    return records
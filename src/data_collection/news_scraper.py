@@ -1,48 +1,181 @@
 """
 데이터 수집 모듈 - 경제 뉴스 크롤러
 """
-import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 import time
 from typing import List, Dict
 import feedparser
 from loguru import logger
+import yaml
+
+from src.data_collection.article_fetcher import ArticleFetcher
+from src.data_collection.dedup_index import NewsDedupIndex
+from src.data_collection.feed_cache import FeedCache
+from src.data_collection.trending import TrendingTracker, extract_keywords
+from src.utils.http_client import get_http_client
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.rate_limiter import HostRateLimiter
+
+
+# 경제 뉴스 판별 키워드 (모듈 로드 시 한 번만 컴파일)
+ECONOMIC_KEYWORDS = [
+    '주식', '증시', '코스피', '코스닥', '환율', '금리', 
+    '투자', '재테크', '부동산', '경기', '인플레이션',
+    '금융', '은행', '채권', '펀드', '암호화폐', '비트코인'
+]
+ECONOMIC_MATCHER = KeywordMatcher(ECONOMIC_KEYWORDS)
+
+# 이름만으로 등록할 수 있는 알려진 RSS 피드
+# (config의 news_sources에 {이름: URL} 형태로 적으면 새 소스를 추가하거나 URL을 바꿀 수 있음)
+KNOWN_RSS_FEEDS = {
+    '한국경제': 'https://www.hankyung.com/rss/economy',
+    '매일경제': 'https://www.mk.co.kr/rss/30100041/',
+    '서울경제': 'https://www.sedaily.com/RSS/S00.xml',
+    '연합뉴스': 'https://www.yonhapnews.co.kr/rss/economy.xml',
+    '연합인포맥스': 'https://news.einfomax.co.kr/rss/allArticle.xml',
+}
 
 
 class NewsScraper:
     """경제 뉴스를 수집하는 크롤러"""
     
-    def __init__(self):
+    def __init__(self, config_path='config/config.yaml'):
+        # 설정 로드
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+            self.fetch_config = config['data_collection'].get('news_fetch', {})
+            news_sources = config['data_collection'].get('news_sources')
+            dedup_config = config['data_collection'].get('dedup', {})
+            trending_config = config['data_collection'].get('trending', {})
+        
+        # 동시 수집 설정
+        self.concurrent = self.fetch_config.get('concurrent', True)
+        self.max_workers = self.fetch_config.get('max_workers', 4)
+        self.feed_timeout = self.fetch_config.get('feed_timeout', 10)
+        self.total_timeout = self.fetch_config.get('total_timeout', 30)
+        
+        # 공유 HTTP 세션 (연결 재사용, 재시도)
+        self.http = get_http_client(config_path)
+        
+        # 전역 sleep 대신 호스트별 요청 간격 제한
+        self.rate_limiter = HostRateLimiter(self.fetch_config.get('host_interval', 1.0))
+        
+        # 조건부 GET 캐시 (변경 없는 피드는 304로 재사용)
+        cache_config = self.fetch_config.get('cache', {})
+        self.feed_cache = None
+        if cache_config.get('enabled', True):
+            self.feed_cache = FeedCache(cache_config.get('path', 'data/cache/feeds.json'))
+        
+        # 실행 간 중복 뉴스 인덱스 (이미 영상으로 다룬 뉴스 제외)
+        self.dedup_index = None
+        if dedup_config.get('enabled', True):
+            self.dedup_index = NewsDedupIndex(
+                dedup_config.get('path', 'data/cache/news_dedup.json'),
+                ttl_hours=dedup_config.get('ttl_hours', 72),
+                max_distance=dedup_config.get('max_distance', 3)
+            )
+        
+        # 실행 간 유지되는 시간 감쇠 트렌드 추적기
+        self.trending_top_k = trending_config.get('top_k', 10)
+        self.trending_tracker = None
+        if trending_config.get('enabled', True):
+            self.trending_tracker = TrendingTracker(
+                trending_config.get('path', 'data/cache/trending.json'),
+                half_life_hours=trending_config.get('half_life_hours', 6),
+                window_hours=trending_config.get('window_hours', 24)
+            )
+        
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        # RSS 피드 URL들
-        self.rss_feeds = {
-            '한국경제': 'https://www.hankyung.com/rss/economy',
-            '매일경제': 'https://www.mk.co.kr/rss/30100041/',
-            '서울경제': 'https://www.sedaily.com/RSS/S00.xml',
-            '연합뉴스': 'https://www.yonhapnews.co.kr/rss/economy.xml',
-        }
+        # RSS 피드 URL들 (config의 news_sources 기준)
+        self.rss_feeds = self._build_feed_registry(news_sources)
+        
+        # 기사 본문 수집 (선택)
+        article_config = self.fetch_config.get('article', {})
+        self.fetch_articles = article_config.get('enabled', False)
+        self.max_articles = article_config.get('max_articles', 10)
+        self.article_fetcher = None
+        if self.fetch_articles:
+            self.article_fetcher = ArticleFetcher(
+                max_workers=article_config.get('max_workers', 4),
+                timeout=article_config.get('timeout', 10),
+                total_timeout=article_config.get('total_timeout', 60),
+                host_interval=self.fetch_config.get('host_interval', 1.0),
+                max_chars=article_config.get('max_chars', 4000),
+                headers=self.headers,
+                http_client=self.http
+            )
+    
+    @staticmethod
+    def _build_feed_registry(news_sources) -> Dict[str, str]:
+        """
+        config의 news_sources로 피드 목록 구성
+        
+        각 항목은 KNOWN_RSS_FEEDS의 이름 또는 {이름: URL} 매핑입니다.
+        설정이 없으면 알려진 피드 전체를 사용합니다.
+        """
+        if not news_sources:
+            return dict(KNOWN_RSS_FEEDS)
+        
+        feeds = {}
+        for source in news_sources:
+            if isinstance(source, dict):
+                feeds.update(source)
+            elif source in KNOWN_RSS_FEEDS:
+                feeds[source] = KNOWN_RSS_FEEDS[source]
+            else:
+                logger.warning(f"RSS URL을 알 수 없는 뉴스 소스 제외: {source} ({{이름: URL}} 형태로 지정 필요)")
+        
+        return feeds
     
     def fetch_news_from_rss(self, source: str, url: str) -> List[Dict]:
         """RSS 피드에서 뉴스 가져오기"""
         try:
-            feed = feedparser.parse(url)
-            news_list = []
+            self.rate_limiter.wait(url)
+            
+            headers = dict(self.headers)
+            if self.feed_cache:
+                headers.update(self.feed_cache.conditional_headers(url))
+            
+            # feedparser 자체 fetcher는 타임아웃이 없으므로 requests로 받아서 파싱
+            response = self.http.get(url, headers=headers, timeout=self.feed_timeout)
             
-            for entry in feed.entries[:5]:  # 최신 5개만
-                news = {
-                    'source': source,
+            if response.status_code == 304 and self.feed_cache:
+                entries = self.feed_cache.get_entries(url)
+                if entries is not None:
+                    news_list = self._build_news(source, entries)
+                    logger.info(f"{source} 변경 없음 (304), 캐시된 {len(news_list)}개 뉴스 사용")
+                    return news_list
+                
+                # 검증자만 남고 항목이 없는 경우 조건 없이 다시 요청
+                response = self.http.get(url, headers=self.headers, timeout=self.feed_timeout)
+            
+            response.raise_for_status()
+            
+            feed = feedparser.parse(response.content)
+            entries = [
+                {
                     'title': entry.get('title', ''),
                     'link': entry.get('link', ''),
                     'summary': entry.get('summary', ''),
-                    'published': entry.get('published', ''),
-                    'timestamp': datetime.now().isoformat()
+                    'published': entry.get('published', '')
                 }
-                news_list.append(news)
+                for entry in feed.entries[:5]  # 최신 5개만
+            ]
+            
+            if self.feed_cache:
+                self.feed_cache.update(
+                    url,
+                    entries,
+                    etag=response.headers.get('ETag'),
+                    modified=response.headers.get('Last-Modified')
+                )
             
+            news_list = self._build_news(source, entries)
             logger.info(f"{source}에서 {len(news_list)}개 뉴스 수집 완료")
             return news_list
             
@@ -50,54 +183,159 @@ class NewsScraper:
             logger.error(f"{source} RSS 파싱 실패: {e}")
             return []
     
-    def fetch_all_news(self) -> List[Dict]:
-        """모든 소스에서 뉴스 수집"""
-        all_news = []
+    def _build_news(self, source: str, entries: List[Dict]) -> List[Dict]:
+        """피드 항목을 뉴스 딕셔너리로 변환"""
+        timestamp = datetime.now().isoformat()
+        return [
+            {
+                'source': source,
+                'title': entry['title'],
+                'link': entry['link'],
+                'summary': entry['summary'],
+                'published': entry['published'],
+                'timestamp': timestamp
+            }
+            for entry in entries
+        ]
+    
+    def fetch_all_news(self, concurrent: bool = None) -> List[Dict]:
+        """
+        모든 소스에서 뉴스 수집
+        
+        Args:
+            concurrent: 동시 수집 여부 (None이면 config 설정 사용)
+        
+        Returns:
+            피드 등록 순서대로 합친 뉴스 리스트
+        """
+        if concurrent is None:
+            concurrent = self.concurrent
         
-        for source, url in self.rss_feeds.items():
-            news = self.fetch_news_from_rss(source, url)
-            all_news.extend(news)
-            time.sleep(1)  # Rate limiting
+        start = time.monotonic()
         
-        logger.info(f"총 {len(all_news)}개 뉴스 수집 완료")
+        if concurrent:
+            all_news = self._fetch_all_concurrent()
+        else:
+            all_news = []
+            for source, url in self.rss_feeds.items():
+                all_news.extend(self.fetch_news_from_rss(source, url))
+        
+        elapsed = time.monotonic() - start
+        logger.info(f"총 {len(all_news)}개 뉴스 수집 완료 ({elapsed:.1f}초)")
         return all_news
     
+    def _fetch_all_concurrent(self) -> List[Dict]:
+        """
+        스레드 풀로 모든 피드를 동시에 수집
+        
+        전체 수집 시간은 total_timeout으로 제한되며, 기한 내에 끝나지 않은
+        피드는 결과에서 제외됩니다.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(self.rss_feeds))),
+            thread_name_prefix='rss'
+        )
+        
+        try:
+            futures = {
+                source: executor.submit(self.fetch_news_from_rss, source, url)
+                for source, url in self.rss_feeds.items()
+            }
+            
+            done, not_done = wait(futures.values(), timeout=self.total_timeout)
+            
+            for source, future in futures.items():
+                if future in not_done:
+                    logger.warning(f"{source} 수집 시간 초과 ({self.total_timeout}초), 건너뜀")
+            
+            # 피드 순서를 유지해서 결과 병합
+            all_news = []
+            for future in futures.values():
+                if future in done:
+                    all_news.extend(future.result())
+            
+            return all_news
+        
+        finally:
+            # 느린 피드를 기다리지 않고 반환
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def get_trending_topics(self, news_list: List[Dict]) -> List[str]:
-        """트렌딩 키워드 추출"""
+        """트렌딩 키워드 추출 (주어진 뉴스 목록만 대상)"""
         from collections import Counter
-        import re
         
         # 간단한 키워드 추출 (실제로는 더 정교한 NLP 필요)
-        keywords = []
+        counter = Counter()
         for news in news_list:
-            text = news['title'] + ' ' + news['summary']
-            # 한글 2글자 이상 단어 추출
-            words = re.findall(r'[가-힣]{2,}', text)
-            keywords.extend(words)
-        
-        # 불용어 제거 (간단한 예시)
-        stopwords = {'것으로', '있는', '하는', '되는', '대한', '관련', '위한', '통해', '때문에'}
-        keywords = [w for w in keywords if w not in stopwords]
+            counter.update(extract_keywords(news['title'] + ' ' + news['summary']))
         
         # 빈도수 기반 상위 10개
-        counter = Counter(keywords)
         trending = [word for word, count in counter.most_common(10)]
         
         logger.info(f"트렌딩 키워드: {trending}")
         return trending
     
+    def update_trending(self, news_list: List[Dict]) -> List[str]:
+        """
+        새 뉴스를 트렌드 추적기에 반영하고 최근 트렌딩 키워드 반환
+        
+        추적기가 꺼져 있으면 get_trending_topics로 대체합니다.
+        """
+        if not self.trending_tracker:
+            return self.get_trending_topics(news_list)
+        
+        self.trending_tracker.update(news_list)
+        try:
+            self.trending_tracker.save()
+        except Exception as e:
+            logger.warning(f"트렌딩 상태 저장 실패: {e}")
+        
+        trending = [word for word, score in self.trending_tracker.top_k(self.trending_top_k)]
+        logger.info(f"트렌딩 키워드 (최근 추세): {trending}")
+        return trending
+    
+    def rank_by_trend(self, news_list: List[Dict]) -> List[Dict]:
+        """트렌드 점수가 높은 키워드를 많이 담은 뉴스 순으로 정렬 (동점은 기존 순서 유지)"""
+        if not self.trending_tracker:
+            return news_list
+        
+        now = time.time()
+        return sorted(
+            news_list,
+            key=lambda news: self.trending_tracker.score_text(news['title'], now),
+            reverse=True
+        )
+    
+    def fetch_article_bodies(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        상위 max_articles개 뉴스의 기사 본문을 수집해 'body' 필드에 추가
+        
+        본문 수집이 꺼져 있으면 그대로 반환합니다.
+        """
+        if not self.article_fetcher:
+            return news_list
+        
+        self.article_fetcher.fetch_bodies(news_list[:self.max_articles])
+        return news_list
+    
+    def remove_duplicates(self, news_list: List[Dict]) -> List[Dict]:
+        """이미 다룬 뉴스와 소스 간 중복 뉴스 제거"""
+        if not self.dedup_index:
+            return news_list
+        return self.dedup_index.filter_new(news_list)
+    
+    def mark_covered(self, news_list: List[Dict]):
+        """영상으로 제작한 뉴스를 중복 인덱스에 기록"""
+        if self.dedup_index and news_list:
+            self.dedup_index.mark_seen(news_list)
+            logger.info(f"{len(news_list)}개 뉴스를 중복 인덱스에 기록")
+    
     def filter_economic_news(self, news_list: List[Dict]) -> List[Dict]:
         """경제 관련 뉴스 필터링"""
-        economic_keywords = [
-            '주식', '증시', '코스피', '코스닥', '환율', '금리', 
-            '투자', '재테크', '부동산', '경기', '인플레이션',
-            '금융', '은행', '채권', '펀드', '암호화폐', '비트코인'
-        ]
-        
         filtered = []
         for news in news_list:
             text = news['title'] + ' ' + news['summary']
-            if any(keyword in text for keyword in economic_keywords):
+            if ECONOMIC_MATCHER.contains_any(text):
                 filtered.append(news)
         
         logger.info(f"{len(news_list)}개 중 {len(filtered)}개 경제 뉴스 필터링")
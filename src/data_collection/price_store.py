@@ -0,0 +1,309 @@
+"""
+로컬 가격 이력 저장소 - 심볼별 NumPy 배열 파일 + 증분 추가
+"""
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+class PriceStore:
+    """
+    심볼별 일봉 이력을 `.npy` 파일로 보관하는 컬럼형 저장소
+    
+    각 파일은 (봉 개수, 6) float64 배열이며 컬럼은
+    [UTC epoch 초, Open, High, Low, Close, Volume] 순서입니다.
+    읽을 때는 메모리 매핑으로 열어서 필요한 구간만 복사합니다.
+    
+    저장 값은 다운로드 시점 기준의 수정주가이므로, 증분 갱신 때 이미 저장된 완성 봉과
+    새로 받은 같은 봉의 종가가 다르면(분할/배당으로 기준 변경) 전체 이력을 다시 받습니다.
+    """
+    
+    FIELDS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    
+    # 겹치는 봉의 종가가 이 상대 오차보다 다르면 수정 기준이 바뀐 것으로 판단
+    REBASE_TOLERANCE = 1e-4
+    
+    # 요청 구간 시작이 주말/연휴면 첫 봉이 며칠 늦으므로 이만큼은 구간을 덮은 것으로 봄
+    COVERAGE_SLACK_DAYS = 4
+    
+    def __init__(self, store_dir: str = 'data/prices', initial_period: str = '3mo'):
+        """
+        Args:
+            store_dir: 저장 디렉토리
+            initial_period: 저장된 이력이 없는 심볼의 최초 다운로드 기간
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.initial_period = initial_period
+        # 심볼 → 이미 과거 구간을 다시 받아 본 가장 이른 시작 시각 (상장 기간이 짧은 심볼 반복 다운로드 방지)
+        self._backfilled: Dict[str, float] = {}
+    
+    def _path(self, symbol: str) -> Path:
+        """심볼을 파일명으로 안전하게 변환 (^KS11, KRW=X 등)"""
+        return self.store_dir / f"{re.sub(r'[^A-Za-z0-9._-]', '_', symbol)}.npy"
+    
+    def load(self, symbol: str) -> Optional[np.ndarray]:
+        """저장된 이력을 메모리 매핑으로 로드 (없으면 None)"""
+        path = self._path(symbol)
+        if not path.exists():
+            return None
+        
+        try:
+            return np.load(path, mmap_mode='r')
+        except Exception as e:
+            logger.warning(f"{symbol} 가격 이력 로드 실패: {e}")
+            return None
+    
+    def last_timestamp(self, symbol: str) -> Optional[float]:
+        """마지막으로 저장된 봉의 시각 (epoch 초)"""
+        bars = self.load(symbol)
+        if bars is None or len(bars) == 0:
+            return None
+        return float(bars[-1, 0])
+    
+    def first_timestamp(self, symbol: str) -> Optional[float]:
+        """처음 저장된 봉의 시각 (epoch 초)"""
+        bars = self.load(symbol)
+        if bars is None or len(bars) == 0:
+            return None
+        return float(bars[0, 0])
+    
+    def overlap_timestamp(self, symbol: str) -> Optional[float]:
+        """
+        증분 다운로드 시작 시각 (epoch 초)
+        
+        마지막 봉은 미완성일 수 있으므로 그 앞의 완성 봉부터 받아 수정 기준 비교에 사용합니다.
+        """
+        bars = self.load(symbol)
+        if bars is None or len(bars) == 0:
+            return None
+        return float(bars[max(0, len(bars) - 2), 0])
+    
+    def _to_bars(self, frame: pd.DataFrame) -> np.ndarray:
+        """FIELDS 컬럼 DataFrame을 (봉 개수, 6) 배열로 변환"""
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        
+        epoch_seconds = (index - pd.Timestamp('1970-01-01')) // pd.Timedelta(seconds=1)
+        
+        return np.column_stack([
+            np.asarray(epoch_seconds, dtype=np.float64),
+            *(frame[field].to_numpy(dtype=np.float64) if field in frame else np.zeros(len(frame))
+              for field in self.FIELDS)
+        ]).astype(np.float64)
+    
+    def is_rebased(self, symbol: str, frame: pd.DataFrame) -> bool:
+        """
+        새로 받은 봉이 저장된 완성 봉과 수정 기준이 다른지 여부
+        
+        마지막 저장 봉(미완성일 수 있음)을 제외하고 시각이 겹치는 봉의 종가를 비교합니다.
+        """
+        frame = frame.dropna(subset=['Close'])
+        old_bars = self.load(symbol)
+        if frame.empty or old_bars is None or len(old_bars) < 2:
+            return False
+        
+        new_bars = self._to_bars(frame)
+        completed = np.asarray(old_bars[:-1])
+        _, old_idx, new_idx = np.intersect1d(completed[:, 0], new_bars[:, 0], return_indices=True)
+        if len(old_idx) == 0:
+            return False
+        
+        return not np.allclose(
+            new_bars[new_idx, 4], completed[old_idx, 4], rtol=self.REBASE_TOLERANCE, atol=0
+        )
+    
+    def append(self, symbol: str, frame: pd.DataFrame, replace: bool = False) -> int:
+        """
+        새로 받은 봉을 이력에 추가
+        
+        마지막 저장 봉은 장중에 받은 미완성 봉일 수 있으므로, 새 데이터와
+        시각이 겹치는 봉은 새 데이터로 덮어씁니다.
+        
+        Args:
+            symbol: 심볼
+            frame: FIELDS 컬럼을 가진 날짜 인덱스 DataFrame
+            replace: True면 기존 이력을 버리고 frame으로 교체 (수정 기준 변경 시)
+        
+        Returns:
+            저장 후 전체 봉 개수
+        """
+        frame = frame.dropna(subset=['Close'])
+        if frame.empty:
+            bars = self.load(symbol)
+            return 0 if bars is None else len(bars)
+        
+        new_bars = self._to_bars(frame)
+        
+        old_bars = None if replace else self.load(symbol)
+        if old_bars is not None and len(old_bars):
+            keep = np.asarray(old_bars[old_bars[:, 0] < new_bars[0, 0]])
+            bars = np.concatenate([keep, new_bars])
+        else:
+            bars = new_bars
+        
+        # 임시 파일에 쓴 뒤 교체 (메모리 매핑 중인 파일을 직접 덮어쓰지 않도록)
+        path = self._path(symbol)
+        tmp_path = path.with_name(path.stem + '.tmp.npy')
+        np.save(tmp_path, bars)
+        os.replace(tmp_path, path)
+        
+        return len(bars)
+    
+    def sync(self, symbols: List[str], download: Callable[..., Optional[pd.DataFrame]]) -> bool:
+        """
+        저장소를 최신 상태로 갱신 (마지막 완성 봉 이후만 다운로드)
+        
+        증분으로 받은 봉의 수정 기준이 저장된 이력과 다르면 해당 심볼은 저장된 첫 봉부터
+        다시 받아 이력 전체를 교체합니다.
+        
+        Args:
+            symbols: 갱신할 심볼 리스트
+            download: download(symbols, period=..., start=...) →
+                      (필드, 심볼) MultiIndex 컬럼 DataFrame 또는 None
+        
+        Returns:
+            모든 다운로드가 성공했는지 여부
+        """
+        new_symbols = []
+        tail_starts: Dict[str, float] = {}
+        
+        for symbol in symbols:
+            last = self.overlap_timestamp(symbol)
+            if last is None:
+                new_symbols.append(symbol)
+            else:
+                tail_starts[symbol] = last
+        
+        success = True
+        
+        # 이력 없는 심볼은 초기 기간 전체, 나머지는 가장 오래된 마지막 봉부터 한 번에 다운로드
+        batches = []
+        if new_symbols:
+            batches.append((new_symbols, {'period': self.initial_period}))
+        if tail_starts:
+            start = datetime.utcfromtimestamp(min(tail_starts.values())).strftime('%Y-%m-%d')
+            batches.append((list(tail_starts), {'start': start}))
+        
+        rebased = []
+        for batch, kwargs in batches:
+            history = download(batch, **kwargs)
+            if history is None:
+                success = False
+                continue
+            
+            for symbol in batch:
+                if symbol not in history.columns.get_level_values(1):
+                    continue
+                frame = history.xs(symbol, axis=1, level=1)
+                if symbol in tail_starts and self.is_rebased(symbol, frame):
+                    rebased.append(symbol)
+                    continue
+                self.append(symbol, frame)
+        
+        # 분할/배당으로 수정 기준이 바뀐 심볼은 저장 구간 전체를 새 기준으로 다시 받음
+        if rebased:
+            logger.info(f"수정주가 기준 변경, 전체 이력 재다운로드: {', '.join(rebased)}")
+            first = min(float(self.load(symbol)[0, 0]) for symbol in rebased)
+            history = download(rebased, start=datetime.utcfromtimestamp(first).strftime('%Y-%m-%d'))
+            if history is None:
+                success = False
+            else:
+                for symbol in rebased:
+                    if symbol in history.columns.get_level_values(1):
+                        self.append(symbol, history.xs(symbol, axis=1, level=1), replace=True)
+        
+        logger.info(
+            f"가격 저장소 갱신: 신규 {len(new_symbols)}개, 증분 {len(tail_starts)}개 심볼"
+            + (f" (재다운로드 {len(rebased)}개)" if rebased else "")
+        )
+        return success
+    
+    def ensure_coverage(
+        self,
+        symbols: List[str],
+        days: int,
+        download: Callable[..., Optional[pd.DataFrame]]
+    ) -> bool:
+        """
+        최근 N일 구간 전체가 저장되어 있도록 모자란 과거 구간을 다시 받음
+        
+        최초 다운로드는 initial_period만 받으므로 더 긴 기간(6mo, 1y)을 조회하기 전에 호출합니다.
+        저장된 첫 봉이 구간 시작보다 늦은 심볼만 구간 시작부터 지금까지 받아 이력을 교체합니다.
+        
+        Args:
+            symbols: 심볼 리스트
+            days: 필요한 최근 일수
+            download: sync와 같은 다운로드 함수
+        
+        Returns:
+            다운로드가 성공했는지 여부 (받을 것이 없으면 True)
+        """
+        since = time.time() - days * 86400
+        slack = self.COVERAGE_SLACK_DAYS * 86400
+        
+        missing = []
+        for symbol in symbols:
+            first = self.first_timestamp(symbol)
+            if first is not None and first <= since + slack:
+                continue
+            if self._backfilled.get(symbol, float('inf')) <= since:
+                continue  # 이미 받아 봤지만 이력이 더 짧은 심볼 (신규 상장 등)
+            missing.append(symbol)
+        
+        if not missing:
+            return True
+        
+        history = download(missing, start=datetime.utcfromtimestamp(since).strftime('%Y-%m-%d'))
+        if history is None:
+            return False
+        
+        for symbol in missing:
+            self._backfilled[symbol] = since
+            if symbol in history.columns.get_level_values(1):
+                self.append(symbol, history.xs(symbol, axis=1, level=1), replace=True)
+        
+        logger.info(f"가격 저장소 과거 구간 보충 ({days}일): {len(missing)}개 심볼")
+        return True
+    
+    def history(self, symbols: List[str], days: Optional[int] = None) -> pd.DataFrame:
+        """
+        저장된 이력을 (필드, 심볼) MultiIndex 컬럼 DataFrame으로 조회
+        
+        Args:
+            symbols: 조회할 심볼 리스트
+            days: 최근 N일만 조회 (None이면 전체)
+        
+        Returns:
+            날짜 인덱스 DataFrame (이력이 없는 심볼은 제외)
+        """
+        since = None
+        if days is not None:
+            since = time.time() - days * 86400
+        
+        frames = {}
+        for symbol in symbols:
+            bars = self.load(symbol)
+            if bars is None or len(bars) == 0:
+                continue
+            
+            if since is not None:
+                # 시각 컬럼은 정렬되어 있으므로 이진 탐색으로 구간만 복사
+                bars = bars[np.searchsorted(bars[:, 0], since):]
+            bars = np.asarray(bars)
+            
+            index = pd.to_datetime(bars[:, 0].astype(np.int64), unit='s')
+            for i, field in enumerate(self.FIELDS, start=1):
+                frames[(field, symbol)] = pd.Series(bars[:, i], index=index)
+        
+        if not frames:
+            return pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=[None, None]))
+        
+        return pd.DataFrame(frames).sort_index()
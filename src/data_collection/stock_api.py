@@ -1,16 +1,107 @@
 """
 주식 및 금융 데이터 수집 모듈
 """
+import heapq
 import yfinance as yf
+import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 from loguru import logger
+import yaml
+
+from src.data_collection import indicators
+from src.data_collection.price_store import PriceStore
+from src.utils.http_client import get_http_client
+
+
+class MarketSnapshot:
+    """한 번에 수집한 시장 데이터 (시세 + 종가 이력) 스냅샷"""
+    
+    # 스냅샷에 함께 담는 종가 이력 기간 (analyze_trend 기본 기간과 동일)
+    HISTORY_PERIOD = '1mo'
+    
+    # yfinance 기간 문자열 → 달력 일수 (로컬 저장소 조회용)
+    PERIOD_DAYS = {'5d': 5, '1mo': 31, '3mo': 92, '6mo': 183, '1y': 366}
+    
+    def __init__(
+        self,
+        symbols: List[str],
+        quotes: Dict[str, Dict],
+        closes: pd.DataFrame,
+        fetched_at: datetime = None
+    ):
+        """
+        Args:
+            symbols: 수집을 요청한 심볼 리스트 (수집 실패한 심볼 포함)
+            quotes: {심볼: 시세 딕셔너리}
+            closes: 날짜 × 심볼 종가 DataFrame
+            fetched_at: 수집 시각
+        """
+        self.symbols = list(symbols)
+        self.quotes = quotes
+        self.closes = closes
+        self.fetched_at = fetched_at or datetime.now()
+    
+    @property
+    def age(self) -> float:
+        """수집 후 경과 시간 (초)"""
+        return (datetime.now() - self.fetched_at).total_seconds()
+    
+    def is_stale(self, max_age: float) -> bool:
+        """스냅샷이 허용 기간보다 오래되었는지 여부"""
+        return self.age > max_age
+    
+    def covers(self, symbols: List[str]) -> bool:
+        """요청한 심볼이 모두 수집 대상에 포함되어 있는지 여부"""
+        return all(symbol in self.symbols for symbol in symbols)
+    
+    def quote(self, symbol: str) -> Optional[Dict]:
+        """심볼 시세 조회 (수집 실패한 심볼은 None)"""
+        return self.quotes.get(symbol)
+    
+    def history(self, symbol: str) -> Optional[pd.Series]:
+        """심볼 종가 이력 조회 (결측 봉 제외)"""
+        if symbol not in self.closes.columns:
+            return None
+        return self.closes[symbol].dropna()
+    
+    def merge(self, other: 'MarketSnapshot') -> 'MarketSnapshot':
+        """다른 스냅샷과 병합 (수집 시각은 더 오래된 쪽 기준)"""
+        closes = pd.concat([self.closes, other.closes], axis=1)
+        closes = closes.loc[:, ~closes.columns.duplicated(keep='last')]
+        return MarketSnapshot(
+            self.symbols + [s for s in other.symbols if s not in self.symbols],
+            {**self.quotes, **other.quotes},
+            closes,
+            min(self.fetched_at, other.fetched_at)
+        )
 
 
 class StockDataCollector:
     """주식 및 금융 시장 데이터 수집"""
     
-    def __init__(self):
+    def __init__(self, config_path='config/config.yaml'):
+        # 설정 로드
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+            self.stock_config = config['data_collection'].get('stock', {})
+        
+        # yfinance 요청도 공유 HTTP 세션 사용 (연결 재사용, 재시도)
+        self.http = get_http_client(config_path)
+        
+        # 스냅샷 유효 기간 (초) - 이 기간 안에서는 같은 시세를 재사용
+        self.snapshot_ttl = self.stock_config.get('snapshot_ttl', 300)
+        self._snapshot: Optional[MarketSnapshot] = None
+        
+        # 로컬 가격 저장소 (마지막 저장 봉 이후만 다운로드)
+        store_config = self.stock_config.get('price_store', {})
+        self.price_store = None
+        if store_config.get('enabled', True):
+            self.price_store = PriceStore(
+                store_config.get('path', 'data/prices'),
+                initial_period=store_config.get('initial_period', '3mo')
+            )
+        
         self.symbols = {
             'KOSPI': '^KS11',
             'KOSDAQ': '^KQ11',
@@ -23,11 +114,23 @@ class StockDataCollector:
             '이더리움': 'ETH-USD',
         }
     
-    def get_current_price(self, symbol: str) -> Dict:
-        """현재 가격 및 변동률 조회"""
+    def get_current_price(self, symbol: str, use_store: bool = True) -> Dict:
+        """
+        현재 가격 및 변동률 조회
+        
+        Args:
+            symbol: 심볼
+            use_store: False면 로컬 저장소를 거치지 않고 바로 종목 조회 (일괄 갱신 실패 시)
+        """
+        if self.price_store is not None and use_store:
+            history = self._load_history([symbol], MarketSnapshot.PERIOD_DAYS['5d'])
+            if history is not None:
+                quote = self._quotes_from_history(history, [symbol]).get(symbol)
+                if quote:
+                    return quote
+        
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            ticker = yf.Ticker(symbol, session=self.http.session)
             history = ticker.history(period='2d')
             
             if len(history) < 2:
@@ -51,82 +154,328 @@ class StockDataCollector:
             logger.error(f"{symbol} 데이터 수집 실패: {e}")
             return None
     
+    def _download_history(
+        self,
+        symbols: List[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        여러 종목의 OHLCV 이력을 한 번의 요청으로 다운로드
+        
+        Args:
+            symbols: 심볼 리스트
+            period: 다운로드 기간 (start가 없을 때 사용)
+            start: 시작 날짜 'YYYY-MM-DD' (증분 다운로드용)
+        
+        Returns:
+            (필드, 심볼) MultiIndex 컬럼 DataFrame, 실패 시 None
+        """
+        try:
+            history = yf.download(
+                tickers=symbols,
+                period=None if start else period,
+                start=start,
+                group_by='column',
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+                session=self.http.session
+            )
+        except Exception as e:
+            logger.error(f"일괄 데이터 수집 실패: {e}")
+            return None
+        
+        if history is None or history.empty:
+            logger.warning("일괄 데이터 수집 결과가 비어 있습니다")
+            return None
+        
+        # 단일 종목이면 컬럼이 평탄하게 오므로 (필드, 심볼) 형태로 맞춤
+        if not isinstance(history.columns, pd.MultiIndex):
+            history.columns = pd.MultiIndex.from_product([history.columns, symbols])
+        
+        return history
+    
+    def _quotes_from_history(self, history: pd.DataFrame, symbols: List[str]) -> Dict[str, Dict]:
+        """다운로드한 이력에서 종목별 현재가/변동률을 벡터 연산으로 계산"""
+        closes = history['Close']
+        volumes = history['Volume'] if 'Volume' in history.columns.get_level_values(0) else None
+        
+        # 시장마다 거래일이 달라 NaN이 섞이므로, 종목별 마지막/직전 유효 봉을 벡터 연산으로 선택
+        valid = closes.notna()
+        rank_from_end = valid.iloc[::-1].cumsum().iloc[::-1]
+        is_last = valid & (rank_from_end == 1)
+        is_prev = valid & (rank_from_end == 2)
+        
+        current = closes.where(is_last).max()
+        prev = closes.where(is_prev).max()
+        change = current - prev
+        change_percent = change / prev * 100
+        volume = volumes.where(is_last).max().fillna(0) if volumes is not None else None
+        
+        timestamp = datetime.now().isoformat()
+        quotes = {}
+        
+        for symbol in symbols:
+            if symbol not in closes.columns or pd.isna(current[symbol]) or pd.isna(prev[symbol]):
+                continue
+            
+            quotes[symbol] = {
+                'symbol': symbol,
+                'current_price': round(current[symbol], 2),
+                'change': round(change[symbol], 2),
+                'change_percent': round(change_percent[symbol], 2),
+                'volume': int(volume[symbol]) if volume is not None else 0,
+                'timestamp': timestamp
+            }
+        
+        return quotes
+    
+    def get_prices_bulk(self, symbols: List[str], period: str = '5d') -> Optional[Dict[str, Dict]]:
+        """
+        여러 종목의 현재 가격 및 변동률을 한 번의 요청으로 조회
+        
+        Args:
+            symbols: 조회할 심볼 리스트
+            period: 다운로드 기간 (휴장일을 고려해 최근 2개 봉이 포함되도록 여유 있게)
+        
+        Returns:
+            {심볼: get_current_price와 같은 형식의 딕셔너리}, 다운로드 실패 시 None
+        """
+        if not symbols:
+            return {}
+        
+        history = self._download_history(symbols, period)
+        if history is None:
+            return None
+        
+        return self._quotes_from_history(history, symbols)
+    
+    def _load_history(self, symbols: List[str], days: int) -> Optional[pd.DataFrame]:
+        """
+        로컬 저장소를 증분 갱신한 뒤 최근 N일 이력 조회
+        
+        저장된 이력이 N일보다 짧으면(최초 다운로드 기간 initial_period보다 긴 조회) 모자란
+        과거 구간을 먼저 보충합니다.
+        
+        Returns:
+            (필드, 심볼) MultiIndex 컬럼 DataFrame, 갱신 실패 시 None
+            (오래된 데이터를 현재 시세로 쓰지 않도록)
+        """
+        if not self.price_store.sync(symbols, self._download_history):
+            return None
+        if not self.price_store.ensure_coverage(symbols, days, self._download_history):
+            return None
+        
+        history = self.price_store.history(symbols, days=days)
+        return None if history.empty else history
+    
+    def _fetch_snapshot(self, symbols: List[str]) -> MarketSnapshot:
+        """심볼들의 시세와 종가 이력을 새로 수집"""
+        if self.price_store is not None:
+            history = self._load_history(symbols, MarketSnapshot.PERIOD_DAYS[MarketSnapshot.HISTORY_PERIOD])
+        else:
+            history = self._download_history(symbols, MarketSnapshot.HISTORY_PERIOD)
+        
+        if history is None:
+            # 일괄 다운로드 실패 시 종목별 조회로 대체 (이력 없음, 방금 실패한 저장소 갱신은 건너뜀)
+            quotes = {}
+            for symbol in symbols:
+                data = self.get_current_price(symbol, use_store=False)
+                if data:
+                    quotes[symbol] = data
+            return MarketSnapshot(symbols, quotes, pd.DataFrame())
+        
+        quotes = self._quotes_from_history(history, symbols)
+        return MarketSnapshot(symbols, quotes, history['Close'])
+    
+    def get_snapshot(
+        self,
+        symbols: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
+        refresh: bool = False
+    ) -> MarketSnapshot:
+        """
+        시장 스냅샷 조회 (유효 기간 안이면 재사용, 빠진 심볼만 추가 수집)
+        
+        Args:
+            symbols: 필요한 심볼 리스트 (None이면 주요 지표 전체)
+            max_age: 허용 경과 시간 (초, None이면 snapshot_ttl)
+            refresh: True면 유효 기간과 상관없이 새로 수집
+        
+        Returns:
+            MarketSnapshot
+        """
+        if symbols is None:
+            symbols = list(self.symbols.values())
+        if max_age is None:
+            max_age = self.snapshot_ttl
+        
+        snapshot = self._snapshot
+        
+        if refresh or snapshot is None or snapshot.is_stale(max_age):
+            self._snapshot = self._fetch_snapshot(symbols)
+            logger.info(f"시장 스냅샷 수집 완료 ({len(self._snapshot.quotes)}/{len(symbols)}개 심볼)")
+            return self._snapshot
+        
+        # 이전에 요청된 적 없는 심볼만 추가 수집 (수집 실패 심볼은 재시도하지 않음)
+        if not snapshot.covers(symbols):
+            missing = [s for s in symbols if s not in snapshot.symbols]
+            self._snapshot = snapshot.merge(self._fetch_snapshot(missing))
+            logger.info(f"시장 스냅샷에 {len(missing)}개 심볼 추가")
+        
+        return self._snapshot
+    
     def get_market_summary(self) -> Dict:
         """주요 시장 지표 요약"""
         summary = {}
+        snapshot = self.get_snapshot()
         
         for name, symbol in self.symbols.items():
-            data = self.get_current_price(symbol)
+            data = snapshot.quote(symbol)
             if data:
                 summary[name] = data
                 logger.info(f"{name}: {data['current_price']} ({data['change_percent']:+.2f}%)")
         
         return summary
     
-    def get_top_movers(self, market='KRW') -> Dict:
-        """급등/급락 종목 조회"""
-        if market == 'KRW':
-            # KOSPI 200 주요 종목 (예시)
-            top_symbols = [
-                '005930.KS',  # 삼성전자
-                '000660.KS',  # SK하이닉스
-                '035420.KS',  # NAVER
-                '005380.KS',  # 현대차
-                '051910.KS',  # LG화학
-            ]
-        else:
-            # 나스닥 주요 종목
-            top_symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+    def load_universe(self, path: str) -> List[str]:
+        """
+        유니버스 파일에서 심볼 목록 로드
         
-        movers = []
-        for symbol in top_symbols:
-            data = self.get_current_price(symbol)
-            if data and abs(data['change_percent']) > 2:  # 2% 이상 변동
-                movers.append(data)
+        한 줄에 심볼 하나, '#' 뒤는 주석으로 무시하며 중복은 첫 등장만 유지합니다.
+        """
+        symbols = []
+        seen = set()
         
-        # 변동률 기준 정렬
-        movers.sort(key=lambda x: abs(x['change_percent']), reverse=True)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                symbol = line.split('#', 1)[0].strip()
+                if symbol and symbol not in seen:
+                    seen.add(symbol)
+                    symbols.append(symbol)
         
-        return {
-            'gainers': [m for m in movers if m['change_percent'] > 0][:3],
-            'losers': [m for m in movers if m['change_percent'] < 0][:3]
-        }
+        return symbols
+    
+    def screen_movers(
+        self,
+        symbols: List[str],
+        top_k: int = 3,
+        min_change: float = 2.0,
+        chunk_size: Optional[int] = None
+    ) -> Dict:
+        """
+        유니버스 전체에서 급등/급락 종목 선별
+        
+        유효 기간 안의 스냅샷에 있는 종목은 재사용하고, 나머지는 chunk_size개씩
+        일괄 다운로드합니다. yfinance 일괄 다운로드는 내부 공유 상태 때문에 동시에
+        여러 번 호출하면 결과가 섞이므로, 청크는 순서대로 받고 각 청크 안에서
+        yfinance 스레드 풀로 종목을 병렬 수집합니다.
+        
+        Args:
+            symbols: 유니버스 심볼 리스트
+            top_k: 상승/하락 각각 반환할 종목 수
+            min_change: 최소 변동률 (%, 절댓값)
+            chunk_size: 한 번에 다운로드할 종목 수 (None이면 config)
+        
+        Returns:
+            {'gainers': [...], 'losers': [...]} (변동률 절댓값 내림차순)
+        """
+        if chunk_size is None:
+            chunk_size = self.stock_config.get('screener', {}).get('chunk_size', 100)
+        
+        quotes = {}
+        pending = list(symbols)
+        
+        snapshot = self._snapshot
+        if snapshot is not None and not snapshot.is_stale(self.snapshot_ttl):
+            quotes.update({s: snapshot.quote(s) for s in symbols if snapshot.quote(s)})
+            pending = [s for s in symbols if s not in snapshot.symbols]
+        
+        for i in range(0, len(pending), chunk_size):
+            chunk = pending[i:i + chunk_size]
+            chunk_quotes = self.get_prices_bulk(chunk)
+            if chunk_quotes is None:
+                logger.warning(f"유니버스 청크 {i // chunk_size + 1} 수집 실패 ({len(chunk)}개 종목)")
+                continue
+            quotes.update(chunk_quotes)
+        
+        # 전체 정렬 대신 힙으로 상위 k개만 선택
+        gainers = heapq.nlargest(
+            top_k,
+            (q for q in quotes.values() if q['change_percent'] > min_change),
+            key=lambda q: q['change_percent']
+        )
+        losers = heapq.nsmallest(
+            top_k,
+            (q for q in quotes.values() if q['change_percent'] < -min_change),
+            key=lambda q: q['change_percent']
+        )
+        
+        logger.info(
+            f"유니버스 {len(symbols)}개 중 {len(quotes)}개 시세 확인 → "
+            f"상승 {len(gainers)}개, 하락 {len(losers)}개"
+        )
+        
+        return {'gainers': gainers, 'losers': losers}
+    
+    def get_top_movers(self, market='KRW', universe_file: Optional[str] = None, top_k: int = 3) -> Dict:
+        """
+        급등/급락 종목 조회
+        
+        Args:
+            market: 'KRW'면 KOSPI, 그 외에는 나스닥 기본 유니버스 사용
+            universe_file: 유니버스 파일 경로 (지정하면 market보다 우선)
+            top_k: 상승/하락 각각 반환할 종목 수
+        """
+        if universe_file is None:
+            universes = self.stock_config.get('screener', {}).get('universes', {})
+            if market == 'KRW':
+                # KOSPI 200 주요 종목
+                universe_file = universes.get('KRW', 'config/universes/kospi_major.txt')
+            else:
+                # 나스닥 주요 종목
+                universe_file = universes.get('USD', 'config/universes/nasdaq_major.txt')
+        
+        top_symbols = self.load_universe(universe_file)
+        
+        return self.screen_movers(top_symbols, top_k=top_k, min_change=2.0)  # 2% 이상 변동
     
     def analyze_trend(self, symbol: str, period='1mo') -> Dict:
         """추세 분석"""
         try:
-            ticker = yf.Ticker(symbol)
-            history = ticker.history(period=period)
+            closes = None
+            if period == MarketSnapshot.HISTORY_PERIOD:
+                # 스냅샷 기간과 같으면 이미 받은 종가 이력 재사용
+                snapshot = self._snapshot
+                if snapshot is not None and not snapshot.is_stale(self.snapshot_ttl):
+                    closes = self.get_snapshot([symbol]).history(symbol)
+                else:
+                    # 오래된 공유 스냅샷을 이 심볼만 담은 스냅샷으로 바꾸지 않도록 따로 수집
+                    closes = self._fetch_snapshot([symbol]).history(symbol)
             
-            if len(history) < 2:
-                return None
+            elif self.price_store is not None and period in MarketSnapshot.PERIOD_DAYS:
+                history = self._load_history([symbol], MarketSnapshot.PERIOD_DAYS[period])
+                if history is not None:
+                    closes = history['Close'][symbol].dropna()
             
-            # 간단한 추세 분석
-            first_price = history['Close'].iloc[0]
-            last_price = history['Close'].iloc[-1]
-            total_change = ((last_price - first_price) / first_price) * 100
+            if closes is None or closes.empty:
+                ticker = yf.Ticker(symbol, session=self.http.session)
+                closes = ticker.history(period=period)['Close']
             
-            # 이동평균
-            ma_5 = history['Close'].rolling(window=5).mean().iloc[-1]
-            ma_20 = history['Close'].rolling(window=min(20, len(history))).mean().iloc[-1]
+            if len(closes) < 2:
+                return None
             
-            # 추세 판단
-            if last_price > ma_5 > ma_20:
-                trend = '강한 상승세'
-            elif last_price > ma_20:
-                trend = '상승세'
-            elif last_price < ma_5 < ma_20:
-                trend = '강한 하락세'
-            else:
-                trend = '하락세'
+            # 지표 엔진으로 계산 (1 × 시간 행렬)
+            result = indicators.compute_indicators(closes.to_numpy()[None, :])
             
             return {
                 'symbol': symbol,
                 'period': period,
-                'total_change_percent': round(total_change, 2),
-                'ma_5': round(ma_5, 2),
-                'ma_20': round(ma_20, 2),
-                'trend': trend,
+                'total_change_percent': round(result['total_change_percent'][0], 2),
+                'ma_5': round(result['ma_short'][0], 2),
+                'ma_20': round(result['ma_long'][0], 2),
+                'trend': result['trend'][0],
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -134,8 +483,36 @@ class StockDataCollector:
             logger.error(f"{symbol} 추세 분석 실패: {e}")
             return None
     
+    def screen_trends(self, symbols: Optional[List[str]] = None) -> List[Dict]:
+        """
+        여러 종목의 추세 지표를 한 번에 계산 (스토리 후보 선별용)
+        
+        스냅샷의 종가 이력(HISTORY_PERIOD)을 종목 × 시간 행렬로 만들어
+        이동평균, RSI, 변동성, 최대 낙폭, 추세 라벨을 벡터 연산으로 구합니다.
+        
+        Args:
+            symbols: 대상 심볼 리스트 (None이면 주요 지표 전체)
+        
+        Returns:
+            종목별 지표 딕셔너리 리스트 (이력이 없는 종목은 제외)
+        """
+        if symbols is None:
+            symbols = list(self.symbols.values())
+        
+        snapshot = self.get_snapshot(symbols)
+        available = [s for s in symbols if s in snapshot.closes.columns]
+        if not available:
+            return []
+        
+        closes = snapshot.closes[available].to_numpy().T
+        result = indicators.compute_indicators(closes)
+        
+        records = indicators.to_records(available, result)
+        logger.info(f"{len(records)}개 종목 추세 지표 계산 완료")
+        return records
+    
     def get_interesting_stories(self) -> List[Dict]:
-        """흥미로운 시장 이야기 추출"""
+        """흥미로운 시장 이야기 추출 (유효 기간 안의 스냅샷 재사용)"""
         stories = []
         summary = self.get_market_summary()
         
@@ -144,6 +521,7 @@ class StockDataCollector:
             if abs(data['change_percent']) > 3:
                 stories.append({
                     'type': 'big_move',
+                    'name': name,
                     'title': f"{name} {'급등' if data['change_percent'] > 0 else '급락'}",
                     'description': f"{name}이(가) {abs(data['change_percent']):.2f}% {'상승' if data['change_percent'] > 0 else '하락'}했습니다",
                     'data': data,
@@ -156,6 +534,7 @@ class StockDataCollector:
             if abs(usd_krw['change_percent']) > 1:
                 stories.append({
                     'type': 'forex',
+                    'name': '달러/원',
                     'title': '환율 급변동',
                     'description': f"달러/원 환율이 {usd_krw['change_percent']:+.2f}% 변동",
                     'data': usd_krw,
@@ -168,6 +547,7 @@ class StockDataCollector:
             if abs(btc['change_percent']) > 5:
                 stories.append({
                     'type': 'crypto',
+                    'name': '비트코인',
                     'title': '비트코인 급변동',
                     'description': f"비트코인이 {btc['change_percent']:+.2f}% 변동",
                     'data': btc,
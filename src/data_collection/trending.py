@@ -0,0 +1,211 @@
+"""
+트렌딩 키워드 추적기 - 시간 감쇠 카운터를 실행 간 유지하며 새 기사만 증분 반영
+"""
+import heapq
+import json
+import os
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from loguru import logger
+
+
+# 한글 2글자 이상 단어 (모듈 로드 시 한 번만 컴파일)
+HANGUL_WORD_PATTERN = re.compile(r'[가-힣]{2,}')
+
+# 불용어 (간단한 예시)
+STOPWORDS = frozenset({'것으로', '있는', '하는', '되는', '대한', '관련', '위한', '통해', '때문에'})
+
+
+def extract_keywords(text: str) -> List[str]:
+    """텍스트에서 불용어를 제외한 한글 키워드 추출"""
+    return [word for word in HANGUL_WORD_PATTERN.findall(text) if word not in STOPWORDS]
+
+
+class TrendingTracker:
+    """
+    시간 감쇠 키워드 빈도를 유지하는 증분 트렌드 추적기
+    
+    점수는 반감기마다 절반으로 줄어듭니다. 모든 키워드가 같은 비율로 감쇠하므로
+    점수를 기준 시각(reference_time) 시점의 값으로 환산해 저장하면 순위가 시간에
+    따라 바뀌지 않습니다. 덕분에 최대 힙을 그대로 유지할 수 있어 상위 k개 조회가
+    O(k log n)입니다 (갱신된 키워드의 이전 힙 항목은 조회 시 지연 삭제).
+    
+    window_hours 동안 다시 등장하지 않은 키워드와 기사 링크는 정리됩니다.
+    """
+    
+    # 환산 점수가 float 범위를 넘지 않도록 기준 시각을 옮기는 지수 한계
+    MAX_EXPONENT = 512
+    
+    def __init__(
+        self,
+        state_path: str = 'data/cache/trending.json',
+        half_life_hours: float = 6,
+        window_hours: float = 24
+    ):
+        """
+        Args:
+            state_path: 상태 파일 경로
+            half_life_hours: 점수 반감기 (시간)
+            window_hours: 키워드/기사 보관 기간 (시간)
+        """
+        self.state_path = Path(state_path)
+        self.half_life = half_life_hours * 3600
+        self.window = window_hours * 3600
+        
+        self.reference_time = time.time()
+        # 키워드 → [기준 시각 환산 점수, 마지막 등장 시각]
+        self._scores: Dict[str, List[float]] = {}
+        # 반영한 기사 링크 → 반영 시각
+        self._seen: Dict[str, float] = {}
+        # (-환산 점수, 키워드) 최대 힙
+        self._heap: List[Tuple[float, str]] = []
+        
+        self._load()
+    
+    def _growth(self, now: float) -> float:
+        """now 시점의 1점을 기준 시각 환산 점수로 바꾸는 배율"""
+        return 2.0 ** ((now - self.reference_time) / self.half_life)
+    
+    def _rebase(self, now: float):
+        """기준 시각을 now로 옮기고 모든 점수를 재환산"""
+        factor = 1.0 / self._growth(now)
+        for entry in self._scores.values():
+            entry[0] *= factor
+        self.reference_time = now
+        self._rebuild_heap()
+    
+    def _rebuild_heap(self):
+        """현재 점수로 힙 재구성 (O(n))"""
+        self._heap = [(-entry[0], word) for word, entry in self._scores.items()]
+        heapq.heapify(self._heap)
+    
+    def _load(self):
+        """디스크에서 상태 로드 (보관 기간이 지난 항목 제외)"""
+        if not self.state_path.exists():
+            return
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"트렌딩 상태 로드 실패, 새로 시작: {e}")
+            return
+        
+        cutoff = time.time() - self.window
+        self.reference_time = state.get('reference_time', self.reference_time)
+        self._scores = {
+            word: entry for word, entry in state.get('keywords', {}).items()
+            if entry[1] >= cutoff
+        }
+        self._seen = {
+            link: seen_at for link, seen_at in state.get('seen', {}).items()
+            if seen_at >= cutoff
+        }
+        self._rebase(time.time())
+    
+    def save(self):
+        """디스크에 상태 저장"""
+        self._prune(time.time())
+        
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'reference_time': self.reference_time,
+                'keywords': self._scores,
+                'seen': self._seen
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+    
+    def _prune(self, now: float):
+        """보관 기간이 지난 키워드와 기사 링크 정리"""
+        cutoff = now - self.window
+        self._scores = {w: e for w, e in self._scores.items() if e[1] >= cutoff}
+        self._seen = {l: t for l, t in self._seen.items() if t >= cutoff}
+        
+        # 지연 삭제로 쌓인 힙 항목이 많으면 재구성
+        if len(self._heap) > 2 * len(self._scores) + 64:
+            self._rebuild_heap()
+    
+    def update(self, news_list: Iterable[Dict], now: float = None) -> int:
+        """
+        새 기사만 카운터에 반영 (이미 반영한 링크는 건너뜀)
+        
+        Args:
+            news_list: 뉴스 리스트 (title, summary, link)
+            now: 반영 시각 (기본: 현재 시각)
+        
+        Returns:
+            새로 반영한 기사 수
+        """
+        now = time.time() if now is None else now
+        if (now - self.reference_time) / self.half_life > self.MAX_EXPONENT:
+            self._rebase(now)
+        
+        counter = Counter()
+        added = 0
+        for news in news_list:
+            link = news.get('link', '')
+            if link and link in self._seen:
+                continue
+            if link:
+                self._seen[link] = now
+            counter.update(extract_keywords(news.get('title', '') + ' ' + news.get('summary', '')))
+            added += 1
+        
+        growth = self._growth(now)
+        for word, count in counter.items():
+            entry = self._scores.setdefault(word, [0.0, now])
+            entry[0] += count * growth
+            entry[1] = now
+            heapq.heappush(self._heap, (-entry[0], word))
+        
+        self._prune(now)
+        logger.info(f"트렌딩 추적기: 새 기사 {added}개, 키워드 {len(counter)}개 반영")
+        return added
+    
+    def score(self, word: str, now: float = None) -> float:
+        """키워드의 현재 감쇠 점수"""
+        entry = self._scores.get(word)
+        if not entry:
+            return 0.0
+        now = time.time() if now is None else now
+        return entry[0] / self._growth(now)
+    
+    def top_k(self, k: int = 10, now: float = None) -> List[Tuple[str, float]]:
+        """
+        현재 점수 기준 상위 k개 키워드
+        
+        Returns:
+            (키워드, 현재 감쇠 점수) 리스트 (점수 내림차순)
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self.window
+        growth = self._growth(now)
+        
+        result = []
+        valid = []
+        while self._heap and len(result) < k:
+            item = heapq.heappop(self._heap)
+            neg_score, word = item
+            entry = self._scores.get(word)
+            # 갱신 전 점수의 오래된 항목이거나 정리된 키워드면 버림
+            if entry is None or -neg_score != entry[0]:
+                continue
+            if entry[1] < cutoff:
+                del self._scores[word]
+                continue
+            valid.append(item)
+            result.append((word, entry[0] / growth))
+        
+        for item in valid:
+            heapq.heappush(self._heap, item)
+        return result
+    
+    def score_text(self, text: str, now: float = None) -> float:
+        """텍스트에 포함된 키워드의 트렌드 점수 합"""
+        now = time.time() if now is None else now
+        return sum(self.score(word, now) for word in set(extract_keywords(text)))
@@ -2,12 +2,130 @@
 AI 기반 Shorts 스크립트 자동 생성 모듈
 """
 import os
-from typing import Dict, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from openai import OpenAI
 from loguru import logger
 import yaml
 import json
 
+from src.script_generation.length_fitter import LengthFitter, SpeechRateModel
+from src.script_generation.response_cache import ResponseCache
+from src.script_generation.template_script import TemplateScriptEngine
+from src.utils.rate_limiter import TokenBucket
+from src.utils.text_splitter import SentenceSplitter, split_sentences
+
+
+# 스크립트 응답 필수 필드와 타입
+SCRIPT_FIELDS = {
+    'title': str,
+    'hook': str,
+    'script': str,
+    'key_points': list,
+    'hashtags': list,
+    'thumbnail_text': str,
+}
+
+
+def validate_script(script) -> Dict:
+    """스크립트 응답 스키마 검증 (실패 시 ValueError)"""
+    if not isinstance(script, dict):
+        raise ValueError(f"스크립트가 객체가 아님: {type(script).__name__}")
+    
+    for field, field_type in SCRIPT_FIELDS.items():
+        if not isinstance(script.get(field), field_type):
+            raise ValueError(f"'{field}' 필드 누락 또는 타입 오류")
+    
+    if not script['script'].strip():
+        raise ValueError("빈 스크립트")
+    
+    return script
+
+
+# 수집할 때마다 바뀌지만 스크립트 내용과 무관한 필드 (프롬프트와 응답 캐시 키에서 제외)
+VOLATILE_DATA_FIELDS = frozenset({'timestamp'})
+
+
+def format_prompt_data(data) -> str:
+    """프롬프트에 넣을 데이터 JSON (수집 시각 등 VOLATILE_DATA_FIELDS 제거)"""
+    def _strip(value):
+        if isinstance(value, dict):
+            return {k: _strip(v) for k, v in value.items() if k not in VOLATILE_DATA_FIELDS}
+        if isinstance(value, list):
+            return [_strip(v) for v in value]
+        return value
+    
+    return json.dumps(_strip(data), ensure_ascii=False, indent=2)
+
+
+def parse_script_response(content: str) -> Dict:
+    """단일 스크립트 JSON 응답 파싱 + 검증"""
+    return validate_script(json.loads(content))
+
+
+def parse_batch_response(content: str) -> List:
+    """배치 응답 파싱 ({"scripts": [...]} 형식만 확인, 항목 검증은 개별로)"""
+    response = json.loads(content)
+    scripts = response.get('scripts') if isinstance(response, dict) else None
+    if not isinstance(scripts, list):
+        raise ValueError("'scripts' 배열이 없는 배치 응답")
+    return scripts
+
+
+class JsonFieldStream:
+    """
+    스트리밍으로 도착하는 JSON 텍스트에서 특정 문자열 필드 값을 도착하는 대로 디코딩
+    
+    전체 응답을 기다리지 않고 "script" 필드 본문을 조각 단위로 꺼내기 위한 것입니다.
+    """
+    
+    ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+    
+    def __init__(self, field: str):
+        self._pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ''
+        self._pos = None  # 필드 값 안에서 다음에 읽을 위치 (필드를 찾기 전에는 None)
+        self.done = False
+    
+    def feed(self, chunk: str) -> str:
+        """응답 조각을 추가하고 새로 디코딩된 필드 값 반환"""
+        self._buffer += chunk
+        if self.done:
+            return ''
+        
+        if self._pos is None:
+            match = self._pattern.search(self._buffer)
+            if not match:
+                return ''
+            self._pos = match.end()
+        
+        buffer, i, decoded = self._buffer, self._pos, []
+        while i < len(buffer):
+            ch = buffer[i]
+            if ch == '"':
+                self.done = True
+                break
+            if ch == '\\':
+                # 이스케이프가 조각 경계에서 잘렸으면 다음 조각까지 대기
+                if i + 1 >= len(buffer):
+                    break
+                escape = buffer[i + 1]
+                if escape == 'u':
+                    if i + 6 > len(buffer):
+                        break
+                    decoded.append(chr(int(buffer[i + 2:i + 6], 16)))
+                    i += 6
+                    continue
+                decoded.append(self.ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            decoded.append(ch)
+            i += 1
+        
+        self._pos = i
+        return ''.join(decoded)
+
 
 class ScriptGenerator:
     """경제사냥꾼 스타일의 Shorts 스크립트 생성기"""
@@ -20,6 +138,115 @@ class ScriptGenerator:
             config = yaml.safe_load(f)
             self.script_config = config['script']
             self.video_config = config['video']
+            self.tts_provider = config.get('tts', {}).get('provider', 'default')
+        
+        # 동시 생성 설정
+        generation_config = self.script_config.get('generation', {})
+        self.concurrent = generation_config.get('concurrent', True)
+        self.max_in_flight = generation_config.get('max_in_flight', 3)
+        self.request_timeout = generation_config.get('request_timeout', 60)
+        
+        # 배치 생성 (여러 주제를 한 번의 요청으로)
+        self.batch = generation_config.get('batch', False)
+        self.batch_size = max(1, generation_config.get('batch_size', 3))
+        
+        # 분당 토큰 한도 (0이면 제한 없음)
+        tokens_per_minute = generation_config.get('tokens_per_minute', 30000)
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        
+        # 템플릿 스크립트 (LLM 실패 시 대체, prefer_for 유형은 LLM 없이 바로 생성)
+        template_config = self.script_config.get('template', {})
+        self.template_engine = TemplateScriptEngine()
+        self.template_fallback = template_config.get('fallback', True)
+        self.template_prefer_for = set(template_config.get('prefer_for', []))
+        
+        # 발화 속도 모델 (실제 TTS 결과로 초당 글자 수 보정) + 길이 보정
+        length_config = self.script_config.get('length', {})
+        self.speech_model = SpeechRateModel(
+            length_config.get('model_path', 'data/cache/speech_rate.json'),
+            default_cps=self.script_config.get('chars_per_second', 3.5),
+            window=length_config.get('window', 50),
+            min_samples=length_config.get('min_samples', 3)
+        )
+        self.calibrate_rate = length_config.get('calibrate', True)
+        self.length_fitter = None
+        if length_config.get('auto_trim', True):
+            self.length_fitter = LengthFitter(self.speech_model, self.tts_provider)
+        self.retry_off_length = length_config.get('retry_off_length', True)
+        
+        # 동일 요청 응답 캐시 (스케줄러 재시도/재실행 시 API 호출 생략)
+        cache_config = self.script_config.get('cache', {})
+        self.response_cache = None
+        if cache_config.get('enabled', True):
+            self.response_cache = ResponseCache(
+                cache_config.get('path', 'data/cache/llm'),
+                ttl_hours=cache_config.get('ttl_hours', 24),
+                max_entries=cache_config.get('max_entries', 500)
+            )
+    
+    def _wait_for_tokens(self, prompt_chars: int, max_tokens: int):
+        """요청 예상 토큰만큼 분당 한도 확보 (한국어는 대략 2자당 1토큰 이상으로 추정)"""
+        if self.token_bucket:
+            self.token_bucket.acquire(prompt_chars // 2 + max_tokens)
+    
+    @staticmethod
+    def _build_request(messages: List[Dict], max_tokens: int, temperature: float, json_mode: bool) -> Dict:
+        """채팅 완성 요청 파라미터 (캐시 키에도 사용)"""
+        request = {
+            'model': "gpt-4-turbo-preview",
+            'messages': messages,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+        }
+        if json_mode:
+            request['response_format'] = {"type": "json_object"}
+        return request
+    
+    def _chat(
+        self,
+        messages: List[Dict],
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool = False,
+        use_cache: bool = True,
+        parse: Optional[Callable[[str], object]] = None
+    ):
+        """
+        채팅 완성 요청 (응답 캐시, 분당 토큰 한도, 타임아웃 적용)
+        
+        Args:
+            messages: 채팅 메시지 리스트
+            max_tokens: 최대 응답 토큰
+            temperature: 샘플링 온도
+            json_mode: JSON 응답 형식 강제 여부
+            use_cache: False면 캐시를 읽지 않고 새로 요청 (결과는 캐시에 저장)
+            parse: 응답 변환 함수 - 예외 없이 변환된 응답만 캐시에 저장
+        
+        Returns:
+            응답 텍스트 (parse가 있으면 변환 결과)
+        """
+        request = self._build_request(messages, max_tokens, temperature, json_mode)
+        
+        key = None
+        if self.response_cache:
+            key = ResponseCache.make_key(request)
+            if use_cache:
+                content = self.response_cache.get(key)
+                if content is not None:
+                    logger.info("캐시된 LLM 응답 사용 (API 호출 생략)")
+                    return parse(content) if parse else content
+        
+        self._wait_for_tokens(sum(len(m['content']) for m in messages), max_tokens)
+        response = self.client.chat.completions.create(**request, timeout=self.request_timeout)
+        content = response.choices[0].message.content
+        
+        result = parse(content) if parse else content
+        if key:
+            try:
+                self.response_cache.put(key, content)
+            except Exception as e:
+                logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
+        return result
     
     def calculate_script_length(self, target_duration: int = None) -> tuple:
         """
@@ -37,6 +264,9 @@ class ScriptGenerator:
                 target_duration = self.video_config.get('duration', 60)
             
             chars_per_second = self.script_config.get('chars_per_second', 3.5)
+            if self.calibrate_rate:
+                # 과거 TTS 결과로 보정한 값 (0.1 단위로 반올림해 프롬프트 캐시 키를 안정적으로 유지)
+                chars_per_second = round(self.speech_model.chars_per_second(self.tts_provider), 1)
             
             # 여유분 10% 추가
             min_chars = int(target_duration * chars_per_second * 0.9)
@@ -56,7 +286,8 @@ class ScriptGenerator:
         topic: str, 
         data: Dict, 
         style='경제사냥꾼',
-        target_duration: int = None
+        target_duration: int = None,
+        use_cache: bool = True
     ) -> Dict:
         """
         주제와 데이터를 기반으로 Shorts 스크립트 생성
@@ -66,18 +297,245 @@ class ScriptGenerator:
             data: 관련 데이터 딕셔너리
             style: 스크립트 스타일
             target_duration: 목표 비디오 길이 (초). None이면 config 기본값 사용
+            use_cache: False면 캐시된 응답을 무시하고 새로 생성
+        
+        Returns:
+            생성된 스크립트 딕셔너리 (fit_length로 길이 보정, 'length_status' 포함)
+        """
+        system_prompt, user_prompt = self._build_prompts(topic, data, style, target_duration)
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        try:
+            result = self._chat(
+                messages,
+                max_tokens=1000,
+                temperature=0.8,
+                json_mode=True,
+                use_cache=use_cache,
+                parse=parse_script_response
+            )
+            logger.info(f"스크립트 생성 완료: {result['title']}")
+            
+            result = self.fit_length(result, target_duration)
+            if result.get('length_status') in ('short', 'long') and self.retry_off_length:
+                result = self._retry_length(messages, result, target_duration, use_cache)
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"스크립트 생성 실패: {e}")
+            return None
+    
+    def render_template(self, data: Dict, target_duration: int = None) -> Optional[Dict]:
+        """
+        시장 이슈 데이터를 템플릿으로 즉시 스크립트화 (지원하지 않는 데이터면 None)
+        
+        Args:
+            data: get_interesting_stories()의 이슈 딕셔너리
+            target_duration: 목표 비디오 길이 (초)
+        """
+        if not self.template_engine.supports(data):
+            return None
+        return self.template_engine.render(data, *self._script_spec(target_duration))
+    
+    def fit_length(self, script: Dict, target_duration: int = None) -> Dict:
+        """
+        생성된 스크립트를 목표 글자 수 범위에 맞춰 문장 단위로 자르고 예상 발화 시간 기록
+        
+        추가 LLM 호출 없이 로컬에서만 처리하며, auto_trim이 꺼져 있으면 그대로 반환합니다.
+        """
+        if not self.length_fitter or not script:
+            return script
+        min_length, max_length, actual_duration = self._script_spec(target_duration)
+        return self.length_fitter.fit(script, min_length, max_length, actual_duration)
+    
+    def _retry_length(
+        self,
+        messages: List[Dict],
+        script: Dict,
+        target_duration: int = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        잘라도 글자 수 범위를 벗어난 스크립트를 실제 글자 수를 알려주고 한 번 다시 생성
+        
+        다시 생성한 스크립트도 범위를 벗어나면 범위에 더 가까운 쪽을 반환합니다.
+        """
+        min_length, max_length, _ = self._script_spec(target_duration)
+        length = len(script['script'].strip())
+        logger.info(f"스크립트 길이 범위 벗어남 ({length}자, 범위 {min_length}-{max_length}자), 다시 생성")
+        
+        feedback = [
+            {"role": "assistant", "content": json.dumps(script, ensure_ascii=False)},
+            {"role": "user", "content": (
+                f"'script'가 {length}자입니다. 같은 JSON 형식으로 'script'를 "
+                f"반드시 {min_length}-{max_length}자로 다시 작성해주세요."
+            )}
+        ]
+        
+        try:
+            retried = self._chat(
+                messages + feedback,
+                max_tokens=1000,
+                temperature=0.8,
+                json_mode=True,
+                use_cache=use_cache,
+                parse=parse_script_response
+            )
+        except Exception as e:
+            logger.warning(f"길이 보정 재생성 실패, 기존 스크립트 사용: {e}")
+            return script
+        
+        retried = self.fit_length(retried, target_duration)
+        
+        def distance(candidate: Dict) -> int:
+            n = len(candidate['script'].strip())
+            return max(0, min_length - n, n - max_length)
+        
+        best = retried if distance(retried) <= distance(script) else script
+        if best.get('length_status') in ('short', 'long'):
+            logger.warning(f"재생성 후에도 길이 범위 벗어남 ({len(best['script'].strip())}자, "
+                           f"범위 {min_length}-{max_length}자)")
+        return best
+    
+    def record_speech(self, text: str, duration: float, provider: str = None):
+        """합성된 오디오 길이를 발화 속도 모델에 반영"""
+        self.speech_model.observe(text, duration, provider or self.tts_provider)
+    
+    def _prefers_template(self, data: Dict) -> bool:
+        """LLM을 건너뛰고 템플릿을 쓸 이슈 유형인지 여부"""
+        return data.get('type') in self.template_prefer_for and self.template_engine.supports(data)
+    
+    def stream_script(
+        self,
+        topic: str,
+        data: Dict,
+        on_sentence: Callable[[str], None],
+        style='경제사냥꾼',
+        target_duration: int = None,
+        use_cache: bool = True
+    ) -> Optional[Dict]:
+        """
+        스크립트를 스트리밍으로 생성하며 완성된 문장을 즉시 전달
+        
+        "script" 필드 본문이 도착하는 대로 문장 단위로 잘라 on_sentence를 호출하므로,
+        호출 측(TTS)이 전체 응답을 기다리지 않고 작업을 시작할 수 있습니다.
+        캐시된 응답이 있으면 API 호출 없이 문장을 바로 전달합니다.
+        
+        Args:
+            topic: 스크립트 주제
+            data: 관련 데이터 딕셔너리
+            on_sentence: 완성된 문장을 받을 콜백
+            style: 스크립트 스타일
+            target_duration: 목표 비디오 길이 (초)
+            use_cache: False면 캐시된 응답을 무시하고 새로 생성
         
         Returns:
-            생성된 스크립트 딕셔너리
+            생성된 스크립트 딕셔너리 (실패 시 None)
         """
+        if self._prefers_template(data):
+            result = self.render_template(data, target_duration)
+            for sentence in split_sentences(result['script']):
+                on_sentence(sentence)
+            return result
+        
+        system_prompt, user_prompt = self._build_prompts(topic, data, style, target_duration)
+        request = self._build_request(
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=1000,
+            temperature=0.8,
+            json_mode=True
+        )
+        
+        key = ResponseCache.make_key(request) if self.response_cache else None
+        
+        # 스트리밍 중 전달한 문장 (실패 시 템플릿 대체 가능 여부 판단용)
+        emitted = []
+        
+        def emit(sentence: str):
+            emitted.append(sentence)
+            on_sentence(sentence)
+        
+        try:
+            cached = self.response_cache.get(key) if key and use_cache else None
+            if cached is not None:
+                result = parse_script_response(cached)
+                logger.info("캐시된 LLM 응답 사용 (API 호출 생략)")
+                for sentence in split_sentences(result['script']):
+                    on_sentence(sentence)
+                return result
+            
+            self._wait_for_tokens(len(system_prompt) + len(user_prompt), 1000)
+            stream = self.client.chat.completions.create(
+                **request,
+                stream=True,
+                timeout=self.request_timeout
+            )
+            
+            field = JsonFieldStream('script')
+            splitter = SentenceSplitter()
+            chunks = []
+            flushed = False
+            
+            for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content or ''
+                chunks.append(delta)
+                
+                for sentence in splitter.feed(field.feed(delta)):
+                    emit(sentence)
+                
+                # 스크립트 필드가 끝나면 마지막 문장도 바로 전달 (나머지 필드는 계속 수신)
+                if field.done and not flushed:
+                    for sentence in splitter.flush():
+                        emit(sentence)
+                    flushed = True
+            
+            content = ''.join(chunks)
+            result = parse_script_response(content)
+            
+        except Exception as e:
+            logger.error(f"스트리밍 스크립트 생성 실패: {e}")
+            
+            # 아직 TTS로 넘긴 문장이 없을 때만 템플릿으로 대체 가능
+            result = self.render_template(data, target_duration) \
+                if not emitted and self.template_fallback else None
+            if result:
+                logger.info(f"스트리밍 실패 주제를 템플릿으로 대체: {topic}")
+                for sentence in split_sentences(result['script']):
+                    on_sentence(sentence)
+            return result
+        
+        if key:
+            try:
+                self.response_cache.put(key, content)
+            except Exception as e:
+                logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
         
+        logger.info(f"스트리밍 스크립트 생성 완료: {result['title']}")
+        return result
+    
+    def _script_spec(self, target_duration: int = None) -> Tuple[int, int, int]:
+        """(최소 글자 수, 최대 글자 수, 실제 목표 길이)"""
         # 목표 길이에 맞는 스크립트 길이 계산
         min_length, max_length = self.calculate_script_length(target_duration)
         
         # 실제 목표 길이
         actual_duration = target_duration or self.video_config.get('duration', 60)
         
-        system_prompt = f"""
+        return min_length, max_length, actual_duration
+    
+    @staticmethod
+    def _build_system_prompt(style: str, min_length: int, max_length: int, actual_duration: int) -> str:
+        """스크립트 작가 시스템 프롬프트"""
+        return f"""
 당신은 '{style}' 채널의 전문 경제 콘텐츠 작가입니다.
 
 # 채널 특성
@@ -99,24 +557,21 @@ class ScriptGenerator:
 - 말하듯이 자연스럽게 작성
 - 이모지 사용 금지 (영상에서 추가됨)
 """
-        
-        user_prompt = f"""
-다음 정보를 바탕으로 유튜브 Shorts 스크립트를 작성해주세요:
-
-주제: {topic}
-
-데이터:
-{json.dumps(data, ensure_ascii=False, indent=2)}
-
-요구사항:
+    
+    @staticmethod
+    def _requirements(min_length: int, max_length: int, actual_duration: int) -> str:
+        """사용자 프롬프트의 요구사항 목록"""
+        return f"""요구사항:
 - 정확히 {min_length}-{max_length}자 내외 (목표 길이: {actual_duration}초)
 - 첫 3초 안에 시청자의 시선을 사로잡을 것
 - 구체적인 숫자와 팩트 포함
 - 마지막에 구독 유도 멘트 자연스럽게 포함
-- 비디오 길이가 {actual_duration}초이므로 그에 맞는 정보량 조절
-
-JSON 형식으로 다음과 같이 반환:
-{{
+- 비디오 길이가 {actual_duration}초이므로 그에 맞는 정보량 조절"""
+    
+    @staticmethod
+    def _script_format(min_length: int, max_length: int, actual_duration: int) -> str:
+        """스크립트 JSON 응답 형식"""
+        return f"""{{
     "title": "영상 제목 (50자 이내)",
     "hook": "처음 3초 후킹 멘트",
     "script": "전체 스크립트 ({min_length}-{max_length}자)",
@@ -124,45 +579,206 @@ JSON 형식으로 다음과 같이 반환:
     "key_points": ["강조할 포인트 1", "강조할 포인트 2", "강조할 포인트 3"],
     "hashtags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
     "thumbnail_text": "썸네일에 들어갈 텍스트 (15자 이내)"
-}}
+}}"""
+    
+    def _build_prompts(
+        self,
+        topic: str,
+        data: Dict,
+        style: str,
+        target_duration: int = None
+    ) -> Tuple[str, str]:
+        """스크립트 생성용 (시스템 프롬프트, 사용자 프롬프트)"""
+        spec = self._script_spec(target_duration)
+        
+        system_prompt = self._build_system_prompt(style, *spec)
+        
+        user_prompt = f"""
+다음 정보를 바탕으로 유튜브 Shorts 스크립트를 작성해주세요:
+
+주제: {topic}
+
+데이터:
+{format_prompt_data(data)}
+
+{self._requirements(*spec)}
+
+JSON 형식으로 다음과 같이 반환:
+{self._script_format(*spec)}
+"""
+        return system_prompt, user_prompt
+    
+    def _build_batch_prompts(
+        self,
+        items: List[Dict],
+        style: str,
+        target_duration: int = None
+    ) -> Tuple[str, str]:
+        """여러 주제를 한 번에 요청하는 (시스템 프롬프트, 사용자 프롬프트)"""
+        spec = self._script_spec(target_duration)
+        
+        system_prompt = self._build_system_prompt(style, *spec)
+        
+        topics = '\n\n'.join(
+            f"[{i}] 주제: {item['topic']}\n\n데이터:\n{format_prompt_data(item['data'])}"
+            for i, item in enumerate(items, 1)
+        )
+        
+        user_prompt = f"""
+다음 {len(items)}개 주제 각각에 대해 유튜브 Shorts 스크립트를 작성해주세요:
+
+{topics}
+
+{self._requirements(*spec)}
+- 주제마다 독립된 스크립트를 작성하고, 주제 번호 순서대로 반환
+
+JSON 형식으로 다음과 같이 반환 ("scripts" 배열에 주제 순서대로 {len(items)}개):
+{{"scripts": [
+{self._script_format(*spec)}
+]}}
 """
+        return system_prompt, user_prompt
+    
+    def generate_batch(
+        self,
+        items: List[Dict],
+        style='경제사냥꾼',
+        target_duration: int = None,
+        use_cache: bool = True
+    ) -> List[Optional[Dict]]:
+        """
+        여러 주제의 스크립트를 한 번의 요청으로 생성
+        
+        Args:
+            items: 주제/데이터 리스트
+            style: 스크립트 스타일
+            target_duration: 목표 비디오 길이 (초)
+            use_cache: False면 캐시된 응답을 무시하고 새로 생성
+        
+        Returns:
+            입력 순서대로의 스크립트 리스트 (검증에 실패한 항목은 None)
+        """
+        system_prompt, user_prompt = self._build_batch_prompts(items, style, target_duration)
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
+            scripts = self._chat(
+                [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                response_format={"type": "json_object"},
+                max_tokens=min(4096, 1000 * len(items)),
                 temperature=0.8,
-                max_tokens=1000
+                json_mode=True,
+                use_cache=use_cache,
+                parse=parse_batch_response
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            logger.info(f"스크립트 생성 완료: {result['title']}")
-            
-            return result
-            
         except Exception as e:
-            logger.error(f"스크립트 생성 실패: {e}")
-            return None
+            logger.error(f"배치 스크립트 생성 실패: {e}")
+            return [None] * len(items)
+        
+        results = []
+        for i in range(len(items)):
+            try:
+                if i >= len(scripts):
+                    raise ValueError("응답 항목 누락")
+                results.append(validate_script(scripts[i]))
+            except ValueError as e:
+                logger.warning(f"배치 항목 {i + 1}/{len(items)} 검증 실패: {e}")
+                results.append(None)
+        
+        logger.info(f"배치 스크립트 생성: {sum(r is not None for r in results)}/{len(items)}개 성공")
+        return results
     
-    def generate_multiple_scripts(self, topics_data: List[Dict], count=3) -> List[Dict]:
-        """여러 개의 스크립트를 생성"""
-        scripts = []
+    def generate_multiple_scripts(
+        self,
+        topics_data: List[Dict],
+        count=3,
+        concurrent: bool = None,
+        use_cache: bool = True,
+        batch: bool = None
+    ) -> List[Dict]:
+        """
+        여러 개의 스크립트를 생성
+        
+        배치 모드에서는 batch_size개 주제를 한 번의 요청으로 생성하고,
+        검증에 실패한 항목만 개별 요청으로 다시 생성합니다.
+        
+        Args:
+            topics_data: 주제/데이터 리스트
+            count: 생성할 최대 개수
+            concurrent: 동시 생성 여부 (None이면 config 설정 사용)
+            use_cache: False면 캐시된 응답을 무시하고 새로 생성
+            batch: 배치 생성 여부 (None이면 config 설정 사용)
         
-        for i, item in enumerate(topics_data[:count], 1):
-            logger.info(f"스크립트 {i}/{count} 생성 중...")
-            script = self.generate_script(item['topic'], item['data'])
+        Returns:
+            입력 순서대로 정렬된 스크립트 리스트 (실패한 주제는 제외)
+        """
+        if concurrent is None:
+            concurrent = self.concurrent
+        if batch is None:
+            batch = self.batch
+        
+        items = topics_data[:count]
+        
+        # prefer_for 유형은 템플릿으로 바로 생성하고 나머지만 LLM에 요청
+        results = [
+            self.render_template(item['data']) if self._prefers_template(item['data']) else None
+            for item in items
+        ]
+        pending = [i for i, script in enumerate(results) if script is None]
+        llm_items = [items[i] for i in pending]
+        
+        if batch and len(llm_items) > 1:
+            llm_results = []
+            for start in range(0, len(llm_items), self.batch_size):
+                llm_results.extend(
+                    self.generate_batch(llm_items[start:start + self.batch_size], use_cache=use_cache)
+                )
             
+            failed = [i for i, script in enumerate(llm_results) if script is None]
+            if failed:
+                logger.info(f"배치 실패 항목 {len(failed)}개 개별 생성으로 대체")
+                retried = self._generate_each([llm_items[i] for i in failed], concurrent, use_cache)
+                for i, script in zip(failed, retried):
+                    llm_results[i] = script
+        else:
+            llm_results = self._generate_each(llm_items, concurrent, use_cache)
+        
+        for i, script in zip(pending, llm_results):
+            # LLM 실패 시 템플릿으로 대체 (지원하지 않는 주제는 제외)
+            if script is None and self.template_fallback:
+                script = self.render_template(items[i]['data'])
+                if script:
+                    logger.info(f"LLM 실패 주제를 템플릿으로 대체: {items[i]['topic']}")
+            results[i] = script
+        
+        scripts = []
+        for item, script in zip(items, results):
             if script:
+                script = self.fit_length(script)
                 script['source_data'] = item
                 scripts.append(script)
         
         logger.info(f"총 {len(scripts)}개 스크립트 생성 완료")
         return scripts
     
+    def _generate_each(self, items: List[Dict], concurrent: bool, use_cache: bool) -> List[Optional[Dict]]:
+        """주제별 개별 요청으로 생성 (입력 순서대로 반환, 실패는 None)"""
+        def _generate(indexed_item):
+            i, item = indexed_item
+            logger.info(f"스크립트 {i}/{len(items)} 생성 중...")
+            return self.generate_script(item['topic'], item['data'], use_cache=use_cache)
+        
+        if concurrent and len(items) > 1:
+            # 동시 요청 수는 max_in_flight로 제한, map은 입력 순서대로 결과 반환
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_in_flight, len(items))),
+                thread_name_prefix='script'
+            ) as executor:
+                return list(executor.map(_generate, enumerate(items, 1)))
+        
+        return [_generate(indexed_item) for indexed_item in enumerate(items, 1)]
+    
     def refine_script(self, script: str, feedback: str) -> str:
         """스크립트 개선"""
         
@@ -179,14 +795,11 @@ JSON 형식으로 다음과 같이 반환:
 """
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=500
+            refined = self._chat(
+                [{"role": "user", "content": prompt}],
+                max_tokens=500,
+                temperature=0.7
             )
-            
-            refined = response.choices[0].message.content
             logger.info("스크립트 개선 완료")
             return refined
             
@@ -0,0 +1,177 @@
+"""
+스크립트 길이 보정 모듈 - 문장 단위 자르기 + 실제 TTS 결과로 보정한 발화 속도 모델
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+from src.utils.text_splitter import split_sentences
+
+
+class SpeechRateModel:
+    """
+    TTS 제공자별 초당 글자 수를 과거 합성 결과로 추정하는 모델
+    
+    최근 window개 관측의 (글자 수 합 / 재생 시간 합)을 사용하므로 짧은 문장 하나가
+    추정치를 크게 흔들지 않습니다. 관측이 min_samples개 미만이면 기본값을 씁니다.
+    """
+    
+    def __init__(
+        self,
+        model_path: str = 'data/cache/speech_rate.json',
+        default_cps: float = 3.5,
+        window: int = 50,
+        min_samples: int = 3
+    ):
+        """
+        Args:
+            model_path: 관측 기록 파일 경로
+            default_cps: 관측이 부족할 때 사용할 초당 글자 수
+            window: 추정에 사용할 최근 관측 수
+            min_samples: 추정치를 사용하기 위한 최소 관측 수
+        """
+        self.model_path = Path(model_path)
+        self.default_cps = default_cps
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        # 제공자 → [[글자 수, 재생 시간(초)], ...]
+        self._observations: Dict[str, List[List[float]]] = self._load()
+    
+    def _load(self) -> Dict[str, List[List[float]]]:
+        """디스크에서 관측 기록 로드"""
+        if not self.model_path.exists():
+            return {}
+        
+        try:
+            with open(self.model_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"발화 속도 모델 로드 실패, 기본값 사용: {e}")
+            return {}
+    
+    def _save(self):
+        """관측 기록 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.model_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.model_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._observations, f)
+        os.replace(tmp_path, self.model_path)
+    
+    @staticmethod
+    def count_chars(text: str) -> int:
+        """스크립트 길이 범위와 같은 기준의 글자 수 (앞뒤 공백 제외)"""
+        return len(text.strip())
+    
+    def observe(self, text: str, duration: float, provider: str = 'default'):
+        """합성된 오디오 길이를 관측으로 기록"""
+        chars = self.count_chars(text)
+        if chars == 0 or duration <= 0:
+            return
+        
+        with self._lock:
+            history = self._observations.setdefault(provider, [])
+            history.append([chars, round(duration, 3)])
+            del history[:-self.window]
+            
+            try:
+                self._save()
+            except Exception as e:
+                logger.warning(f"발화 속도 모델 저장 실패: {e}")
+        
+        logger.info(f"발화 속도 관측 ({provider}): {chars}자 / {duration:.1f}초 → "
+                    f"추정 {self.chars_per_second(provider):.2f}자/초")
+    
+    def chars_per_second(self, provider: str = 'default') -> float:
+        """제공자의 추정 초당 글자 수"""
+        history = self._observations.get(provider, [])
+        if len(history) < self.min_samples:
+            return self.default_cps
+        
+        chars = sum(c for c, _ in history)
+        seconds = sum(s for _, s in history)
+        return chars / seconds if seconds > 0 else self.default_cps
+    
+    def predict_duration(self, text: str, provider: str = 'default') -> float:
+        """텍스트의 예상 발화 시간 (초)"""
+        return self.count_chars(text) / self.chars_per_second(provider)
+
+
+def fit_to_length(text: str, min_length: int, max_length: int) -> Tuple[str, str]:
+    """
+    스크립트를 문장 경계에서 잘라 max_length 이하로 맞춤
+    
+    첫 문장(후킹)과 마지막 문장(CTA)은 유지하고, 그 사이 본문을 뒤에서부터 뺍니다.
+    모자란 길이는 LLM 없이 채울 수 없으므로 그대로 두고 상태만 알려줍니다.
+    
+    Returns:
+        (보정된 스크립트, 상태) - 상태는 'ok', 'trimmed', 'short', 'long' 중 하나
+    """
+    length = len(text.strip())
+    if length < min_length:
+        return text, 'short'
+    if length <= max_length:
+        return text, 'ok'
+    
+    sentences = split_sentences(text)
+    if len(sentences) <= 2:
+        return text, 'long'
+    
+    head, body, tail = sentences[0], sentences[1:-1], sentences[-1]
+    while body and len(' '.join([head] + body + [tail])) > max_length:
+        body.pop()
+    
+    fitted = ' '.join([head] + body + [tail])
+    if len(fitted) > max_length:
+        return fitted, 'long'
+    if len(fitted) < min_length:
+        # 자르면 최소 길이보다 짧아지는 경우: 최소 길이를 넘는 가장 짧은 버전 선택
+        body = sentences[1:-1]
+        while body and len(' '.join([head] + body[:-1] + [tail])) >= min_length:
+            body.pop()
+        fitted = ' '.join([head] + body + [tail])
+        return fitted, 'trimmed' if len(fitted) <= max_length else 'long'
+    
+    return fitted, 'trimmed'
+
+
+class LengthFitter:
+    """생성된 스크립트 딕셔너리의 길이를 검사하고 보정"""
+    
+    def __init__(self, speech_model: SpeechRateModel, provider: str = 'default'):
+        """
+        Args:
+            speech_model: 발화 속도 모델
+            provider: 예상 발화 시간을 계산할 TTS 제공자
+        """
+        self.speech_model = speech_model
+        self.provider = provider
+    
+    def fit(self, script: Dict, min_length: int, max_length: int, target_duration: Optional[float] = None) -> Dict:
+        """
+        스크립트 본문을 글자 수 범위에 맞추고 예상 발화 시간을 기록
+        
+        Returns:
+            'script'가 보정되고 'length_status', 'estimated_duration'이 추가된 딕셔너리
+        """
+        original = script['script']
+        fitted, status = fit_to_length(original, min_length, max_length)
+        
+        script['script'] = fitted
+        script['length_status'] = status
+        script['estimated_duration'] = round(self.speech_model.predict_duration(fitted, self.provider), 1)
+        
+        if status == 'trimmed':
+            logger.info(f"스크립트 길이 보정: {len(original)}자 → {len(fitted)}자 "
+                        f"(범위 {min_length}-{max_length}자)")
+        elif status != 'ok':
+            logger.warning(f"스크립트 길이 범위 벗어남 ({status}): {len(fitted)}자 "
+                           f"(범위 {min_length}-{max_length}자)")
+        
+        if target_duration:
+            logger.info(f"예상 발화 시간 {script['estimated_duration']}초 (목표 {target_duration}초)")
+        
+        return script
@@ -0,0 +1,95 @@
+"""
+LLM 응답 캐시 - 요청 내용 해시를 키로 하는 디스크 캐시 (TTL, 개수 제한)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from loguru import logger
+
+
+class ResponseCache:
+    """
+    모델/프롬프트/파라미터가 같은 요청의 응답을 재사용하는 캐시
+    
+    항목마다 `<sha256>.json` 파일 하나로 저장하며, 개수가 max_entries를 넘으면
+    가장 오래된 항목부터 삭제합니다.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: str = 'data/cache/llm',
+        ttl_hours: float = 24,
+        max_entries: int = 500
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            ttl_hours: 항목 유효 기간 (시간)
+            max_entries: 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(request: Dict) -> str:
+        """요청 딕셔너리(모델, 메시지, 파라미터)의 내용 해시"""
+        payload = json.dumps(request, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """키에 해당하는 캐시 파일 경로"""
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (없거나 만료되면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"LLM 캐시 항목 로드 실패: {e}")
+            return None
+        
+        if time.time() - entry['created_at'] > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        
+        return entry['response']
+    
+    def put(self, key: str, response: str):
+        """응답 저장 후 개수 제한 초과분 정리"""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': time.time(), 'response': response}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        
+        self._evict()
+    
+    def _evict(self):
+        """만료 항목과 max_entries를 넘는 오래된 항목 삭제"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+            
+            cutoff = time.time() - self.ttl
+            entries.sort()
+            excess = len(entries) - self.max_entries
+            
+            for i, (mtime, path) in enumerate(entries):
+                if i < excess or mtime < cutoff:
+                    path.unlink(missing_ok=True)
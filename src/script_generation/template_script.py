@@ -0,0 +1,247 @@
+"""
+템플릿 기반 스크립트 생성 모듈 - 시장 이슈 데이터로 LLM 없이 즉시 스크립트 작성
+"""
+import hashlib
+from typing import Dict, List, Optional
+from loguru import logger
+
+
+# 숫자/영문으로 끝나는 단어의 받침 (한국어로 읽었을 때 기준, 한글 종성 인덱스: 0 없음, 8 ㄹ)
+DIGIT_FINALS = {'0': 21, '1': 8, '2': 0, '3': 16, '4': 0, '5': 0, '6': 1, '7': 8, '8': 8, '9': 0}
+LATIN_FINALS = {'l': 8, 'r': 8, 'm': 16, 'n': 4}
+
+
+def _final_consonant(word: str) -> int:
+    """
+    마지막 글자의 받침 (한글 종성 인덱스)
+    
+    한글이 아니면 숫자는 한국어 읽기, 영문은 끝 자음(l, m, n, r)으로 근사합니다.
+    """
+    word = word.rstrip(' .,%)')
+    if not word:
+        return 0
+    ch = word[-1]
+    if '가' <= ch <= '힣':
+        return (ord(ch) - ord('가')) % 28
+    if ch.isdigit():
+        return DIGIT_FINALS[ch]
+    return LATIN_FINALS.get(ch.lower(), 0)
+
+
+def josa(word: str, with_final: str, without_final: str) -> str:
+    """받침에 맞는 조사를 붙인 단어 (으로/로는 ㄹ 받침이면 '로')"""
+    final = _final_consonant(word)
+    if with_final == '으로' and final == 8:
+        return word + without_final
+    return word + (with_final if final else without_final)
+
+
+def format_korean_number(value: float) -> str:
+    """큰 숫자를 읽기 쉬운 한국식 단위로 표기 (예: 58500000 → 5,850만)"""
+    value = abs(value)
+    if value >= 1e8:
+        eok, man = divmod(int(round(value / 1e4)), 10000)
+        return f"{eok:,}억 {man:,}만" if man else f"{eok:,}억"
+    if value >= 1e6:
+        return f"{int(round(value / 1e4)):,}만"
+    return f"{value:,.0f}"
+
+
+def format_price(symbol: str, price: float) -> str:
+    """심볼 종류에 맞는 가격 표기"""
+    if symbol.startswith('^'):
+        return f"{price:,.2f}포인트"
+    if symbol == 'KRW=X':
+        return f"{price:,.1f}원"
+    if symbol.endswith(('.KS', '.KQ')):
+        return f"{format_korean_number(price)}원"
+    if symbol.endswith('-USD'):
+        return f"{price:,.0f}달러"
+    return f"{price:,.2f}"
+
+
+class TemplateScriptEngine:
+    """
+    StockDataCollector 시장 이슈(big_move, forex, crypto)를 스크립트 딕셔너리로 렌더링
+    
+    후킹/핵심/CTA 문장은 항상 넣고, 목표 글자 수에 닿을 때까지 보충 문장을
+    우선순위대로 추가합니다. 문장 변형은 이슈 내용의 해시로 고르므로 같은 입력에는
+    항상 같은 스크립트가 나옵니다.
+    """
+    
+    HOOKS = {
+        'big_move': [
+            "{name}, 오늘 하루에만 {pct} {surge}했습니다. 무슨 일이 있었던 걸까요?",
+            "하루 만에 {pct} {surge}! 지금 {name}에 무슨 일이 벌어지고 있을까요?",
+        ],
+        'forex': [
+            "달러/원 환율이 하루 새 {pct} {move}했습니다. 내 지갑에는 어떤 영향이 있을까요?",
+            "환율이 크게 움직였습니다. 하루 만에 {pct} {move}, 무슨 의미일까요?",
+        ],
+        'crypto': [
+            "{name_i} 하루 만에 {pct} {surge}했습니다! 지금 들어가도 될까요?",
+            "24시간 만에 {pct}! {name} 시장이 요동치고 있습니다.",
+        ],
+    }
+    
+    CORE = {
+        'big_move': "{name_eun} 현재 {price_ro}, 전일보다 {pct} {move}했습니다.",
+        'forex': "현재 환율은 1달러에 {price_ro}, 전일보다 {pct} {move}했습니다.",
+        'crypto': "현재 {name} 가격은 {price_ro}, 전일보다 {pct} {move}했습니다.",
+    }
+    
+    # 보충 문장 (앞에 있을수록 우선, 방향별 문장은 up/down 키로 구분)
+    DETAILS = {
+        'big_move': [
+            {'up': "매수세가 한꺼번에 몰리면서 가격이 빠르게 뛰어올랐습니다.",
+             'down': "매도 물량이 한꺼번에 쏟아지면서 가격이 빠르게 밀렸습니다."},
+            "하루에 {pct} 움직이는 것은 흔하지 않은 큰 변동입니다.",
+            "이런 급등락 뒤에는 한동안 변동성이 커지는 경우가 많습니다.",
+            {'up': "단기 급등 뒤에는 차익 실현 매물이 나올 수 있다는 점도 기억해야 합니다.",
+             'down': "급락 뒤에는 저가 매수세가 들어오며 반등이 나오기도 합니다."},
+            "관련 업종과 시장 전체 흐름을 함께 확인하는 것이 중요합니다.",
+            "하루 움직임만 보고 추격 매수하거나 공포에 파는 것은 위험할 수 있습니다.",
+            "분할 매수와 분할 매도로 위험을 나누는 전략도 고려해 보세요.",
+        ],
+        'forex': [
+            {'up': "환율이 오르면 수입 물가와 해외여행 비용이 함께 올라갑니다.",
+             'down': "환율이 내리면 수입 물가와 해외여행 비용 부담이 줄어듭니다."},
+            {'up': "반대로 수출 기업들은 가격 경쟁력이 높아지는 효과를 누립니다.",
+             'down': "반대로 수출 기업들은 가격 경쟁력이 다소 떨어질 수 있습니다."},
+            "환율 변화는 외국인 투자자의 국내 증시 자금 흐름에도 영향을 줍니다.",
+            "미국 금리와 달러 강세 흐름이 환율의 가장 큰 변수입니다.",
+            "해외 주식 투자자라면 환차익과 환차손도 함께 따져봐야 합니다.",
+            "달러 자산 비중을 한 번에 바꾸기보다 나눠서 조절하는 것이 좋습니다.",
+        ],
+        'crypto': [
+            {'up': "매수 주문이 몰리면서 가격이 단숨에 뛰어올랐습니다.",
+             'down': "매도 주문이 쏟아지면서 가격이 단숨에 밀렸습니다."},
+            "암호화폐는 24시간 거래되기 때문에 변동성이 특히 큽니다.",
+            "다른 알트코인들도 비트코인 흐름을 따라 크게 움직이는 경우가 많습니다.",
+            "레버리지 투자는 작은 변동에도 큰 손실로 이어질 수 있어 주의가 필요합니다.",
+            "투자한다면 감당할 수 있는 금액 안에서 나눠서 접근하는 것이 좋습니다.",
+            "거래소별 시세 차이와 수수료도 꼭 확인해 보세요.",
+        ],
+    }
+    
+    # 유형 공통 보충 문장 (유형별 문장 다음 순위)
+    COMMON_DETAILS = [
+        "중요한 것은 하루의 숫자보다 그 뒤에 있는 흐름입니다.",
+        "투자 결정은 언제나 본인의 판단과 책임 아래 신중하게 내리셔야 합니다.",
+        "여러분은 이번 움직임을 어떻게 보시나요? 댓글로 의견을 남겨주세요.",
+    ]
+    
+    CTA = "앞으로의 흐름이 궁금하다면 구독과 좋아요 눌러주세요!"
+    
+    TITLES = {
+        'big_move': "{name} 하루 {pct} {surge}! 무슨 일이?",
+        'forex': "환율 {pct} {move}, 내 지갑에 미치는 영향",
+        'crypto': "{name} {pct} {surge}! 지금 사도 될까?",
+    }
+    
+    HASHTAGS = {
+        'big_move': ['주식', '증시', '경제뉴스'],
+        'forex': ['환율', '달러', '경제뉴스'],
+        'crypto': ['비트코인', '암호화폐', '코인'],
+    }
+    
+    def supports(self, story: Dict) -> bool:
+        """템플릿으로 렌더링할 수 있는 이슈인지 여부"""
+        return story.get('type') in self.CORE and isinstance(story.get('data'), dict)
+    
+    def render(
+        self,
+        story: Dict,
+        min_length: int,
+        max_length: int,
+        duration: int
+    ) -> Optional[Dict]:
+        """
+        시장 이슈를 스크립트 딕셔너리로 렌더링
+        
+        Args:
+            story: get_interesting_stories()의 이슈 딕셔너리
+            min_length: 최소 글자 수
+            max_length: 최대 글자 수
+            duration: 목표 비디오 길이 (초)
+        
+        Returns:
+            generate_script와 같은 형식의 스크립트 딕셔너리 (지원하지 않는 이슈면 None)
+        """
+        if not self.supports(story):
+            return None
+        
+        kind = story['type']
+        quote = story['data']
+        change_percent = quote.get('change_percent', 0.0)
+        up = change_percent >= 0
+        
+        name = story.get('name') or story.get('title', '').rsplit(' ', 1)[0]
+        price = format_price(quote.get('symbol', ''), quote.get('current_price', 0.0))
+        values = {
+            'name': name,
+            'name_i': josa(name, '이', '가'),
+            'name_eun': josa(name, '은', '는'),
+            'price_ro': josa(price, '으로', '로'),
+            'pct': f"{abs(change_percent):.2f}%",
+            'move': '상승' if up else '하락',
+            'surge': '급등' if up else '급락',
+        }
+        
+        # 같은 이슈에는 항상 같은 변형을 고르도록 내용 해시 사용
+        seed = int(hashlib.md5(f"{kind}:{values['name']}:{values['move']}".encode('utf-8')).hexdigest(), 16)
+        
+        hook = self.HOOKS[kind][seed % len(self.HOOKS[kind])].format(**values)
+        core = self.CORE[kind].format(**values)
+        
+        details = []
+        for detail in self.DETAILS[kind] + self.COMMON_DETAILS:
+            if isinstance(detail, dict):
+                detail = detail['up' if up else 'down']
+            details.append(detail.format(**values))
+        
+        sentences = self._fit(hook, core, details, self.CTA, min_length, max_length)
+        script = ' '.join(sentences)
+        
+        if len(script) < min_length:
+            logger.warning(f"템플릿 스크립트가 목표보다 짧습니다 ({len(script)}자 < {min_length}자)")
+        
+        sign = '+' if up else '-'
+        result = {
+            'title': self.TITLES[kind].format(**values)[:50],
+            'hook': hook,
+            'script': script,
+            'duration': duration,
+            'key_points': [core] + details[:2],
+            'hashtags': list(dict.fromkeys(
+                [name.replace('/', '').replace(' ', '')] + self.HASHTAGS[kind] + ['Shorts']
+            )),
+            'thumbnail_text': f"{values['name']} {sign}{abs(change_percent):.1f}%"[:15],
+            'generated_by': 'template',
+        }
+        
+        logger.info(f"템플릿 스크립트 생성 완료: {result['title']} ({len(script)}자)")
+        return result
+    
+    @staticmethod
+    def _fit(
+        hook: str,
+        core: str,
+        details: List[str],
+        cta: str,
+        min_length: int,
+        max_length: int
+    ) -> List[str]:
+        """필수 문장에 보충 문장을 우선순위대로 추가 (max_length를 넘지 않는 선에서 min_length까지)"""
+        body = []
+        length = len(hook) + len(core) + len(cta) + 2
+        
+        for detail in details:
+            if length >= min_length:
+                break
+            if length + len(detail) + 1 > max_length:
+                continue
+            body.append(detail)
+            length += len(detail) + 1
+        
+        return [hook, core] + body + [cta]
@@ -0,0 +1,108 @@
+"""
+TTS 오디오 캐시 - (제공자, 목소리 설정, 정규화된 문장) 해시를 키로 하는 문장 단위 디스크 캐시
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict
+from loguru import logger
+
+from src.tts.timing import timing_path
+
+
+def normalize_sentence(text: str) -> str:
+    """캐시 키용 문장 정규화 (유니코드 NFC, 연속 공백 하나로)"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class AudioCache:
+    """
+    한 번 합성한 문장 오디오를 재사용하는 캐시
+    
+    항목마다 `<sha256>.<형식>` 파일 하나로 저장하며, 조회될 때마다 수정 시각을 갱신해
+    개수가 max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 삭제합니다.
+    """
+    
+    def __init__(self, cache_dir: str = 'data/cache/tts', max_entries: int = 2000):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_entries: 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(provider: str, voice: Dict, text: str) -> str:
+        """제공자, 목소리 설정(목소리/속도/음높이 등), 정규화된 문장의 내용 해시"""
+        payload = json.dumps(
+            {'provider': provider, 'voice': voice, 'text': normalize_sentence(text)},
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    # 캐시하는 오디오 형식
+    SUFFIXES = ('.mp3', '.wav')
+    
+    def _path(self, key: str, suffix: str) -> Path:
+        """키와 형식에 해당하는 캐시 파일 경로"""
+        return self.cache_dir / f"{key}{suffix.lower()}"
+    
+    def get(self, key: str, output_path: str) -> bool:
+        """캐시된 오디오(와 타이밍 사이드카)를 output_path로 복사 (없으면 False)"""
+        path = self._path(key, Path(output_path).suffix)
+        try:
+            shutil.copyfile(path, output_path)
+            os.utime(path)
+            if timing_path(path).exists():
+                shutil.copyfile(timing_path(path), timing_path(output_path))
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"TTS 캐시 항목 로드 실패: {e}")
+            return False
+    
+    def put(self, key: str, source_path: str):
+        """합성된 오디오 파일(과 타이밍 사이드카) 저장 후 개수 제한 초과분 정리"""
+        path = self._path(key, Path(source_path).suffix)
+        tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        
+        # 제공자 타임포인트가 있으면 함께 보관해 재사용할 때도 실제 단어 시각 유지
+        if timing_path(source_path).exists():
+            shutil.copyfile(timing_path(source_path), tmp_path)
+            os.replace(tmp_path, timing_path(path))
+        
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, path)
+        
+        self._evict()
+    
+    def _evict(self):
+        """max_entries를 넘는 오래된 항목 삭제"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.iterdir():
+                if path.suffix not in self.SUFFIXES:
+                    continue
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+            
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+            
+            entries.sort()
+            for _, path in entries[:excess]:
+                path.unlink(missing_ok=True)
+                timing_path(path).unlink(missing_ok=True)
@@ -0,0 +1,328 @@
+"""
+오디오 파일 유틸리티 - 길이 측정, 여러 파일 이어 붙이기, 샘플 배열 저장
+"""
+import wave
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+from loguru import logger
+from moviepy.audio.AudioClip import AudioArrayClip
+from moviepy.editor import AudioFileClip, concatenate_audioclips
+
+
+# MPEG Layer III 프레임 헤더 테이블 (kbps, Hz)
+MP3_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _mp3_info_frame(data: bytes, pos: int, mpeg1: bool) -> Optional[Tuple[int, int]]:
+    """
+    pos의 프레임이 Xing/Info 정보 프레임이면 LAME 태그의 (인코더 지연, 패딩) 샘플 수 반환
+    
+    정보 프레임은 소리가 없는 메타데이터 프레임이므로 길이에 포함하지 않으며,
+    LAME 태그가 없으면 (0, 0)을 반환합니다. 일반 오디오 프레임이면 None.
+    """
+    mono = (data[pos + 3] >> 6) == 3
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    tag = pos + 4 + side_info
+    if data[tag:tag + 4] not in (b'Xing', b'Info'):
+        return None
+    
+    # 플래그에 따라 프레임 수/바이트 수/TOC/품질 필드가 있으면 그만큼 건너뛴 위치가 LAME 태그
+    flags = int.from_bytes(data[tag + 4:tag + 8], 'big')
+    lame = tag + 8 + 4 * bool(flags & 1) + 4 * bool(flags & 2) + 100 * bool(flags & 4) + 4 * bool(flags & 8)
+    if len(data) < lame + 24:
+        return 0, 0
+    
+    gapless = data[lame + 21:lame + 24]
+    return (gapless[0] << 4) | (gapless[1] >> 4), ((gapless[1] & 0x0F) << 8) | gapless[2]
+
+
+def _mp3_info(data: bytes) -> Optional[Tuple[int, float]]:
+    """
+    MP3 프레임 헤더를 따라가며 (샘플레이트, 길이) 계산 (Layer III가 아니면 None)
+    
+    디코더를 띄우지 않고 헤더만 읽으므로 조각마다 ffmpeg를 실행하는 것보다 훨씬 빠릅니다.
+    Xing/Info 정보 프레임은 세지 않고, LAME 태그의 인코더 지연/패딩은 길이에서 뺍니다.
+    """
+    data = _mp3_frames(data)
+    pos = 0
+    frames = 0
+    trimmed = 0  # 정보 프레임의 인코더 지연 + 패딩 (샘플)
+    sample_rate = None
+    samples_per_frame = 1152
+    
+    while pos + 4 <= len(data):
+        b1, b2 = data[pos + 1], data[pos + 2]
+        if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+            if frames:
+                break
+            pos += 1
+            continue
+        
+        version = (b1 >> 3) & 3
+        layer = (b1 >> 1) & 3
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 3
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            return None
+        
+        mpeg1 = version == 3
+        bitrate = MP3_BITRATES['mpeg1' if mpeg1 else 'mpeg2'][bitrate_index] * 1000
+        rate = MP3_SAMPLE_RATES[version][rate_index]
+        if sample_rate is not None and rate != sample_rate:
+            return None
+        sample_rate = rate
+        samples_per_frame = 1152 if mpeg1 else 576
+        
+        frame_size = (144 if mpeg1 else 72) * bitrate // rate + ((b2 >> 1) & 1)
+        gapless = _mp3_info_frame(data, pos, mpeg1) if frames == 0 else None
+        if gapless is not None:
+            trimmed = sum(gapless)
+        else:
+            frames += 1
+        pos += frame_size
+    
+    if not frames:
+        return None
+    return sample_rate, max(0, frames * samples_per_frame - trimmed) / sample_rate
+
+
+def _wav_params(path: str) -> Optional[Tuple[int, int, int, int]]:
+    """PCM WAV 파일의 (채널 수, 샘플 바이트 수, 샘플레이트, 프레임 수) (WAV가 아니면 None)"""
+    if not str(path).lower().endswith('.wav'):
+        return None
+    try:
+        with wave.open(str(path), 'rb') as f:
+            return f.getnchannels(), f.getsampwidth(), f.getframerate(), f.getnframes()
+    except (wave.Error, EOFError):
+        return None
+
+
+def get_audio_duration(path: str) -> float:
+    """오디오 파일 길이 (초) - WAV/MP3는 헤더로 계산, 그 외는 디코더 사용"""
+    params = _wav_params(path)
+    if params:
+        return params[3] / params[2]
+    
+    if str(path).lower().endswith('.mp3'):
+        with open(path, 'rb') as f:
+            info = _mp3_info(f.read())
+        if info:
+            return info[1]
+    
+    clip = AudioFileClip(str(path))
+    try:
+        return clip.duration
+    finally:
+        clip.close()
+
+
+def join_audio_files(files: List[str], output_path: str) -> bool:
+    """
+    오디오 파일들을 이어 붙임
+    
+    모두 형식이 같은 WAV면 PCM 프레임을 재인코딩 없이 그대로 붙이고, 샘플레이트가 같은
+    MP3는 PCM으로 디코딩해 이은 뒤 한 번만 인코딩하며, 그 외(제공자가 섞인 경우 등)에는
+    디코딩 후 다시 저장합니다.
+    """
+    if str(output_path).lower().endswith('.wav'):
+        formats = set()
+        for path in files:
+            params = _wav_params(path)
+            formats.add(params[:3] if params else None)
+        if len(formats) == 1 and None not in formats:
+            return concat_wav_files(files, output_path)
+        logger.info("형식이 다른 오디오 합치기 (디코딩 후 PCM 저장)")
+        return concat_audio_files(files, output_path)
+    
+    rates = set()
+    for path in files:
+        if not str(path).lower().endswith('.mp3'):
+            rates = None
+            break
+        with open(path, 'rb') as f:
+            info = _mp3_info(f.read())
+        if info is None:
+            rates = None
+            break
+        rates.add(info[0])
+    
+    if rates is not None and len(rates) == 1 and str(output_path).lower().endswith('.mp3'):
+        return concat_mp3_files(files, output_path)
+    
+    logger.info("형식이 다른 오디오 합치기 (재인코딩)")
+    return concat_audio_files(files, output_path)
+
+
+def concat_audio_files(files: List[str], output_path: str) -> bool:
+    """
+    오디오 파일들을 순서대로 이어 붙여 하나의 파일로 저장
+    
+    Args:
+        files: 입력 오디오 파일 경로 리스트
+        output_path: 저장 경로
+    
+    Returns:
+        성공 여부
+    """
+    if not files:
+        return False
+    
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    clips = []
+    try:
+        clips = [AudioFileClip(str(f)) for f in files]
+        combined = concatenate_audioclips(clips)
+        combined.write_audiofile(str(output_path), logger=None)
+        combined.close()
+        return True
+    
+    except Exception as e:
+        logger.error(f"오디오 합치기 실패: {e}")
+        return False
+    
+    finally:
+        for clip in clips:
+            clip.close()
+
+
+def concat_wav_files(files: List[str], output_path: str) -> bool:
+    """형식(채널/샘플 크기/샘플레이트)이 같은 WAV 파일들의 PCM 프레임을 그대로 이어 붙임"""
+    if not files:
+        return False
+    
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(output_path).with_name(Path(output_path).name + '.part')
+    
+    try:
+        with wave.open(str(tmp_path), 'wb') as out:
+            for i, path in enumerate(files):
+                with wave.open(str(path), 'rb') as f:
+                    if i == 0:
+                        out.setparams(f.getparams())
+                    out.writeframes(f.readframes(f.getnframes()))
+        tmp_path.replace(output_path)
+        return True
+    
+    except Exception as e:
+        logger.error(f"WAV 합치기 실패: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+
+def _mp3_frames(data: bytes) -> bytes:
+    """MP3 데이터에서 ID3 태그를 떼고 프레임 부분만 반환"""
+    if data[:3] == b'ID3' and len(data) >= 10:
+        # ID3v2 헤더: 10바이트 + syncsafe 정수 크기 (+ 푸터 플래그면 10바이트)
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        data = data[10 + size + footer:]
+    if len(data) >= 128 and data[-128:-125] == b'TAG':
+        data = data[:-128]
+    return data
+
+
+def concat_mp3_files(files: List[str], output_path: str) -> bool:
+    """
+    같은 샘플레이트의 MP3 파일들을 PCM으로 디코딩해 이어 붙인 뒤 한 번만 인코딩
+    
+    MP3 프레임을 그대로 붙이면 조각마다 Xing/Info 프레임과 인코더 지연/패딩이 남아
+    이음새마다 무음이 생기고 길이 정보도 틀어집니다. 디코더(ffmpeg)가 LAME 태그대로
+    지연/패딩을 잘라낸 샘플을 이어 붙이므로 이음새가 없습니다.
+    샘플레이트가 다른 파일(제공자가 섞인 경우)은 concat_audio_files를 사용하세요.
+    
+    Returns:
+        성공 여부
+    """
+    if not files:
+        return False
+    
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        with open(files[0], 'rb') as f:
+            sample_rate = _mp3_info(f.read())[0]
+        
+        samples = []
+        for path in files:
+            clip = AudioFileClip(str(path), fps=sample_rate)
+            try:
+                samples.append(clip.to_soundarray(fps=sample_rate))
+            finally:
+                clip.close()
+        
+        combined = AudioArrayClip(np.concatenate(samples), fps=sample_rate)
+        combined.write_audiofile(str(output_path), fps=sample_rate, logger=None)
+        return True
+    
+    except Exception as e:
+        logger.error(f"MP3 합치기 실패: {e}")
+        return False
+
+
+def write_audio_array(samples: np.ndarray, sample_rate: int, output_path: str):
+    """
+    float32 모노 샘플을 오디오 파일로 저장 (.wav는 그대로, 그 외는 확장자에 맞게 인코딩)
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    samples = np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0)
+    
+    if str(output_path).lower().endswith('.wav'):
+        with wave.open(str(output_path), 'wb') as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(sample_rate)
+            f.writeframes((samples * 32767).astype('<i2').tobytes())
+        return
+    
+    clip = AudioArrayClip(np.column_stack([samples, samples]), fps=sample_rate)
+    clip.write_audiofile(str(output_path), fps=sample_rate, logger=None)
+
+
+def convert_to_wav(source_path: str, output_path: str, sample_rate: int = 24000):
+    """압축 오디오(MP3 등)를 한 번 디코딩해 모노 PCM WAV로 저장"""
+    clip = AudioFileClip(str(source_path), fps=sample_rate)
+    try:
+        samples = clip.to_soundarray(fps=sample_rate)
+    finally:
+        clip.close()
+    if samples.ndim == 2:
+        samples = samples.mean(axis=1)
+    write_audio_array(samples, sample_rate, output_path)
+
+
+def read_audio_array(path: str, sample_rate: int = 44100) -> np.ndarray:
+    """
+    오디오 파일을 (샘플 수, 2) float32 스테레오 배열로 읽음
+    
+    WAV는 디코더 없이 바로 읽고(샘플레이트가 다르면 선형 보간), 그 외 형식은 한 번 디코딩합니다.
+    """
+    params = _wav_params(path)
+    if params and params[1] == 2:
+        channels, _, rate, frames = params
+        with wave.open(str(path), 'rb') as f:
+            data = np.frombuffer(f.readframes(frames), dtype='<i2').astype(np.float32) / 32768
+        data = data.reshape(-1, channels)
+        
+        if rate != sample_rate and len(data):
+            positions = np.arange(int(len(data) * sample_rate / rate)) * rate / sample_rate
+            data = np.column_stack([
+                np.interp(positions, np.arange(len(data)), data[:, c]) for c in range(channels)
+            ]).astype(np.float32)
+    else:
+        clip = AudioFileClip(str(path), fps=sample_rate)
+        try:
+            data = clip.to_soundarray(fps=sample_rate).astype(np.float32)
+        finally:
+            clip.close()
+        if data.ndim == 1:
+            data = data[:, None]
+    
+    if data.shape[1] == 1:
+        data = np.repeat(data, 2, axis=1)
+    return data[:, :2]
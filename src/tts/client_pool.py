@@ -0,0 +1,143 @@
+"""
+TTS 클라이언트 풀 - 제공자별 클라이언트를 지연 생성해 프로세스 전체에서 재사용
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from loguru import logger
+
+
+class _Entry:
+    """등록된 제공자의 팩토리와 현재 클라이언트 상태"""
+    
+    def __init__(self, factory, reconnect_on, health_check, close):
+        self.factory = factory
+        self.reconnect_on = reconnect_on
+        self.health_check = health_check
+        self.close = close
+        self.client = None
+        self.last_used = 0.0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+
+class ClientPool:
+    """
+    제공자별 TTS 클라이언트를 공유하는 풀
+    
+    클라이언트는 처음 필요할 때 한 번 만들고 이후 모든 호출과 스레드가 재사용합니다
+    (gRPC 채널 생성과 인증은 프로세스당 한 번). 연결 오류가 나거나 연속 실패가
+    max_failures회에 이르면 클라이언트를 폐기하고 다시 만들며, health_interval초 넘게
+    쓰이지 않은 클라이언트는 재사용 전에 health_check로 상태를 확인합니다.
+    """
+    
+    def __init__(self, max_failures: int = 3, health_interval: float = 600):
+        """
+        Args:
+            max_failures: 클라이언트를 다시 만들 연속 실패 횟수
+            health_interval: 상태 확인 없이 재사용할 최대 유휴 시간 (초)
+        """
+        self.max_failures = max_failures
+        self.health_interval = health_interval
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+    
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        reconnect_on: Tuple[Type[BaseException], ...] = (),
+        health_check: Optional[Callable[[Any], None]] = None,
+        close: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        제공자 등록 (이미 등록된 이름이면 기존 클라이언트를 유지)
+        
+        Args:
+            name: 제공자 이름
+            factory: 클라이언트 생성 함수
+            reconnect_on: 즉시 재연결 후 한 번 재시도할 예외 타입
+            health_check: 유휴 클라이언트 상태 확인 함수 (실패 시 예외)
+            close: 클라이언트 정리 함수
+        """
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _Entry(factory, reconnect_on, health_check, close)
+    
+    def _entry(self, name: str) -> _Entry:
+        with self._lock:
+            return self._entries[name]
+    
+    def get(self, name: str) -> Any:
+        """제공자의 클라이언트 반환 (없거나 상태 확인에 실패하면 새로 생성)"""
+        entry = self._entry(name)
+        with entry.lock:
+            idle = time.monotonic() - entry.last_used
+            if entry.client is not None and entry.health_check and idle > self.health_interval:
+                try:
+                    entry.health_check(entry.client)
+                except Exception as e:
+                    logger.warning(f"TTS 클라이언트 상태 확인 실패, 재연결 ({name}): {e}")
+                    self._discard(entry)
+            
+            if entry.client is None:
+                entry.client = entry.factory()
+                entry.failures = 0
+                logger.info(f"TTS 클라이언트 생성: {name}")
+            
+            entry.last_used = time.monotonic()
+            return entry.client
+    
+    def invalidate(self, name: str):
+        """클라이언트 폐기 (다음 get에서 새로 생성)"""
+        entry = self._entry(name)
+        with entry.lock:
+            self._discard(entry)
+    
+    @staticmethod
+    def _discard(entry: _Entry):
+        """클라이언트 정리 후 비움 (entry.lock을 잡은 상태에서 호출)"""
+        if entry.client is not None and entry.close:
+            try:
+                entry.close(entry.client)
+            except Exception:
+                pass
+        entry.client = None
+    
+    def call(self, name: str, fn: Callable[[Any], Any]) -> Any:
+        """
+        풀의 클라이언트로 fn(client) 실행
+        
+        reconnect_on 예외면 클라이언트를 새로 만들어 한 번 재시도합니다.
+        """
+        entry = self._entry(name)
+        for attempt in range(2):
+            client = self.get(name)
+            try:
+                result = fn(client)
+                entry.failures = 0
+                return result
+            except entry.reconnect_on as e:
+                logger.warning(f"TTS 연결 오류, 재연결 ({name}): {e}")
+                self.invalidate(name)
+                if attempt:
+                    raise
+            except Exception:
+                entry.failures += 1
+                if entry.failures >= self.max_failures:
+                    logger.warning(f"TTS 연속 {entry.failures}회 실패, 클라이언트 재생성 ({name})")
+                    self.invalidate(name)
+                raise
+
+
+_pool: Optional[ClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """프로세스 공유 TTS 클라이언트 풀"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ClientPool()
+        return _pool
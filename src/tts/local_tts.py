@@ -0,0 +1,94 @@
+"""
+로컬 TTS 엔진 - sherpa-onnx VITS 모델로 네트워크 없이 CPU에서 한국어 음성 합성
+"""
+import threading
+from pathlib import Path
+from typing import Tuple
+import numpy as np
+from loguru import logger
+
+# sherpa-onnx (선택)
+try:
+    import sherpa_onnx
+    SHERPA_ONNX_AVAILABLE = True
+except ImportError:
+    SHERPA_ONNX_AVAILABLE = False
+    logger.warning("sherpa-onnx not available (local TTS disabled)")
+
+
+class LocalTTSEngine:
+    """
+    sherpa-onnx 오프라인 TTS 래퍼
+    
+    모델 로드는 수 초가 걸리므로 프로세스당 한 번만 만들어 재사용합니다
+    (TTSGenerator는 공유 클라이언트 풀에 등록해 사용). 한 번의 generate 호출에
+    여러 문장을 넘기면 max_num_sentences개씩 묶어 배치로 추론합니다.
+    """
+    
+    def __init__(
+        self,
+        model: str,
+        tokens: str,
+        lexicon: str = '',
+        data_dir: str = '',
+        speaker_id: int = 0,
+        speed: float = 1.0,
+        num_threads: int = 2,
+        max_num_sentences: int = 4
+    ):
+        """
+        Args:
+            model: VITS ONNX 모델 경로
+            tokens: tokens.txt 경로
+            lexicon: 사전 파일 경로 (모델에 따라 필요)
+            data_dir: espeak-ng-data 디렉토리 (piper/mimic3 계열 모델)
+            speaker_id: 다화자 모델의 화자 번호
+            speed: 말하기 속도
+            num_threads: 추론 스레드 수
+            max_num_sentences: 한 번에 배치 추론할 최대 문장 수
+        """
+        if not SHERPA_ONNX_AVAILABLE:
+            raise RuntimeError("sherpa-onnx가 설치되어 있지 않습니다")
+        if not Path(model).exists():
+            raise FileNotFoundError(f"로컬 TTS 모델 없음: {model}")
+        
+        config = sherpa_onnx.OfflineTtsConfig(
+            model=sherpa_onnx.OfflineTtsModelConfig(
+                vits=sherpa_onnx.OfflineTtsVitsModelConfig(
+                    model=model,
+                    lexicon=lexicon,
+                    tokens=tokens,
+                    data_dir=data_dir
+                ),
+                provider='cpu',
+                num_threads=num_threads
+            ),
+            max_num_sentences=max_num_sentences
+        )
+        
+        self.speaker_id = speaker_id
+        self.speed = speed
+        self._tts = sherpa_onnx.OfflineTts(config)
+        # ONNX 세션은 호출 간 공유하되 추론은 한 번에 하나씩 (내부적으로 num_threads 사용)
+        self._lock = threading.Lock()
+        
+        logger.info(f"로컬 TTS 모델 로드 완료: {model}")
+    
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        """
+        텍스트를 음성으로 변환
+        
+        Returns:
+            (float32 모노 샘플, 샘플레이트)
+        """
+        with self._lock:
+            audio = self._tts.generate(text, sid=self.speaker_id, speed=self.speed)
+        
+        samples = np.asarray(audio.samples, dtype=np.float32)
+        if samples.size == 0:
+            raise RuntimeError("로컬 TTS 출력이 비어 있습니다")
+        return samples, audio.sample_rate
+    
+    def warm_up(self):
+        """첫 추론 지연(그래프 최적화, 메모리 할당)을 미리 치름"""
+        self.synthesize('안녕하세요.')
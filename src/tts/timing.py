@@ -0,0 +1,139 @@
+"""
+나레이션 타이밍 사이드카 - 오디오 파일 옆 `<이름>.timing.json`에 문장/단어별 시작·끝 시각 저장
+
+형식:
+    {
+        "duration": 전체 길이(초),
+        "sentences": [
+            {"text": 문장, "start": 초, "end": 초, "source": "timepoints" | "estimated",
+             "words": [{"text": 단어, "start": 초, "end": 초}, ...]},
+            ...
+        ]
+    }
+
+source가 timepoints면 TTS 제공자가 돌려준 실제 단어 시각, estimated면 측정한 조각 길이를
+글자 수 비율로 나눈 추정치입니다.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+
+from src.utils.text_splitter import split_sentences
+
+
+def timing_path(audio_path: str) -> Path:
+    """오디오 파일의 타이밍 사이드카 경로 (narration.mp3 → narration.timing.json)"""
+    path = Path(audio_path)
+    return path.with_name(path.stem + '.timing.json')
+
+
+def save_timing(audio_path: str, timing: Dict):
+    """타이밍 사이드카 저장"""
+    path = timing_path(audio_path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(timing, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_timing(audio_path: str) -> Optional[Dict]:
+    """타이밍 사이드카 로드 (없거나 읽을 수 없으면 None)"""
+    path = timing_path(audio_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"타이밍 사이드카 로드 실패 ({path}): {e}")
+        return None
+
+
+def _spread(items: Sequence[str], start: float, end: float) -> List[Tuple[float, float]]:
+    """구간을 항목별 글자 수 비율로 나눈 (시작, 끝) 리스트"""
+    weights = [max(1, len(item.replace(' ', ''))) for item in items]
+    total = sum(weights)
+    spans = []
+    t = start
+    for weight in weights:
+        step = (end - start) * weight / total
+        spans.append((round(t, 3), round(t + step, 3)))
+        t += step
+    return spans
+
+
+def estimate_timing(text: str, duration: float) -> Dict:
+    """측정한 오디오 길이를 문장/단어 글자 수 비율로 나눈 추정 타이밍"""
+    sentences = split_sentences(text) or [text.strip()]
+    result = []
+    for sentence, (start, end) in zip(sentences, _spread(sentences, 0.0, duration)):
+        words = sentence.split()
+        result.append({
+            'text': sentence,
+            'start': start,
+            'end': end,
+            'source': 'estimated',
+            'words': [
+                {'text': word, 'start': ws, 'end': we}
+                for word, (ws, we) in zip(words, _spread(words, start, end))
+            ],
+        })
+    return {'duration': round(duration, 3), 'sentences': result}
+
+
+def timing_from_word_starts(text: str, word_starts: List[float], duration: float) -> Dict:
+    """
+    제공자가 돌려준 단어 시작 시각으로 타이밍 생성
+    
+    Args:
+        text: 합성한 텍스트 (공백 기준 단어 순서가 word_starts와 같아야 함)
+        word_starts: 단어별 시작 시각 (초)
+        duration: 오디오 길이 (초)
+    """
+    words = text.split()
+    if len(words) != len(word_starts):
+        return estimate_timing(text, duration)
+    
+    ends = list(word_starts[1:]) + [duration]
+    timed_words = [
+        {'text': word, 'start': round(start, 3), 'end': round(end, 3)}
+        for word, start, end in zip(words, word_starts, ends)
+    ]
+    
+    # 단어를 문장 경계에 맞춰 묶음
+    result = []
+    i = 0
+    for sentence in split_sentences(text) or [text.strip()]:
+        count = len(sentence.split())
+        group = timed_words[i:i + count]
+        i += count
+        if not group:
+            continue
+        result.append({
+            'text': sentence,
+            'start': group[0]['start'],
+            'end': group[-1]['end'],
+            'source': 'timepoints',
+            'words': group,
+        })
+    return {'duration': round(duration, 3), 'sentences': result}
+
+
+def merge_timings(parts: List[Dict]) -> Dict:
+    """이어 붙인 순서대로 조각 타이밍을 누적 오프셋으로 합침"""
+    sentences = []
+    offset = 0.0
+    for timing in parts:
+        for sentence in timing['sentences']:
+            shifted = dict(sentence)
+            shifted['start'] = round(sentence['start'] + offset, 3)
+            shifted['end'] = round(sentence['end'] + offset, 3)
+            shifted['words'] = [
+                {'text': w['text'], 'start': round(w['start'] + offset, 3), 'end': round(w['end'] + offset, 3)}
+                for w in sentence['words']
+            ]
+            sentences.append(shifted)
+        offset += timing['duration']
+    return {'duration': round(offset, 3), 'sentences': sentences}
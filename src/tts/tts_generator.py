@@ -2,22 +2,42 @@
 TTS (Text-to-Speech) 음성 생성 모듈
 """
 import os
+import queue
+import shutil
+import threading
+from xml.sax.saxutils import escape
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 import yaml
 
+from src.tts.audio_cache import AudioCache
+from src.tts.audio_utils import convert_to_wav, get_audio_duration, join_audio_files, write_audio_array
+from src.tts.client_pool import get_client_pool
+from src.tts.local_tts import SHERPA_ONNX_AVAILABLE, LocalTTSEngine
+from src.tts.timing import estimate_timing, load_timing, merge_timings, save_timing, timing_from_word_starts, timing_path
+from src.utils.text_splitter import pack_sentences, split_sentences
+
 # Google Cloud TTS
 try:
+    from google.api_core import exceptions as google_exceptions
     from google.cloud import texttospeech
     GOOGLE_TTS_AVAILABLE = True
 except ImportError:
     GOOGLE_TTS_AVAILABLE = False
     logger.warning("Google Cloud TTS not available")
 
+# Google Cloud TTS v1beta1 (SSML mark 타임포인트)
+try:
+    from google.cloud import texttospeech_v1beta1
+    GOOGLE_TIMEPOINTS_AVAILABLE = True
+except ImportError:
+    GOOGLE_TIMEPOINTS_AVAILABLE = False
+
 # ElevenLabs TTS
 try:
-    from elevenlabs import generate, save, voices, set_api_key
+    from elevenlabs import generate, save, voices, set_api_key, Voice, VoiceSettings
     ELEVENLABS_AVAILABLE = True
 except ImportError:
     ELEVENLABS_AVAILABLE = False
@@ -27,6 +47,106 @@ except ImportError:
 from gtts import gTTS
 
 
+# 제공자별 요청당 입력 한도 (UTF-8 바이트, 여유분 포함) - gTTS는 내부에서 자체 분할
+PROVIDER_MAX_BYTES = {
+    'google': 4800,  # Google Cloud TTS 5000바이트
+    'elevenlabs': 4800,  # ElevenLabs 5000자 (한글 기준 바이트로 보수적으로 계산)
+}
+
+# 단어마다 <mark>를 넣는 SSML은 태그만큼 길어지므로 원문 기준 한도를 낮춤
+SSML_MARK_MAX_BYTES = 1600
+
+# 조각마다 다른 제공자(대체 제공자 포함)가 합성한 오디오를 나타내는 이름
+MIXED_PROVIDER = 'mixed'
+
+
+class StreamingTTSSession:
+    """
+    문장이 도착하는 대로 백그라운드에서 합성하고, 끝나면 하나의 파일로 합치는 세션
+    
+    스크립트 생성(LLM 스트리밍)과 음성 합성을 겹쳐서 실행하기 위한 것입니다.
+    문장은 도착 순서대로 하나씩 합성되므로 결과 순서가 보장됩니다.
+    """
+    
+    def __init__(self, generator: 'TTSGenerator', output_path: str, provider: Optional[str] = None):
+        self.generator = generator
+        self.output_path = output_path
+        self.provider = provider
+        self.segment_dir = Path(output_path).with_name(Path(output_path).stem + '_segments')
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.segments = []
+        self.used_providers = set()
+        self.failed = False
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='tts-stream', daemon=True)
+        self._thread.start()
+    
+    def feed(self, sentence: str):
+        """합성할 문장 추가 (즉시 반환)"""
+        self._queue.put(sentence)
+    
+    def _run(self):
+        """큐의 문장을 순서대로 합성 (하나라도 실패하면 나머지는 건너뜀)"""
+        while True:
+            sentence = self._queue.get()
+            if sentence is None:
+                return
+            if self.failed:
+                continue
+            
+            segment_path = str(self.segment_dir / f"segment_{len(self.segments):03d}{Path(self.output_path).suffix}")
+            used = self.generator.synthesize_audio(sentence, segment_path, self.provider)
+            if used:
+                self.segments.append({'file': segment_path, 'text': sentence})
+                self.used_providers.add(used)
+            else:
+                self.failed = True
+    
+    def _stop(self):
+        """워커 스레드 종료 대기"""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def finish(self) -> bool:
+        """
+        남은 문장 합성을 기다린 뒤 세그먼트를 output_path로 합침
+        
+        Returns:
+            성공 여부
+        """
+        self._stop()
+        
+        try:
+            if self.failed or not self.segments:
+                logger.error("스트리밍 TTS 실패: 합성되지 않은 문장이 있습니다")
+                return False
+            
+            success = self.generator.join_parts(
+                [(s['file'], s['text']) for s in self.segments],
+                self.output_path
+            )
+            if success:
+                logger.info(f"스트리밍 TTS 완료: {len(self.segments)}개 문장 → {self.output_path}")
+            return success
+        
+        finally:
+            shutil.rmtree(self.segment_dir, ignore_errors=True)
+    
+    @property
+    def provider_used(self) -> Optional[str]:
+        """실제로 합성한 제공자 (문장마다 다르면 MIXED_PROVIDER, 합성된 문장이 없으면 None)"""
+        if len(self.used_providers) > 1:
+            return MIXED_PROVIDER
+        return next(iter(self.used_providers), None)
+    
+    def cancel(self):
+        """합성 중단 및 임시 파일 정리"""
+        self.failed = True
+        self._stop()
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
+
+
 class TTSGenerator:
     """다중 TTS 엔진을 지원하는 음성 생성기"""
     
@@ -38,11 +158,68 @@ class TTSGenerator:
         
         self.provider = self.tts_config.get('provider', 'google')
         
+        # 중간 오디오 형식 (wav: 무손실 PCM으로 두고 비디오 출력 시 한 번만 인코딩)
+        self.audio_format = self.tts_config.get('audio_format', 'wav')
+        self.wav_sample_rate = self.tts_config.get('wav_sample_rate', 24000)
+        
+        # 조각/세그먼트 동시 합성 수 (generate_audio, generate_with_timing)
+        self.max_workers = self.tts_config.get('parallel', {}).get('max_workers', 4)
+        # 제공자 요청 동시 실행 한도 - 세그먼트 풀 안에서 조각 풀이 열려도 요청은 max_workers개까지만
+        self._request_slots = threading.BoundedSemaphore(max(1, self.max_workers))
+        
+        # 타이밍 사이드카 (<이름>.timing.json) - Google은 SSML mark로 실제 단어 시각 사용
+        timing_config = self.tts_config.get('timing', {})
+        self.timing_enabled = timing_config.get('enabled', True)
+        self.word_timepoints = (
+            self.timing_enabled and timing_config.get('word_timepoints', True) and GOOGLE_TIMEPOINTS_AVAILABLE
+        )
+        
         # API 키 설정
         if self.provider == 'elevenlabs' and ELEVENLABS_AVAILABLE:
             api_key = os.getenv('ELEVENLABS_API_KEY')
             if api_key:
                 set_api_key(api_key)
+        
+        # 제공자 클라이언트는 프로세스 전체에서 공유 (호출마다 채널/인증 설정 생략)
+        self.client_pool = get_client_pool()
+        if GOOGLE_TTS_AVAILABLE:
+            self.client_pool.register(
+                'google',
+                texttospeech.TextToSpeechClient,
+                reconnect_on=(google_exceptions.ServiceUnavailable, google_exceptions.DeadlineExceeded),
+                health_check=lambda client: client.list_voices(language_code=self.tts_config['language'])
+            )
+        if self.word_timepoints:
+            self.client_pool.register(
+                'google_beta',
+                texttospeech_v1beta1.TextToSpeechClient,
+                reconnect_on=(google_exceptions.ServiceUnavailable, google_exceptions.DeadlineExceeded)
+            )
+        if ELEVENLABS_AVAILABLE:
+            elevenlabs_config = self.tts_config.get('elevenlabs', {})
+            self.elevenlabs_voice_key = f"elevenlabs:{elevenlabs_config.get('voice_id', 'EXAVITQu4vr4xnSDxMaL')}"
+            self.client_pool.register(self.elevenlabs_voice_key, self._build_elevenlabs_voice)
+        
+        # 주 제공자 실패 시 순서대로 시도할 대체 제공자
+        self.fallback = self.tts_config.get('fallback', ['local', 'gtts'])
+        
+        # 로컬 오프라인 TTS (모델은 프로세스당 한 번 로드해 공유)
+        self.local_config = self.tts_config.get('local', {})
+        self.local_available = SHERPA_ONNX_AVAILABLE and Path(self.local_config.get('model', '')).is_file()
+        if self.local_available:
+            self.client_pool.register(f"local:{self.local_config['model']}", self._build_local_engine)
+            if 'local' in self._provider_chain(self.provider) and self.local_config.get('preload', True):
+                # 첫 문장 합성 전에 모델 로드/첫 추론을 백그라운드에서 미리 수행
+                threading.Thread(target=self._warm_up_local, name='tts-local-warmup', daemon=True).start()
+        
+        # 문장 단위 오디오 캐시 (CTA, 면책 문구 등 반복 문장은 재합성 생략)
+        cache_config = self.tts_config.get('cache', {})
+        self.audio_cache = None
+        if cache_config.get('enabled', True):
+            self.audio_cache = AudioCache(
+                cache_config.get('path', 'data/cache/tts'),
+                max_entries=cache_config.get('max_entries', 2000)
+            )
     
     def generate_audio(self, text: str, output_path: str, provider: Optional[str] = None) -> bool:
         """
@@ -56,37 +233,271 @@ class TTSGenerator:
         Returns:
             성공 여부
         """
+        return self.synthesize_audio(text, output_path, provider) is not None
+    
+    def synthesize_audio(self, text: str, output_path: str, provider: Optional[str] = None) -> Optional[str]:
+        """
+        텍스트를 음성으로 변환하고 실제로 합성한 제공자 반환
+        
+        제공자 입력 한도에 맞춰 문장 경계에서 나눈 조각을 동시에 합성하고,
+        순서대로 이어 붙여 output_path에 저장합니다. 캐시가 켜져 있으면 문장 단위로
+        캐시를 조회해 없는 문장만 합성합니다.
+        
+        Args:
+            text: 변환할 텍스트
+            output_path: 저장 경로
+            provider: TTS 제공자 (None이면 기본 설정 사용)
+        
+        Returns:
+            실제 제공자 (대체 제공자가 쓰였으면 그 이름, 조각마다 다르면 MIXED_PROVIDER),
+            실패 시 None
+        """
         provider = provider or self.provider
         
         # 출력 디렉토리 생성
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        timing_path(output_path).unlink(missing_ok=True)
+        
+        units = self._split_units(text, provider)
+        if len(units) == 1:
+            result = self._synthesize_unit(units[0], output_path, provider)
+            if result is None:
+                return None
+            self._ensure_timing(output_path, units[0])
+            return result[0]
+        
+        parts_dir = Path(output_path).with_name(Path(output_path).stem + '_parts')
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        
+        def _synthesize_part(indexed_unit):
+            i, unit = indexed_unit
+            part_path = str(parts_dir / f"part_{i:03d}{Path(output_path).suffix}")
+            return part_path, self._synthesize_unit(unit, part_path, provider)
         
         try:
-            if provider == 'google' and GOOGLE_TTS_AVAILABLE:
-                return self._generate_google_tts(text, output_path)
+            # 조각 동시 합성 (map은 입력 순서대로 결과 반환)
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_workers, len(units))),
+                thread_name_prefix='tts-part'
+            ) as executor:
+                results = list(executor.map(_synthesize_part, enumerate(units)))
             
-            elif provider == 'elevenlabs' and ELEVENLABS_AVAILABLE:
-                return self._generate_elevenlabs_tts(text, output_path)
+            if any(result is None for _, result in results):
+                logger.error(f"TTS 조각 합성 실패: {sum(r is None for _, r in results)}/{len(units)}개")
+                return None
             
-            else:
-                # Fallback to gTTS
-                logger.warning(f"{provider} 사용 불가, gTTS로 대체")
-                return self._generate_gtts(text, output_path)
+            if self.audio_cache is not None:
+                hits = sum(hit for _, (_, hit) in results)
+                logger.info(f"TTS 캐시: {hits}/{len(units)}개 문장 재사용")
+            
+            used_providers = {used for _, (used, _) in results}
+            if len(used_providers) > 1:
+                logger.warning(f"제공자가 섞인 조각 합치기: {sorted(used_providers)}")
+            
+            if not self.join_parts([(path, unit) for (path, _), unit in zip(results, units)], output_path):
+                return None
+            return used_providers.pop() if len(used_providers) == 1 else MIXED_PROVIDER
+        
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+    
+    def join_parts(self, parts: List[Tuple[str, str]], output_path: str) -> bool:
+        """
+        (오디오 파일, 텍스트) 조각들을 순서대로 이어 붙이고 합친 타이밍 사이드카 저장
+        
+        같은 형식의 WAV/MP3는 재인코딩 없이 프레임 단위로 붙입니다. 조각에 사이드카가 있으면
+        그 타이밍을, 없으면 조각 길이를 측정한 추정치를 누적 오프셋으로 합칩니다.
+        """
+        if not join_audio_files([path for path, _ in parts], output_path):
+            return False
         
+        if self.timing_enabled:
+            try:
+                save_timing(output_path, merge_timings([
+                    load_timing(path) or estimate_timing(text, get_audio_duration(path))
+                    for path, text in parts
+                ]))
+            except Exception as e:
+                logger.warning(f"타이밍 사이드카 생성 실패: {e}")
+        return True
+    
+    def _ensure_timing(self, audio_path: str, text: str):
+        """사이드카가 없으면 측정한 길이로 추정 타이밍 저장"""
+        if not self.timing_enabled or timing_path(audio_path).exists():
+            return
+        try:
+            save_timing(audio_path, estimate_timing(text, get_audio_duration(audio_path)))
         except Exception as e:
-            logger.error(f"TTS 생성 실패 ({provider}): {e}")
-            # Fallback to gTTS
+            logger.warning(f"타이밍 사이드카 생성 실패: {e}")
+    
+    def _split_units(self, text: str, provider: str) -> List[str]:
+        """
+        합성 단위로 분할
+        
+        캐시를 쓰면 문장 단위(재사용 단위), 아니면 제공자 입력 한도 안에서 문장들을 묶은 조각
+        단위입니다. 어느 쪽이든 한도를 넘는 문장은 쉼표/공백 위치에서 나눕니다.
+        """
+        sentences = split_sentences(text) or [text.strip()]
+        if provider == 'local' and self.local_available:
+            # 로컬 엔진은 한 번의 호출에서 문장들을 배치로 추론
+            return [' '.join(sentences)]
+        
+        max_bytes = PROVIDER_MAX_BYTES.get(provider)
+        if provider == 'google' and self.word_timepoints:
+            max_bytes = SSML_MARK_MAX_BYTES
+        
+        if max_bytes is None:
+            return sentences if self.audio_cache is not None else [' '.join(sentences)]
+        return pack_sentences(sentences, max_bytes, merge=self.audio_cache is None)
+    
+    def _synthesize_unit(self, text: str, output_path: str, provider: str) -> Optional[Tuple[str, bool]]:
+        """
+        합성 단위 하나를 생성 (캐시가 켜져 있으면 캐시 조회 후 없을 때만 합성)
+        
+        Returns:
+            (실제 제공자, 캐시 적중 여부), 실패하면 None
+        """
+        # 로컬 합성은 API 비용이 없으므로 캐시하지 않음
+        if self.audio_cache is None or provider == 'local':
+            used = self._synthesize(text, output_path, provider)
+            return (used, False) if used else None
+        return self._synthesize_cached(text, output_path, provider)
+    
+    def _voice_params(self, provider: str) -> Dict:
+        """캐시 키에 들어갈 제공자별 목소리 설정"""
+        if provider == 'google':
+            return {
+                'language': self.tts_config.get('language'),
+                'voice': self.tts_config.get('voice'),
+                'speed': self.tts_config.get('speed'),
+                'pitch': self.tts_config.get('pitch'),
+            }
+        if provider == 'elevenlabs':
+            config = self.tts_config.get('elevenlabs', {})
+            return {
+                'voice': config.get('voice_id', 'EXAVITQu4vr4xnSDxMaL'),
+                'model': config.get('model'),
+                'stability': config.get('stability', 0.5),
+                'similarity_boost': config.get('similarity_boost', 0.75),
+            }
+        if provider == 'local':
+            return {
+                'model': self.local_config.get('model'),
+                'speaker_id': self.local_config.get('speaker_id', 0),
+                'speed': self.local_config.get('speed', 1.0),
+            }
+        return {'lang': 'ko'}
+    
+    def _cache_params(self, provider: str, output_path: str) -> Dict:
+        """캐시 키 파라미터 (목소리 설정 + 파일 형식, WAV는 샘플레이트 포함)"""
+        params = dict(self._voice_params(provider), format=Path(output_path).suffix.lower())
+        if self._is_wav(output_path):
+            # LINEAR16 요청과 MP3 → WAV 변환 모두 wav_sample_rate로 저장되므로 값이 바뀌면 별도 항목
+            params['sample_rate'] = self.wav_sample_rate
+        return params
+    
+    def _synthesize_cached(self, sentence: str, output_path: str, provider: str) -> Optional[Tuple[str, bool]]:
+        """
+        문장 하나를 캐시에서 가져오거나 합성 후 캐시에 저장
+        
+        Returns:
+            (실제 제공자, 캐시 적중 여부), 실패하면 None
+        """
+        if self.audio_cache.get(self.audio_cache.make_key(provider, self._cache_params(provider, output_path), sentence), output_path):
+            return provider, True
+        
+        used = self._synthesize(sentence, output_path, provider)
+        if used is None:
+            return None
+        
+        # 대체 제공자(gTTS)로 합성된 경우 그 제공자 키로 저장해 원래 목소리와 섞이지 않게 함
+        try:
+            self.audio_cache.put(self.audio_cache.make_key(used, self._cache_params(used, output_path), sentence), output_path)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 저장 실패: {e}")
+        return used, False
+    
+    def _synthesize(self, text: str, output_path: str, provider: str) -> Optional[str]:
+        """
+        제공자로 음성 합성 (실패하거나 사용할 수 없으면 fallback 순서대로 대체)
+        
+        Returns:
+            실제로 합성한 제공자 이름 (모두 실패 시 None)
+        """
+        chain = self._provider_chain(provider)
+        if provider not in chain:
+            logger.warning(f"{provider} 사용 불가, {chain[0] if chain else '대체 제공자 없음'}로 대체")
+        
+        for candidate in chain:
             try:
-                return self._generate_gtts(text, output_path)
-            except Exception as e2:
-                logger.error(f"gTTS 생성도 실패: {e2}")
-                return False
+                with self._request_slots:
+                    generated = self._generate_with(candidate, text, output_path)
+                if generated:
+                    if candidate != provider and provider in chain:
+                        logger.warning(f"{provider} 실패, {candidate}로 대체")
+                    return candidate
+            except Exception as e:
+                logger.error(f"TTS 생성 실패 ({candidate}): {e}")
+        
+        logger.error(f"모든 TTS 제공자 실패: {chain}")
+        return None
+    
+    def _provider_chain(self, provider: str) -> List[str]:
+        """시도할 제공자 순서 (주 제공자 + 대체 제공자, 사용할 수 없는 제공자 제외)"""
+        available = {
+            'google': GOOGLE_TTS_AVAILABLE,
+            'elevenlabs': ELEVENLABS_AVAILABLE,
+            'local': self.local_available,
+            'gtts': True,
+        }
+        chain = [provider] + [p for p in self.fallback if p != provider]
+        return [p for p in chain if available.get(p)]
+    
+    def _generate_with(self, provider: str, text: str, output_path: str) -> bool:
+        """제공자별 합성 함수 호출"""
+        if provider == 'google':
+            return self._generate_google_tts(text, output_path)
+        if provider == 'elevenlabs':
+            return self._generate_elevenlabs_tts(text, output_path)
+        if provider == 'local':
+            return self._generate_local_tts(text, output_path)
+        return self._generate_gtts(text, output_path)
+    
+    @staticmethod
+    def _is_wav(output_path: str) -> bool:
+        """PCM WAV 출력 여부"""
+        return str(output_path).lower().endswith('.wav')
+    
+    def _google_encoding(self, module, output_path: str) -> Dict:
+        """출력 형식에 맞는 Google 오디오 인코딩 (WAV면 LINEAR16 PCM을 직접 받음)"""
+        if self._is_wav(output_path):
+            return {
+                'audio_encoding': module.AudioEncoding.LINEAR16,
+                'sample_rate_hertz': self.wav_sample_rate,
+            }
+        return {'audio_encoding': module.AudioEncoding.MP3}
+    
+    def _compressed_target(self, output_path: str) -> str:
+        """MP3만 내주는 제공자의 저장 경로 (WAV 출력이면 임시 MP3)"""
+        if self._is_wav(output_path):
+            return str(Path(output_path).with_suffix('.src.mp3'))
+        return output_path
+    
+    def _finish_compressed(self, saved_path: str, output_path: str):
+        """임시 MP3를 한 번 디코딩해 WAV로 저장"""
+        if saved_path == output_path:
+            return
+        try:
+            convert_to_wav(saved_path, output_path, self.wav_sample_rate)
+        finally:
+            Path(saved_path).unlink(missing_ok=True)
     
     def _generate_google_tts(self, text: str, output_path: str) -> bool:
         """Google Cloud TTS로 음성 생성"""
+        if self.word_timepoints:
+            return self._generate_google_tts_marked(text, output_path)
+        
         try:
-            client = texttospeech.TextToSpeechClient()
-            
             synthesis_input = texttospeech.SynthesisInput(text=text)
             
             voice = texttospeech.VoiceSelectionParams(
@@ -95,15 +506,18 @@ class TTSGenerator:
             )
             
             audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
                 speaking_rate=self.tts_config['speed'],
-                pitch=self.tts_config['pitch']
+                pitch=self.tts_config['pitch'],
+                **self._google_encoding(texttospeech, output_path)
             )
             
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
+            response = self.client_pool.call(
+                'google',
+                lambda client: client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=voice,
+                    audio_config=audio_config
+                )
             )
             
             with open(output_path, 'wb') as out:
@@ -116,18 +530,80 @@ class TTSGenerator:
             logger.error(f"Google TTS 실패: {e}")
             return False
     
+    def _generate_google_tts_marked(self, text: str, output_path: str) -> bool:
+        """
+        Google Cloud TTS(v1beta1)로 음성 생성 + 단어별 SSML mark 시각으로 타이밍 사이드카 저장
+        """
+        try:
+            words = text.split()
+            ssml = '<speak>' + ' '.join(
+                f'<mark name="{i}"/>{escape(word)}' for i, word in enumerate(words)
+            ) + '</speak>'
+            
+            request = texttospeech_v1beta1.SynthesizeSpeechRequest(
+                input=texttospeech_v1beta1.SynthesisInput(ssml=ssml),
+                voice=texttospeech_v1beta1.VoiceSelectionParams(
+                    language_code=self.tts_config['language'],
+                    name=self.tts_config['voice']
+                ),
+                audio_config=texttospeech_v1beta1.AudioConfig(
+                    speaking_rate=self.tts_config['speed'],
+                    pitch=self.tts_config['pitch'],
+                    **self._google_encoding(texttospeech_v1beta1, output_path)
+                ),
+                enable_time_pointing=[texttospeech_v1beta1.SynthesizeSpeechRequest.TimepointType.SSML_MARK]
+            )
+            
+            response = self.client_pool.call('google_beta', lambda client: client.synthesize_speech(request=request))
+            
+            with open(output_path, 'wb') as out:
+                out.write(response.audio_content)
+            
+            starts = {int(tp.mark_name): tp.time_seconds for tp in response.timepoints}
+            try:
+                save_timing(output_path, timing_from_word_starts(
+                    text,
+                    [starts[i] for i in range(len(words))] if len(starts) == len(words) else [],
+                    get_audio_duration(output_path)
+                ))
+            except Exception as e:
+                logger.warning(f"타임포인트 저장 실패, 추정 타이밍 사용: {e}")
+            
+            logger.info(f"Google TTS 생성 완료 (타임포인트 {len(starts)}개): {output_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Google TTS 실패: {e}")
+            return False
+    
+    def _build_elevenlabs_voice(self):
+        """설정의 목소리 ID와 음성 설정으로 ElevenLabs Voice 생성 (호출마다 조회하지 않도록 풀에 보관)"""
+        config = self.tts_config.get('elevenlabs', {})
+        return Voice(
+            voice_id=config.get('voice_id', 'EXAVITQu4vr4xnSDxMaL'),
+            settings=VoiceSettings(
+                stability=config.get('stability', 0.5),
+                similarity_boost=config.get('similarity_boost', 0.75)
+            )
+        )
+    
     def _generate_elevenlabs_tts(self, text: str, output_path: str) -> bool:
         """ElevenLabs TTS로 음성 생성 (고품질)"""
         try:
             config = self.tts_config.get('elevenlabs', {})
             
-            audio = generate(
-                text=text,
-                voice=config.get('voice_id', 'EXAVITQu4vr4xnSDxMaL'),
-                model=config.get('model', 'eleven_multilingual_v2')
+            audio = self.client_pool.call(
+                self.elevenlabs_voice_key,
+                lambda voice: generate(
+                    text=text,
+                    voice=voice,
+                    model=config.get('model', 'eleven_multilingual_v2')
+                )
             )
             
-            save(audio, output_path)
+            target = self._compressed_target(output_path)
+            save(audio, target)
+            self._finish_compressed(target, output_path)
             
             logger.info(f"ElevenLabs TTS 생성 완료: {output_path}")
             return True
@@ -136,6 +612,43 @@ class TTSGenerator:
             logger.error(f"ElevenLabs TTS 실패: {e}")
             return False
     
+    def _build_local_engine(self) -> LocalTTSEngine:
+        """설정의 모델로 로컬 TTS 엔진 생성 (풀에서 프로세스당 한 번)"""
+        config = self.local_config
+        return LocalTTSEngine(
+            model=config['model'],
+            tokens=config.get('tokens', ''),
+            lexicon=config.get('lexicon', ''),
+            data_dir=config.get('data_dir', ''),
+            speaker_id=config.get('speaker_id', 0),
+            speed=config.get('speed', 1.0),
+            num_threads=config.get('num_threads', 2),
+            max_num_sentences=config.get('max_num_sentences', 4)
+        )
+    
+    def _warm_up_local(self):
+        """로컬 모델 로드 + 첫 추론"""
+        try:
+            self.client_pool.call(f"local:{self.local_config['model']}", lambda engine: engine.warm_up())
+        except Exception as e:
+            logger.warning(f"로컬 TTS 워밍업 실패: {e}")
+    
+    def _generate_local_tts(self, text: str, output_path: str) -> bool:
+        """로컬 오프라인 모델로 음성 생성 (네트워크 불필요)"""
+        try:
+            samples, sample_rate = self.client_pool.call(
+                f"local:{self.local_config['model']}",
+                lambda engine: engine.synthesize(text)
+            )
+            write_audio_array(samples, sample_rate, output_path)
+            
+            logger.info(f"로컬 TTS 생성 완료: {output_path} ({len(samples) / sample_rate:.1f}초)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"로컬 TTS 실패: {e}")
+            return False
+    
     def _generate_gtts(self, text: str, output_path: str) -> bool:
         """gTTS로 음성 생성 (무료, 기본)"""
         try:
@@ -144,7 +657,9 @@ class TTSGenerator:
                 lang='ko',
                 slow=False
             )
-            tts.save(output_path)
+            target = self._compressed_target(output_path)
+            tts.save(target)
+            self._finish_compressed(target, output_path)
             
             logger.info(f"gTTS 생성 완료: {output_path}")
             return True
@@ -153,33 +668,81 @@ class TTSGenerator:
             logger.error(f"gTTS 실패: {e}")
             return False
     
-    def generate_with_timing(self, script_segments: list, output_dir: str) -> list:
+    def start_stream(self, output_path: str, provider: Optional[str] = None) -> StreamingTTSSession:
         """
-        스크립트 세그먼트별로 음성 생성하고 타이밍 정보 반환
+        문장 단위 스트리밍 합성 세션 시작
         
         Args:
-            script_segments: [{"text": "문장1", "start": 0}, ...]
-            output_dir: 출력 디렉토리
+            output_path: 최종 오디오 저장 경로
+            provider: TTS 제공자 (None이면 기본 설정 사용)
         
         Returns:
-            타이밍 정보가 포함된 오디오 파일 리스트
+            feed(문장)로 문장을 넣고 finish()로 완료하는 세션
+        """
+        return StreamingTTSSession(self, output_path, provider)
+    
+    def generate_with_timing(
+        self,
+        script_segments: list,
+        output_dir: str,
+        output_path: Optional[str] = None,
+        provider: Optional[str] = None
+    ) -> list:
+        """
+        스크립트 세그먼트별로 음성을 동시에 생성하고 실제 타이밍 정보 반환
+        
+        세그먼트는 최대 max_workers개씩 동시에 합성되며, 각 세그먼트의 start는
+        앞선 세그먼트들의 실제 재생 시간을 누적한 오프셋(초)입니다. 세그먼트가 길어
+        generate_audio가 조각 단위로 다시 나누더라도 제공자 요청은 _request_slots로
+        전체 max_workers개까지만 동시에 실행됩니다.
+        
+        Args:
+            script_segments: [{"text": "문장1"}, ...]
+            output_dir: 세그먼트 오디오 출력 디렉토리
+            output_path: 지정하면 세그먼트를 순서대로 이어 붙인 전체 나레이션 저장
+            provider: TTS 제공자 (None이면 기본 설정 사용)
+        
+        Returns:
+            [{"file", "text", "start", "end", "duration", "index"}, ...] (합성 실패 세그먼트 제외)
         """
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
+        def _synthesize_segment(indexed_segment):
+            i, segment = indexed_segment
+            segment_path = os.path.join(output_dir, f"segment_{i:03d}.{self.audio_format}")
+            if not self.generate_audio(segment['text'], segment_path, provider):
+                return None
+            return {
+                'file': segment_path,
+                'text': segment['text'],
+                'duration': get_audio_duration(segment_path),
+                'index': i
+            }
+        
+        # map은 입력 순서대로 결과를 반환하므로 오프셋을 순서대로 누적할 수 있음
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(script_segments))),
+            thread_name_prefix='tts'
+        ) as executor:
+            results = list(executor.map(_synthesize_segment, enumerate(script_segments)))
+        
         audio_files = []
+        offset = 0.0
+        for i, result in enumerate(results):
+            if result is None:
+                logger.warning(f"세그먼트 {i} 합성 실패, 제외")
+                continue
+            result['start'] = round(offset, 3)
+            offset += result['duration']
+            result['end'] = round(offset, 3)
+            audio_files.append(result)
         
-        for i, segment in enumerate(script_segments):
-            output_path = os.path.join(output_dir, f"segment_{i:03d}.mp3")
-            
-            if self.generate_audio(segment['text'], output_path):
-                audio_files.append({
-                    'file': output_path,
-                    'text': segment['text'],
-                    'start': segment.get('start', i),
-                    'index': i
-                })
+        logger.info(f"{len(audio_files)}개 오디오 세그먼트 생성 완료 (총 {offset:.1f}초)")
+        
+        if output_path and audio_files:
+            if not self.join_parts([(a['file'], a['text']) for a in audio_files], output_path):
+                logger.error(f"나레이션 합치기 실패: {output_path}")
         
-        logger.info(f"{len(audio_files)}개 오디오 세그먼트 생성 완료")
         return audio_files
 
 
@@ -0,0 +1,156 @@
+"""
+공유 HTTP 클라이언트 모듈 - keep-alive 연결 풀, 재시도/백오프, 호스트별 동시 요청 제한
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import requests
+import yaml
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """
+    프로세스 전체가 공유하는 HTTP 세션
+    
+    같은 호스트에 대한 연결을 재사용하므로 TLS 핸드셰이크는 실행당 호스트마다
+    한 번만 일어납니다. 일시적 오류(429, 5xx, 연결 실패)는 지수 백오프로 재시도합니다.
+    """
+    
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_per_host: int = 4,
+        connect_timeout: float = 5,
+        read_timeout: float = 30,
+        retries: int = 3,
+        backoff: float = 0.5,
+        headers: Optional[Dict] = None
+    ):
+        """
+        Args:
+            pool_size: 호스트당 유지할 최대 연결 수
+            max_per_host: 호스트당 동시 요청 수 제한
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+            retries: 최대 재시도 횟수
+            backoff: 재시도 백오프 계수 (backoff * 2^(n-1)초 대기)
+            headers: 기본 요청 헤더
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_per_host = max_per_host
+        
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+        
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+    
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 요청 세마포어"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        요청 전송 (호스트별 동시 요청 제한 적용)
+        
+        stream=True 응답은 본문을 읽는 동안 슬롯을 잡지 않으므로, 스트리밍 저장은
+        download()를 사용하세요.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        with self._slot(url):
+            return self.session.request(method, url, **kwargs)
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.request('GET', url, **kwargs)
+    
+    def get_content(self, url: str, **kwargs) -> bytes:
+        """GET 요청 후 본문 반환 (HTTP 오류는 예외)"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.content
+    
+    def download(self, url: str, output_path: str, chunk_size: int = 1 << 16, **kwargs) -> Path:
+        """
+        파일을 메모리에 올리지 않고 디스크로 스트리밍 저장
+        
+        임시 파일에 받은 뒤 교체하므로 중간에 실패해도 불완전한 파일이 남지 않습니다.
+        
+        Returns:
+            저장된 파일 경로
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + '.part')
+        
+        kwargs.setdefault('timeout', self.timeout)
+        with self._slot(url):
+            with self.session.get(url, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+        
+        os.replace(tmp_path, output_path)
+        return output_path
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client(config_path: str = 'config/config.yaml') -> HttpClient:
+    """
+    공유 HTTP 클라이언트 반환 (첫 호출 시 config의 http 설정으로 생성)
+    
+    Args:
+        config_path: 설정 파일 경로 (최초 생성 시에만 사용)
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            http_config = {}
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    http_config = (yaml.safe_load(f) or {}).get('http', {})
+            except Exception as e:
+                logger.warning(f"HTTP 설정 로드 실패, 기본값 사용: {e}")
+            
+            _client = HttpClient(
+                pool_size=http_config.get('pool_size', 10),
+                max_per_host=http_config.get('max_per_host', 4),
+                connect_timeout=http_config.get('connect_timeout', 5),
+                read_timeout=http_config.get('read_timeout', 30),
+                retries=http_config.get('retries', 3),
+                backoff=http_config.get('backoff', 0.5),
+                headers=http_config.get('headers')
+            )
+        return _client
@@ -0,0 +1,93 @@
+"""
+다중 키워드 매칭 모듈 - 키워드 목록을 트라이 기반 정규식 하나로 컴파일
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번의 텍스트 스캔으로 찾는 매처
+    
+    키워드 목록을 트라이로 묶어 공통 접두사를 공유하는 정규식 하나로 컴파일하므로,
+    키워드 수가 늘어나도 위치마다 모든 키워드를 하나씩 비교하지 않습니다.
+    정규식으로 키워드가 시작하는 위치만 찾은 뒤 그 위치에서 트라이를 따라 내려가며
+    지나는 모든 키워드를 보고하므로, 같은 위치에서 시작하는 짧은 키워드도 빠지지 않습니다
+    (예: '금리인상'과 '금리').
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: 키워드 목록 (등록 순서가 first_match 우선순위)
+        """
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+        self._priority = {keyword: i for i, keyword in enumerate(self.keywords)}
+        
+        self._trie = self._build_trie(self.keywords)
+        pattern = self._build_pattern(self._trie)
+        # 전방 탐색으로 감싸서 겹치는 매칭도 모두 찾음 (예: '주식시장' 안의 '시장')
+        self._regex = re.compile(f'(?=({pattern}))') if pattern else None
+    
+    @staticmethod
+    def _build_trie(keywords: List[str]) -> Dict:
+        """키워드 트라이 (키워드가 끝나는 노드는 '' 키에 키워드 저장)"""
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = keyword  # 키워드 끝 표시
+        return trie
+    
+    @staticmethod
+    def _build_pattern(trie: Dict) -> str:
+        """키워드 트라이를 정규식 문자열로 변환"""
+        def build(node: Dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+            if not branches:
+                return ''
+            
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if '' in node:
+                # 여기서 끝나는 키워드가 있으면 나머지는 선택 (탐욕적이라 긴 키워드 우선)
+                body = '(?:' + body + ')?'
+            return body
+        
+        return build(trie)
+    
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        텍스트에서 모든 키워드 위치 찾기
+        
+        Returns:
+            [(키워드, 시작, 끝), ...] 텍스트 등장 순서 (같은 위치는 짧은 키워드부터)
+        """
+        if not self._regex or not text:
+            return []
+        
+        matches = []
+        for m in self._regex.finditer(text):
+            start = m.start(1)
+            node = self._trie
+            # 정규식이 찾은 가장 긴 키워드까지 트라이를 따라가며 끝나는 키워드를 모두 기록
+            for end in range(start, m.end(1)):
+                node = node[text[end]]
+                if '' in node:
+                    matches.append((node[''], start, end + 1))
+        return matches
+    
+    def matched_keywords(self, text: str) -> List[str]:
+        """텍스트에 등장한 키워드 목록 (중복 제거, 등장 순서)"""
+        return list(dict.fromkeys(keyword for keyword, _, _ in self.find_all(text)))
+    
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있는지 여부"""
+        return bool(self._regex and text and self._regex.search(text))
+    
+    def first_match(self, text: str) -> Optional[str]:
+        """등장한 키워드 중 등록 순서가 가장 빠른 키워드 (없으면 None)"""
+        matched = self.matched_keywords(text)
+        if not matched:
+            return None
+        return min(matched, key=self._priority.__getitem__)
@@ -0,0 +1,86 @@
+"""
+요청 속도 제한 모듈 - 호스트별 요청 간격, 토큰 버킷 처리량 제한
+"""
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """같은 호스트에 대한 요청 사이에 최소 간격을 보장하는 스레드 안전 리미터"""
+    
+    def __init__(self, min_interval: float = 1.0):
+        """
+        Args:
+            min_interval: 같은 호스트에 대한 요청 사이 최소 간격 (초)
+        """
+        self.min_interval = min_interval
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, url: str) -> float:
+        """
+        해당 URL의 호스트에 요청 가능할 때까지 대기
+        
+        Args:
+            url: 요청할 URL
+        
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        host = urlparse(url).netloc
+        
+        # 슬롯 예약은 락 안에서, 대기는 락 밖에서 수행 (다른 호스트는 막지 않음)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식 처리량 제한 (스레드 안전)
+    
+    API의 분당 토큰 한도처럼 "양"을 제한할 때 사용합니다.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        """
+        Args:
+            rate_per_minute: 분당 보충되는 토큰 수
+            capacity: 버킷 최대 용량 (기본: rate_per_minute, 즉 1분치 버스트 허용)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, amount: float) -> float:
+        """
+        토큰을 확보할 때까지 대기
+        
+        용량보다 큰 요청은 용량만큼만 소모합니다 (영원히 대기하지 않도록).
+        
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        
+        # 토큰은 먼저 차감(음수 허용)하고 부족분만큼 락 밖에서 대기 - 요청 순서대로 처리
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,92 @@
+"""
+문장 분할 모듈 - 완성된 텍스트와 스트리밍 텍스트 모두 같은 규칙으로 분할
+"""
+import re
+from typing import List
+
+
+# 문장 부호 뒤 공백 또는 줄바꿈에서 분할 (3.5%처럼 숫자 사이의 마침표는 유지)
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?。…])\s+|\n+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 리스트로 분할"""
+    return [s.strip() for s in SENTENCE_BOUNDARY_PATTERN.split(text) if s.strip()]
+
+
+class SentenceSplitter:
+    """
+    조각으로 도착하는 텍스트에서 완성된 문장만 꺼내는 증분 분할기
+    
+    마지막 조각은 문장이 아직 끝나지 않았을 수 있으므로 다음 입력까지 보관하고,
+    flush()에서 남은 텍스트를 마지막 문장으로 반환합니다.
+    """
+    
+    def __init__(self):
+        self._buffer = ''
+    
+    def feed(self, text: str) -> List[str]:
+        """텍스트 조각을 추가하고 완성된 문장 반환"""
+        if not text:
+            return []
+        
+        self._buffer += text
+        parts = SENTENCE_BOUNDARY_PATTERN.split(self._buffer)
+        self._buffer = parts.pop()
+        return [p.strip() for p in parts if p.strip()]
+    
+    def flush(self) -> List[str]:
+        """남은 텍스트를 마지막 문장으로 반환"""
+        rest = self._buffer.strip()
+        self._buffer = ''
+        return [rest] if rest else []
+
+
+def _split_oversized(sentence: str, max_bytes: int) -> List[str]:
+    """한도를 넘는 문장을 쉼표/공백 위치에서 나눔 (구분자가 없으면 글자 단위)"""
+    pieces = []
+    current = ''
+    for token in re.split(r'(?<=[,，])\s*|\s+', sentence):
+        if not token:
+            continue
+        candidate = f"{current} {token}".strip()
+        if len(candidate.encode('utf-8')) <= max_bytes:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        # 토큰 하나가 한도를 넘으면 글자 단위로 자름
+        while len(token.encode('utf-8')) > max_bytes:
+            cut = len(token.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore'))
+            pieces.append(token[:cut])
+            token = token[cut:]
+        current = token
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def pack_sentences(sentences: List[str], max_bytes: int, merge: bool = True) -> List[str]:
+    """
+    문장들을 UTF-8 max_bytes 이하의 조각으로 묶음 (문장 경계 우선)
+    
+    Args:
+        sentences: 문장 리스트
+        max_bytes: 조각당 최대 바이트 수
+        merge: False면 문장을 합치지 않고 한도를 넘는 문장만 나눔
+    """
+    chunks = []
+    current = ''
+    for sentence in sentences:
+        parts = [sentence] if len(sentence.encode('utf-8')) <= max_bytes else _split_oversized(sentence, max_bytes)
+        for part in parts:
+            candidate = f"{current} {part}".strip()
+            if merge and len(candidate.encode('utf-8')) <= max_bytes:
+                current = candidate
+                continue
+            if current:
+                chunks.append(current)
+            current = part
+    if current:
+        chunks.append(current)
+    return chunks
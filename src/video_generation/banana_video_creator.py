@@ -16,9 +16,28 @@ import yaml
 from loguru import logger
 from openai import OpenAI
 from PIL import Image
-import requests
 from io import BytesIO
 
+from src.tts.timing import load_timing
+from src.utils.http_client import get_http_client
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+# 장면 키워드 → 이미지 프롬프트 (등록 순서가 우선순위)
+SCENE_KEYWORDS = {
+    '비트코인': 'Bitcoin cryptocurrency chart',
+    '주식': 'stock market trading floor',
+    '경제': 'modern financial district',
+    '투자': 'investment portfolio dashboard',
+    '급등': 'rising green chart arrow',
+    '급락': 'falling red chart',
+    '환율': 'currency exchange rates',
+    '금리': 'interest rate graph',
+    '시장': 'bustling stock exchange',
+    '기업': 'modern office building',
+}
+SCENE_MATCHER = KeywordMatcher(SCENE_KEYWORDS)
+
 
 class BananaVideoCreator:
     """Banana 스타일 비디오 생성기 - 완전 자동화"""
@@ -39,6 +58,9 @@ class BananaVideoCreator:
         else:
             self.openai_client = None
         
+        # 생성 이미지 다운로드용 공유 HTTP 세션
+        self.http = get_http_client(config_path)
+        
         # 해상도 설정
         width, height = map(int, self.video_config['resolution'].split('x'))
         self.width = width
@@ -101,7 +123,7 @@ class BananaVideoCreator:
             
             # 5. 자막 추가
             logger.info("📝 자막 생성 중...")
-            subtitles = self._create_subtitles(script_text, video.duration)
+            subtitles = self._create_subtitles(script_text, video.duration, load_timing(audio_path))
             
             # 6. 합성
             final_clips = [video] + subtitles
@@ -192,24 +214,10 @@ class BananaVideoCreator:
         Returns:
             이미지 생성 프롬프트
         """
-        # 키워드 추출 (간단한 버전)
-        keywords = {
-            '비트코인': 'Bitcoin cryptocurrency chart',
-            '주식': 'stock market trading floor',
-            '경제': 'modern financial district',
-            '투자': 'investment portfolio dashboard',
-            '급등': 'rising green chart arrow',
-            '급락': 'falling red chart',
-            '환율': 'currency exchange rates',
-            '금리': 'interest rate graph',
-            '시장': 'bustling stock exchange',
-            '기업': 'modern office building',
-        }
-        
-        # 키워드 매칭
-        for keyword, description in keywords.items():
-            if keyword in text:
-                return description
+        # 키워드 매칭 (한 번의 스캔으로 우선순위가 가장 높은 키워드 선택)
+        keyword = SCENE_MATCHER.first_match(text)
+        if keyword:
+            return SCENE_KEYWORDS[keyword]
         
         # 기본 설명
         return 'professional business background with financial elements'
@@ -261,8 +269,7 @@ class BananaVideoCreator:
             
             # 이미지 다운로드
             image_url = response.data[0].url
-            img_response = requests.get(image_url)
-            img = Image.open(BytesIO(img_response.content))
+            img = Image.open(BytesIO(self.http.get_content(image_url)))
             
             # 임시 저장
             temp_dir = Path('data/temp/ai_images')
@@ -323,8 +330,8 @@ class BananaVideoCreator:
         
         return clip.resize(lambda t: zoom(t))
     
-    def _create_subtitles(self, text: str, duration: float) -> List[TextClip]:
-        """자막 생성 (단어 단위 애니메이션)"""
+    def _create_subtitles(self, text: str, duration: float, timing: Optional[Dict] = None) -> List[TextClip]:
+        """자막 생성 (단어 단위 애니메이션, 타이밍 사이드카가 있으면 실제 발화 시각 사용)"""
         subtitles = []
         words = text.split()
         
@@ -335,14 +342,21 @@ class BananaVideoCreator:
         words_per_second = self.subtitle_config['timing'].get('words_per_second', 3)
         word_duration = 1.0 / words_per_second
         
+        if timing and timing.get('sentences'):
+            spans = [
+                (w['text'], w['start'], w['end'] - w['start'])
+                for sentence in timing['sentences'] for w in sentence['words']
+            ]
+        else:
+            spans = [(word, i * word_duration, word_duration * 1.5) for i, word in enumerate(words)]
+        
         # 자막 스타일
         font = self.subtitle_config.get('font', 'Arial-Bold')
         fontsize = self.subtitle_config.get('font_size', 60)
         color = self.subtitle_config.get('font_color', 'white')
         
-        current_time = 0
-        for i, word in enumerate(words):
-            if current_time >= duration:
+        for word, start_time, word_length in spans:
+            if start_time >= duration:
                 break
             
             # 텍스트 클립 생성
@@ -353,10 +367,9 @@ class BananaVideoCreator:
                 color=color,
                 stroke_color=self.subtitle_config.get('outline_color', 'black'),
                 stroke_width=self.subtitle_config.get('outline_width', 3)
-            ).set_position('center').set_start(current_time).set_duration(word_duration * 1.5)
+            ).set_position('center').set_start(start_time).set_duration(max(word_length, 0.1))
             
             subtitles.append(txt_clip)
-            current_time += word_duration
         
         return subtitles
     
@@ -425,8 +438,7 @@ class BananaVideoCreator:
             
             # 이미지 다운로드 및 저장
             image_url = response.data[0].url
-            img_response = requests.get(image_url)
-            img = Image.open(BytesIO(img_response.content))
+            img = Image.open(BytesIO(self.http.get_content(image_url)))
             
             # 썸네일 크기 조정 (YouTube 권장 크기)
             thumb_width = self.video_config['thumbnail']['width']
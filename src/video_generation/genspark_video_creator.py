@@ -16,6 +16,24 @@ from moviepy.video.fx.all import resize, fadein, fadeout
 import yaml
 from loguru import logger
 
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+# 장면 키워드 → 이미지 프롬프트 (등록 순서가 우선순위)
+SCENE_KEYWORDS = {
+    '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow',
+    '주식': 'stock market trading floor with digital screens',
+    '경제': 'modern financial district skyline at sunset',
+    '투자': 'investment portfolio dashboard with graphs',
+    '급등': 'dramatic rising green chart with upward arrow',
+    '급락': 'falling red chart with downward trend',
+    '환율': 'currency exchange rates display board',
+    '금리': 'interest rate graph trending upward',
+    '시장': 'bustling stock exchange trading floor',
+    '기업': 'modern corporate office building exterior',
+}
+SCENE_MATCHER = KeywordMatcher(SCENE_KEYWORDS)
+
 
 class GenSparkVideoCreator:
     """GenSpark AI 기반 비디오 생성기 - 완전 무료!"""
@@ -163,22 +181,9 @@ class GenSparkVideoCreator:
     
     def _generate_scene_description(self, text: str) -> str:
         """텍스트에서 이미지 생성 프롬프트 추출"""
-        keywords = {
-            '비트코인': 'Bitcoin cryptocurrency chart with rising green arrow',
-            '주식': 'stock market trading floor with digital screens',
-            '경제': 'modern financial district skyline at sunset',
-            '투자': 'investment portfolio dashboard with graphs',
-            '급등': 'dramatic rising green chart with upward arrow',
-            '급락': 'falling red chart with downward trend',
-            '환율': 'currency exchange rates display board',
-            '금리': 'interest rate graph trending upward',
-            '시장': 'bustling stock exchange trading floor',
-            '기업': 'modern corporate office building exterior',
-        }
-        
-        for keyword, description in keywords.items():
-            if keyword in text:
-                return description
+        keyword = SCENE_MATCHER.first_match(text)
+        if keyword:
+            return SCENE_KEYWORDS[keyword]
         
         return 'professional business background with financial charts and graphs'
     
@@ -2,6 +2,7 @@
 효과음 및 배경음악 관리 모듈
 """
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 import yaml
@@ -182,8 +183,8 @@ class SoundEffectManager:
                     'volume': sfx_config['volume']
                 }
         
-        # 3. 파일이 없으면 생성 (AI 또는 간단한 톤)
-        effect_file = self.sfx_library / f'{effect_name}.mp3'
+        # 3. 파일이 없으면 생성 (AI 또는 간단한 톤, 믹싱 전까지 무손실 WAV로 보관)
+        effect_file = self.sfx_library / f'{effect_name}.wav'
         logger.warning(f"효과음 '{effect_name}'을 찾을 수 없음. 생성 시도...")
         self._generate_sound_effect(effect_name, effect_file)
         
@@ -264,38 +265,23 @@ class SoundEffectManager:
             audio[:fade_samples] *= np.linspace(0, 1, fade_samples)
             audio[-fade_samples:] *= np.linspace(1, 0, fade_samples)
             
-            # 정규화
+            # 정규화 후 WAV로 저장 (믹싱 단계에서 바로 PCM으로 읽으므로 MP3 변환 생략)
             audio = (audio * 32767).astype(np.int16)
+            wavfile.write(str(output_path.with_suffix('.wav')), sample_rate, audio)
             
-            # WAV로 저장
-            wav_path = output_path.with_suffix('.wav')
-            wavfile.write(str(wav_path), sample_rate, audio)
-            
-            # MP3로 변환 (ffmpeg 필요)
-            try:
-                import subprocess
-                subprocess.run([
-                    'ffmpeg', '-i', str(wav_path), '-y',
-                    '-acodec', 'libmp3lame', '-b:a', '128k',
-                    str(output_path)
-                ], check=True, capture_output=True)
-                wav_path.unlink()  # WAV 파일 삭제
-            except:
-                # ffmpeg 실패 시 WAV 파일 유지
-                logger.warning(f"MP3 변환 실패, WAV 파일 사용: {wav_path}")
-            
-            logger.info(f"테스트 효과음 생성: {output_path}")
+            logger.info(f"테스트 효과음 생성: {output_path.with_suffix('.wav')}")
             
         except Exception as e:
             logger.error(f"톤 생성 실패: {e}")
     
-    def get_script_sfx_timings(self, script: str, duration: float) -> List[Dict]:
+    def get_script_sfx_timings(self, script: str, duration: float, timing: Optional[Dict] = None) -> List[Dict]:
         """
         스크립트 분석하여 효과음 타이밍 자동 결정
         
         Args:
             script: 스크립트 텍스트
             duration: 비디오 길이
+            timing: TTS 타이밍 사이드카 (있으면 핵심 포인트/CTA를 해당 문장 시작 시각에 배치)
         
         Returns:
             효과음 리스트 [{'effect': 이름, 'timing': 시점}]
@@ -304,6 +290,14 @@ class SoundEffectManager:
         timing_config = sfx_config.get('timing', {})
         
         sfx_list = []
+        sentences = timing.get('sentences', []) if timing else []
+        
+        def sentence_start(pattern: str) -> Optional[float]:
+            """패턴이 처음 나오는 문장의 시작 시각 (사이드카가 없거나 못 찾으면 None)"""
+            for sentence in sentences:
+                if re.search(pattern, sentence['text']):
+                    return sentence['start']
+            return None
         
         # 인트로 효과음
         if timing_config.get('intro', {}).get('enabled', True):
@@ -324,11 +318,13 @@ class SoundEffectManager:
         # 핵심 포인트 (중간 지점들)
         if timing_config.get('key_point', {}).get('enabled', True):
             # 스크립트에서 숫자나 강조 표현 찾기
-            import re
-            numbers = re.findall(r'\d+(?:\.\d+)?[%원만억조]', script)
+            number_pattern = r'\d+(?:\.\d+)?[%원만억조]'
+            numbers = re.findall(number_pattern, script)
             if numbers:
-                # 중간 지점에 효과음 배치
-                mid_timing = duration * 0.4
+                # 숫자가 처음 나오는 문장 시작 (사이드카가 없으면 중간 지점)
+                mid_timing = sentence_start(number_pattern)
+                if mid_timing is None:
+                    mid_timing = duration * 0.4
                 sfx_list.append({
                     'effect': timing_config['key_point']['sound'],
                     'timing': mid_timing,
@@ -354,9 +350,10 @@ class SoundEffectManager:
         # CTA (90% 지점)
         if timing_config.get('cta', {}).get('enabled', True):
             if '구독' in script or '좋아요' in script:
+                cta_timing = sentence_start('구독|좋아요')
                 sfx_list.append({
                     'effect': timing_config['cta']['sound'],
-                    'timing': duration * 0.9,
+                    'timing': duration * 0.9 if cta_timing is None else cta_timing,
                     'category': 'cta'
                 })
         
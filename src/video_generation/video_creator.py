@@ -9,11 +9,15 @@ from moviepy.editor import (
     VideoFileClip, ImageClip, AudioFileClip, TextClip,
     CompositeVideoClip, concatenate_videoclips, ColorClip
 )
+from moviepy.audio.AudioClip import AudioArrayClip
 from moviepy.video.fx.all import resize, fadein, fadeout
 from PIL import Image, ImageDraw, ImageFont
 import yaml
 from loguru import logger
 
+from src.tts.audio_utils import get_audio_duration, read_audio_array
+from src.tts.timing import load_timing
+
 
 class VideoCreator:
     """유튜브 Shorts 비디오 생성기"""
@@ -31,6 +35,9 @@ class VideoCreator:
         self.width = width
         self.height = height
         self.fps = self.video_config['fps']
+        
+        # 믹싱용 PCM 샘플레이트 (최종 AAC 인코딩도 이 값으로 한 번만 수행)
+        self.audio_sample_rate = self.video_config.get('audio', {}).get('sample_rate', 44100)
     
     def create_shorts_video(
         self,
@@ -60,9 +67,11 @@ class VideoCreator:
             성공 여부
         """
         try:
-            # 1. 오디오 로드 (나레이션)
-            narration = AudioFileClip(audio_path)
-            duration = narration.duration
+            # 1. 나레이션 길이 (디코딩은 믹싱 단계에서 한 번만)
+            duration = get_audio_duration(audio_path)
+            
+            # TTS 타이밍 사이드카 (없으면 자막/효과음을 길이 비율로 배치)
+            timing = load_timing(audio_path)
             
             logger.info(f"비디오 생성 시작 (길이: {duration:.2f}초)")
             
@@ -70,7 +79,7 @@ class VideoCreator:
             background = self._create_background(duration, background_type)
             
             # 3. 자막 생성
-            subtitles = self._create_subtitles(script_text, duration)
+            subtitles = self._create_subtitles(script_text, duration, timing)
             
             # 4. 제목 추가 (선택)
             clips = [background]
@@ -98,10 +107,11 @@ class VideoCreator:
             
             # 9. 오디오 믹싱 (나레이션 + 배경음악 + 효과음)
             final_audio = self._mix_audio(
-                narration, 
+                audio_path, 
                 duration, 
                 script_text, 
-                add_sound_effects
+                add_sound_effects,
+                timing
             )
             
             final_video = final_video.set_audio(final_audio)
@@ -115,6 +125,7 @@ class VideoCreator:
                 fps=self.fps,
                 codec=self.video_config['codec'],
                 audio_codec=self.video_config['audio_codec'],
+                audio_fps=self.audio_sample_rate,
                 threads=4,
                 preset='medium'
             )
@@ -128,60 +139,68 @@ class VideoCreator:
     
     def _mix_audio(
         self,
-        narration: AudioFileClip,
+        narration_path: str,
         duration: float,
         script_text: str,
-        add_sfx: bool = True
-    ) -> AudioFileClip:
+        add_sfx: bool = True,
+        timing: Optional[Dict] = None
+    ):
         """
         나레이션, 배경음악, 효과음 믹싱
         
+        모든 트랙을 float32 PCM 배열로 읽어 NumPy로 더하므로, 효과음마다 디코더를
+        띄우지 않고 인코딩은 비디오 출력 시 한 번만 일어납니다.
+        
         Args:
-            narration: 나레이션 오디오
+            narration_path: 나레이션 오디오 경로
             duration: 비디오 길이
             script_text: 스크립트 (효과음 타이밍 판단용)
             add_sfx: 효과음 추가 여부
+            timing: TTS 타이밍 사이드카 (효과음을 실제 문장 시작 시각에 배치)
         
         Returns:
-            믹싱된 최종 오디오
+            믹싱된 최종 오디오 클립
         """
         try:
             from src.video_generation.sound_effects import SoundEffectManager
-            from moviepy.editor import CompositeAudioClip
             
-            audio_clips = [narration]
+            sample_rate = self.audio_sample_rate
+            total = int(round(duration * sample_rate))
+            
+            mix = np.zeros((total, 2), dtype=np.float32)
+            narration = read_audio_array(narration_path, sample_rate)[:total]
+            mix[:len(narration)] += narration
             
             if not add_sfx:
-                return narration
+                return AudioArrayClip(mix, fps=sample_rate)
             
             sfx_manager = SoundEffectManager()
             
             # 1. 배경음악 추가
             bgm_path = sfx_manager.get_background_music(duration)
             if bgm_path and os.path.exists(bgm_path):
-                bgm = AudioFileClip(bgm_path)
-                
-                # 길이 조정
-                if bgm.duration < duration:
-                    # 루프
-                    bgm = bgm.audio_loop(duration=duration)
-                elif bgm.duration > duration:
-                    # 자르기
-                    bgm = bgm.subclip(0, duration)
+                bgm = read_audio_array(bgm_path, sample_rate)
                 
-                # 볼륨 조정
-                bgm_config = self.video_config['audio']['background_music']
-                bgm = bgm.volumex(bgm_config['volume'])
-                
-                # 페이드 인/아웃
-                bgm = bgm.audio_fadein(bgm_config['fade_in'])
-                bgm = bgm.audio_fadeout(bgm_config['fade_out'])
-                
-                audio_clips.append(bgm)
-                logger.info("배경음악 추가 완료")
+                if len(bgm):
+                    # 길이 조정 (짧으면 루프, 길면 자르기)
+                    bgm = np.tile(bgm, (-(-total // len(bgm)), 1))[:total]
+                    
+                    # 볼륨 + 페이드 인/아웃
+                    bgm_config = self.video_config['audio']['background_music']
+                    envelope = np.full(total, bgm_config['volume'], dtype=np.float32)
+                    fade_in = min(total, int(bgm_config['fade_in'] * sample_rate))
+                    fade_out = min(total, int(bgm_config['fade_out'] * sample_rate))
+                    if fade_in:
+                        envelope[:fade_in] *= np.linspace(0, 1, fade_in)
+                    if fade_out:
+                        envelope[total - fade_out:] *= np.linspace(1, 0, fade_out)
+                    
+                    mix += bgm * envelope[:, None]
+                    logger.info("배경음악 추가 완료")
             
             # 2. 효과음 추가
-            sfx_timings = sfx_manager.get_script_sfx_timings(script_text, duration)
+            sfx_timings = sfx_manager.get_script_sfx_timings(script_text, duration, timing)
+            sfx_cache = {}
             
             for sfx_info in sfx_timings:
                 sfx = sfx_manager.get_sound_effect(
@@ -191,20 +210,19 @@ class VideoCreator:
                 )
                 
                 if sfx and os.path.exists(sfx['path']):
-                    sfx_clip = AudioFileClip(sfx['path'])
-                    sfx_clip = sfx_clip.volumex(sfx['volume'])
-                    sfx_clip = sfx_clip.set_start(sfx['timing'])
-                    audio_clips.append(sfx_clip)
-            
-            if len(audio_clips) > 1:
-                logger.info(f"오디오 믹싱: 나레이션 + BGM + {len(sfx_timings)}개 효과음")
-                return CompositeAudioClip(audio_clips)
-            else:
-                return narration
+                    if sfx['path'] not in sfx_cache:
+                        sfx_cache[sfx['path']] = read_audio_array(sfx['path'], sample_rate)
+                    
+                    start = int(sfx['timing'] * sample_rate)
+                    clip = sfx_cache[sfx['path']][:max(0, total - start)]
+                    mix[start:start + len(clip)] += clip * sfx['volume']
+            
+            logger.info(f"오디오 믹싱: 나레이션 + BGM + {len(sfx_timings)}개 효과음")
+            return AudioArrayClip(np.clip(mix, -1.0, 1.0), fps=sample_rate)
                 
         except Exception as e:
             logger.error(f"오디오 믹싱 실패: {e}, 나레이션만 사용")
-            return narration
+            return AudioFileClip(narration_path)
     
     def _create_background(self, duration: float, bg_type: str = 'gradient') -> ColorClip:
         """배경 생성"""
@@ -224,24 +242,29 @@ class VideoCreator:
         
         return bg
     
-    def _create_subtitles(self, text: str, duration: float) -> List[TextClip]:
-        """자막 생성 (단어별 애니메이션)"""
+    def _create_subtitles(self, text: str, duration: float, timing: Optional[Dict] = None) -> List[TextClip]:
+        """자막 생성 (타이밍 사이드카가 있으면 실제 발화 시각에 맞춤)"""
         subtitles = []
         
-        # 문장 분할
-        sentences = text.split('.')
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        # 각 문장의 표시 시간 계산
-        time_per_sentence = duration / len(sentences) if sentences else duration
+        if timing and timing.get('sentences'):
+            spans = [
+                (s['text'], s['start'], min(s['end'], duration))
+                for s in timing['sentences'] if s['start'] < duration
+            ]
+        else:
+            # 문장 분할 후 길이를 균등 분배
+            sentences = text.split('.')
+            sentences = [s.strip() for s in sentences if s.strip()]
+            time_per_sentence = duration / len(sentences) if sentences else duration
+            spans = [
+                (sentence, i * time_per_sentence, (i + 1) * time_per_sentence)
+                for i, sentence in enumerate(sentences)
+            ]
         
-        for i, sentence in enumerate(sentences):
-            if not sentence:
+        for sentence, start_time, end_time in spans:
+            if not sentence or end_time <= start_time:
                 continue
             
-            start_time = i * time_per_sentence
-            end_time = start_time + time_per_sentence
-            
             # 텍스트 클립 생성
             txt_clip = TextClip(
                 sentence,